@@ -1,6 +1,41 @@
+'''
+Hardware, the dataflow & performance predictor, DSE, caches & traces need only NumPy, and are imported here.
+The Keras layers & the export (xbundle, xmodel, xlayers) import TensorFlow & QKeras: they are loaded the first time
+one of their names is looked up on this package, or by `from deepsocflow import *`.
+'''
+import importlib
+
 from deepsocflow.py.utils import *
 from deepsocflow.py.dataflow import *
-from deepsocflow.py.xbundle import *
-from deepsocflow.py.xmodel import *
-from deepsocflow.py.xlayers import *
-from deepsocflow.py.hardware import *
\ No newline at end of file
+from deepsocflow.py.golden import *
+from deepsocflow.py.dse import *
+from deepsocflow.py.cache import *
+from deepsocflow.py.cycles import *
+from deepsocflow.py.calibrate import *
+from deepsocflow.py.arena import *
+from deepsocflow.py.hardware import *
+from deepsocflow.py.sweep import *
+
+_KERAS_MODULES = ['deepsocflow.py.xbundle', 'deepsocflow.py.xmodel', 'deepsocflow.py.xlayers']
+
+_KERAS_EXPORTS = {  # name -> module: looking any other name up raises AttributeError, without importing TF
+    **dict.fromkeys(['XBundle'], 'deepsocflow.py.xbundle'),
+    **dict.fromkeys(['XInputAct', 'XModel', 'get_bundles', 'get_graph', 'Golden', 'GOLDEN', 'GOLDEN_LOCK', 'golden_forward',
+                     'golden_inference', 'bundle_layers', 'golden_state', 'restore_golden', 'get_golden', 'export_inference',
+                     'export_graph', 'Mismatch', 'save_bundle_vectors', 'write_xe', 'compare_vector', 'mismatch_nhwc', 'verify_inference',
+                     'verify_graph'], 'deepsocflow.py.xmodel'),
+    **dict.fromkeys(['XActivation', 'XConvBN', 'XDense', 'XAdd', 'XPool'], 'deepsocflow.py.xlayers'),
+}
+
+
+def __getattr__(name):
+    if name == '__all__':  # star import: same names as importing every module eagerly
+        modules = [importlib.import_module(m) for m in _KERAS_MODULES]
+        names = [k for k in globals() if not k.startswith('_')]
+        names += [k for m in modules for k in vars(m) if not k.startswith('_')]
+        return list(dict.fromkeys(names))
+
+    if name not in _KERAS_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = getattr(importlib.import_module(_KERAS_EXPORTS[name]), name)
+    return globals()[name]
@@ -23,10 +23,10 @@ static inline void flush_cache(void *addr, uint32_t bytes) {
 static inline void hardware_setup(){
   init_platform();
 
-  // ---Disable cache for shared memory: out_buffers & ocm
-  // int out_buf_bytes = N_OUT_BUF*O_BYTES_MAX;
+  // ---Disable cache for shared memory: arena & ocm
+  // int out_buf_bytes = ARENA_BYTES;
   // int out_buf_mb = out_buf_bytes/(1024*1024) + 1;
-  // UINTPTR out_start = (UINTPTR)&out_buffers;
+  // UINTPTR out_start = (UINTPTR)&arena;
 
   // for (int i=0; i<out_buf_mb; i++){
 	//   Xil_SetTlbAttributes(out_start, NORM_NONCACHE);
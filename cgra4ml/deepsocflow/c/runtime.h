@@ -19,7 +19,8 @@ typedef double   f64;
 typedef const struct {
   const u16  n, l, kw, coe, h, w, ci, co, w_kw2, t, p, cm, cm_p0, on, oh, ow, oc, ch, ph, cw, pw, pkh, psh, pkw, psw;
   const i32  xp_words, b_offset, w_bpt, w_bpt_p0, x_bpt, x_bpt_p0, o_words, o_bytes;
-  const i8   ib_out, in_buffer_idx, out_buffer_idx, add_out_buffer_idx, add_in_buffer_idx;
+  const i8   ib_out;
+  const i32  in_offset, out_offset, add_out_offset, add_in_offset; // bytes into mp->arena, ARENA_NONE if none
   const i8   is_bias, is_pool, is_flatten, is_softmax;
   const i8   x_pad, b_val_shift, b_bias_shift, ca_nzero, ca_shift, ca_pl_scale, aa_nzero, aa_shift, aa_pl_scale, pa_nzero, pa_shift, pa_pl_scale, softmax_frac;
   const i8   csh, csh_shift, psh_shift, csw, csw_shift, psw_shift, pool;
@@ -30,6 +31,8 @@ typedef const struct {
 
 typedef enum {POOL_NONE, POOL_MAX, POOL_AVG} Pool_t;
 
+#define ARENA_NONE -1 // offset of a buffer the bundle does not have
+
 #include "config_fw.h"
 
 #define X_BITS            (1 << X_BITS_L2)
@@ -43,7 +46,7 @@ typedef struct {
   // These are written often, keep them on OCM
   Y_TYPE ocm            [2][PE_COLS*PE_ROWS];
   i32    nhwc           [NHWC_WORDS  ];
-  i8     out_buffers    [N_OUT_BUF   ][O_BYTES_MAX ];
+  i8     arena          [ARENA_BYTES ]; // out & add buffers, at the offsets planned by export (arena.py)
   // These can be kept in DDR
   i8     w              [W_BYTES     ];
   B_TYPE b              [B_WORDS     ]; // keep next to w. weights are loaded to w_ptr
@@ -54,7 +57,6 @@ typedef struct {
   i8     debug_tiled    [O_WORDS_MAX ];
   i32    debug_nhwc     [NHWC_WORDS  ];
 #endif
-  i8     add_buffers    [N_ADD_BUF   ][NHWC_WORDS  ]; // should be last, since N_ADD_BUF can be empty
 } Memory_st;
 
 #define A_START        0x0
@@ -98,9 +100,37 @@ typedef struct {
   }
 #endif
 
+// Binary test vectors: raw little-endian words, read by verify_inference(vector_format='bin') through np.memmap.
+// model_run opens the raw dump once per (ib, ip, it) & the sum dump once per bundle. Words are written DUMP_WORDS at a time
+#if defined(SIM) && defined(DUMP_VECTORS_BIN)
+  #define VECTORS_BIN
+  #define DUMP_WORDS 4096
+  typedef struct { FILE *fp; i32 n; i32 buf [DUMP_WORDS]; } Dump_t;
+  static Dump_t dump_raw, dump_sum;
+
+  static inline void dump_flush(Dump_t *d) { fwrite(d->buf, sizeof(i32), d->n, d->fp); d->n = 0; }
+  static inline void dump_close(Dump_t *d) { dump_flush(d); fclose(d->fp); d->fp = NULL; }
+  static inline void dump_open (Dump_t *d, const char *f_path) {
+    d->fp = fopen(f_path, "wb"); // truncated: a rerun never leaves stale words
+    d->n  = 0;
+  }
+  #define dump_i32(d, val) do { (d)->buf[(d)->n++] = (i32)(val); if ((d)->n == DUMP_WORDS) dump_flush(d); } while (0)
+#else
+  #define dump_i32(d, val)
+#endif
+
+// Cycle trace: clock count of the testbench at each event, written to cycles_fw.csv. Opened & closed by model_run
+#if defined(SIM) && defined(TRACE_CYCLES)
+  extern EXT_C i64 get_cycle();
+  static FILE *fp_cycles;
+  #define trace_cycles(event, ib, ip, it, in, il, iw_kw2) fprintf(fp_cycles, "%s,%d,%d,%d,%d,%d,%d,%ld\n", event, ib, ip, it, in, il, iw_kw2, (long)get_cycle())
+#else
+  #define trace_cycles(...)
+#endif
+
 #ifdef XDEBUG
   #define debug_printf printf
-  #define assert_printf(v1, op, v2, optional_debug_info,...) ((v1  op v2) || (debug_printf("ASSERT FAILED: \n CONDITION: "), debug_printf("( " #v1 " " #op " " #v2 " )"), debug_printf(", VALUES: ( %d %s %d ), ", v1, #op, v2), debug_printf("DEBUG_INFO: " optional_debug_info), debug_printf(" " __VA_ARGS__), debug_printf("\n\n"), assert(v1 op v2), 0))
+  #define assert_printf(v1, op, v2, optional_debug_info,...) ((void)((v1  op v2) || (debug_printf("ASSERT FAILED: \n CONDITION: "), debug_printf("( " #v1 " " #op " " #v2 " )"), debug_printf(", VALUES: ( %d %s %d ), ", v1, #op, v2), debug_printf("DEBUG_INFO: " optional_debug_info), debug_printf(" " __VA_ARGS__), debug_printf("\n\n"), assert(v1 op v2), 0)))
 #else
   #define assert_printf(...)
   #define debug_printf(...)
@@ -188,8 +218,8 @@ static inline void tile_write( i32 out_val, i8 *restrict p_out_buffer, i32 ib, B
   }
 
   // Store for residual add
-  if (pb->add_out_buffer_idx != -1)
-    mp->add_buffers[pb->add_out_buffer_idx][iy_nhwc] = (i8)out_val;
+  if (pb->add_out_offset != ARENA_NONE)
+    mp->arena[pb->add_out_offset + iy_nhwc] = (i8)out_val;
 
   // If output only goes to residual add, early return
   Bundle_t*restrict pb_out;
@@ -269,7 +299,7 @@ u32 addr_64to32 (void* addr){
 extern EXT_C u8 model_run(Memory_st *restrict mp, void *p_config) {
 
   static Bundle_t *restrict pb = &bundles[0];
-  static i32 it_bias=0, w_last, o_bpt;
+  static i32 it_bias=0, w_last;
   static i32 ib=0, ip=0, it=0, in=0, il=0, iw_kw2=0;
   static i8 *restrict p_out_buffer = 0;
 
@@ -298,17 +328,34 @@ extern EXT_C u8 model_run(Memory_st *restrict mp, void *p_config) {
 #endif
 
   debug_printf("Starting model_run()\n");
+#if defined(SIM) && defined(TRACE_CYCLES)
+  fp_cycles = fopen("cycles_fw.csv", "w");
+  fprintf(fp_cycles, "event,ib,ip,it,in,il,iw_kw2,cycle\n");
+#endif
   set_config(p_config, A_START, 1); 
 
   for (ib = 0; ib < N_BUNDLES; ib++) {
 
     pb = &bundles[ib];
-    p_out_buffer = (i8*)&(mp->out_buffers[pb->out_buffer_idx]);
+    trace_cycles("bundle_begin", ib, -1, -1, -1, -1, -1);
+    p_out_buffer = pb->out_offset == ARENA_NONE ? NULL : mp->arena + pb->out_offset; // none: writes only to y or the add buffer
+    if (pb->ib_out != -1)
+      assert_printf(pb->out_offset, !=, ARENA_NONE, "model_run", "bundle %d feeds bundle %d without an output buffer", ib, pb->ib_out);
+#ifdef VECTORS_BIN
+    char f_path_sum [1000];
+    sprintf(f_path_sum, "%s/%0d_y_sum_sim.bin", DATA_DIR, ib);
+    dump_open(&dump_sum, f_path_sum);
+#endif
 
     for (ip = 0; ip < pb->p; ip++) {
       for (it = 0; it < pb->t; it++) {
 
         it_bias = pb->b_offset + pb->coe*it;
+#ifdef VECTORS_BIN
+        char f_path_raw [1000]; // make sure full f_path_raw is shorter than 1000
+        sprintf(f_path_raw, "%s/%0d_%0d_%0d_y_raw_sim.bin", DATA_DIR, ib, ip, it);
+        dump_open(&dump_raw, f_path_raw);
+#endif
 
         for (in = 0; in < pb->n; in++) {
           for (il = 0; il < pb->l; il++) {
@@ -316,15 +363,15 @@ extern EXT_C u8 model_run(Memory_st *restrict mp, void *p_config) {
               
               ocm_bank = !ocm_bank;
               w_last = iw_kw2 == pb->w_kw2-1 ? pb->kw/2+1 : 1;
-              o_bpt = PE_ROWS * pb->coe * w_last * sizeof(Y_TYPE);
 
 #ifdef SIM
+              trace_cycles("wait_begin", ib, ip, it, in, il, iw_kw2); // once per step: re-entries jump past it
 DMA_WAIT:
               // if sim return, so SV can pass time, and call again, which will jump to DMA_WAIT again
 	            if (!get_config(p_config, A_DONE_WRITE + ocm_bank)) 
 	              return 1; 
 
-              char f_path_raw [1000], f_path_sum  [1000]; // make sure full f_path_raw is shorter than 1000
+              // char f_path_raw [1000], f_path_sum  [1000]; // make sure full f_path_raw is shorter than 1000
               // sprintf(f_path_raw, "%s/%0d_%0d_%0d_y_raw_sim.txt", DATA_DIR, ib, ip, it);
               // sprintf(f_path_sum, "%s/%0d_y_sum_sim.txt", DATA_DIR, ib);
               // FILE *fp_raw = fopen(f_path_raw, "a");
@@ -333,10 +380,12 @@ DMA_WAIT:
 		          while (!get_config(p_config, A_DONE_WRITE + ocm_bank)){
                 // in FPGA, wait for write done
               }; 
+              i32 o_bpt = PE_ROWS * pb->coe * w_last * sizeof(Y_TYPE);
               flush_cache(&(mp->ocm[ocm_bank]), o_bpt);
               usleep(0);
 #endif
               set_config(p_config, A_DONE_WRITE + ocm_bank, 0);
+              trace_cycles("wait_end", ib, ip, it, in, il, iw_kw2);
 
               i32 sram_addr=0;
               for (i32 icoe=0; icoe < pb->coe; icoe++) {
@@ -366,6 +415,8 @@ DMA_WAIT:
                     if (i_yh >= yh || i_yc >= yc) {
                       // if (ip == pb->p-1)
                       //   sim_fprintf(fp_sum,"%d\n", 0);        // Save summed output
+                      if (ip == pb->p-1)
+                        dump_i32(&dump_sum, 0);
                       goto PROCESS_AND_STORE_DONE;
                     }
 
@@ -388,6 +439,7 @@ DMA_WAIT:
                       goto PROCESS_AND_STORE_DONE;
                     }
                     // sim_fprintf(fp_sum,"%d\n", out_val); // Save summed output
+                    dump_i32(&dump_sum, out_val);
 
                     // ------ CONV STRIDING ------
                     div_ch = div(i_yh-pb->csh_shift, pb->csh);
@@ -411,9 +463,9 @@ DMA_WAIT:
 
                     // ------ RESIDUAL ADD ---
 
-                    if (pb->add_in_buffer_idx != -1) {
+                    if (pb->add_in_offset != ARENA_NONE) {
                       iy_nhwc = flatten_nhwc(i_yn,i_yh,i_yw,i_yc, yn,yh,yw,yc, "Before add", DEBUG_INFO);// store as nhwc for pooling
-                      out_val += mp->add_buffers[pb->add_in_buffer_idx][iy_nhwc];
+                      out_val += mp->arena[pb->add_in_offset + iy_nhwc];
                       out_val = quant_lrelu(out_val, pb->aa_nzero, pb->aa_shift, pb->aa_pl_scale);
                     }
 
@@ -512,6 +564,7 @@ DMA_WAIT:
 PROCESS_AND_STORE_DONE:
 
                     // sim_fprintf(fp_raw,"%d\n", raw_val); // Save raw output
+                    dump_i32(&dump_raw, raw_val);
                     sram_addr += 1;
                   }
                 }
@@ -521,12 +574,16 @@ PROCESS_AND_STORE_DONE:
               // fclose(fp_raw);
 #endif
               set_config(p_config, A_DONE_READ + ocm_bank, 1);
+              trace_cycles("step_end", ib, ip, it, in, il, iw_kw2);
               debug_printf("%d-------- iw_kw2 %d done \n", ib, iw_kw2);
             } // iw_kw2
             debug_printf("%d-------- il %d done\n", ib, il);
           } // il
           debug_printf("%d-------- in %d done\n", ib, in);
         } // in
+#ifdef VECTORS_BIN
+        dump_close(&dump_raw);
+#endif
         debug_printf("%d------ it %d done\n", ib, it);
       } // it
       debug_printf("%d--- ip %d done\n", ib, ip);
@@ -534,7 +591,7 @@ PROCESS_AND_STORE_DONE:
     debug_printf("%d- done bundle!! ib:%d\n", ib, ib);
 
 #ifdef SIM
-    char f_path_debug [1000];
+    // char f_path_debug [1000];
     // sprintf(f_path_debug, "%s/%0d_y_nhwc_sim.txt", DATA_DIR, ib);
     // FILE *fp_debug = fopen(f_path_debug, "w");
     // for (i32 i=0; i<pb->debug_nhwc_words; i++)
@@ -551,7 +608,23 @@ PROCESS_AND_STORE_DONE:
     //   else sim_fprintf(fp_tiled,"%d\n", mp->debug_tiled[i]);
     // fclose(fp_tiled);
 
-    if (ib != N_BUNDLES-1){
+#ifdef VECTORS_BIN
+    dump_close(&dump_sum);
+
+    char f_path_debug [1000];
+    sprintf(f_path_debug, "%s/%0d_y_nhwc_sim.bin", DATA_DIR, ib);
+    FILE *fp_debug = fopen(f_path_debug, "wb");
+    fwrite(mp->debug_nhwc, sizeof(i32), pb->debug_nhwc_words, fp_debug);
+    fclose(fp_debug);
+
+    sprintf(f_path_debug, "%s/%0d_y_tiled_sim.bin", DATA_DIR, ib);
+    FILE *fp_tiled = fopen(f_path_debug, "wb");
+    if (ib == N_BUNDLES-1) fwrite(mp->y,           sizeof(O_TYPE), pb->o_words, fp_tiled); // f32 if softmax, else i32
+    else                   fwrite(mp->debug_tiled, sizeof(i8),     pb->o_words, fp_tiled);
+    fclose(fp_tiled);
+#endif
+
+    if (p_out_buffer){
       char f_path_packed [1000];
       sprintf(f_path_packed, "%s/%0d_y_packed_sim.bin", DATA_DIR, ib);
       FILE *fp_packed = fopen(f_path_packed, "wb");
@@ -559,13 +632,19 @@ PROCESS_AND_STORE_DONE:
       fclose(fp_packed);
     }
 #endif
-  flush_cache(p_out_buffer, pb->o_bytes);
+  if (p_out_buffer)
+    flush_cache(p_out_buffer, pb->o_bytes);
   set_config(p_config, A_BUNDLE_DONE, 1);
+  trace_cycles("bundle_end", ib, -1, -1, -1, -1, -1);
   } // ib
   debug_printf("done all bundles!!\n");  
 #ifdef SIM
   is_first_call = 1;
 #endif
+#if defined(SIM) && defined(TRACE_CYCLES)
+  fclose(fp_cycles);
+  fp_cycles = NULL;
+#endif
 
   debug_printf("baseaddr: %d, size:%lu\n", (int)addr_64to32(&mem_phy), sizeof(Memory_st));
 
@@ -586,6 +665,7 @@ extern EXT_C void model_setup(Memory_st *restrict mp, void *p_config) {
   if(!fp) debug_printf("ERROR! File not found: %s \n", f_path);
   int bytes = fread(mp->w, 1, WB_BYTES+X_BYTES, fp);
   fclose(fp);
+  assert_printf (bytes, ==, WB_BYTES+X_BYTES, "model_setup", "wbx.bin is short");
 #endif
   flush_cache(mp->w, WB_BYTES+X_BYTES);  // force transfer to DDR, starting addr & length
 
@@ -607,7 +687,9 @@ extern EXT_C void model_setup(Memory_st *restrict mp, void *p_config) {
   // Write into BRAM the config for controller
   i32 parameters[8*N_BUNDLES];
   for (int var = 0; var < N_BUNDLES; var++){
-    parameters[8*var] = (var == 0) ? addr_64to32(mem_phy.x) : addr_64to32(mem_phy.out_buffers[bundles[var].in_buffer_idx]);       // x_base address
+    if (var != 0)
+      assert_printf(bundles[var].in_offset, !=, ARENA_NONE, "model_setup", "bundle %d has no input buffer", var);
+    parameters[8*var] = (var == 0) ? addr_64to32(mem_phy.x) : addr_64to32(mem_phy.arena + bundles[var].in_offset);       // x_base address
     parameters[8*var+1] = bundles[var].x_bpt_p0;  // x_bpt0
     parameters[8*var+2] = bundles[var].x_bpt;     // x_bpt
     parameters[8*var+3] = bundles[var].w_bpt_p0;  // w_bpt0
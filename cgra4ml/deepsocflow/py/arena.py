@@ -0,0 +1,123 @@
+import numpy as np
+from collections import namedtuple
+
+'''
+Arena memory planner.
+
+Bundles run one after the other. The firmware keeps two kinds of buffers between them, all in one arena (Memory_st.arena):
+    out : written by bundle ib (tiled & packed input of the next bundle), read by the DMA during the bundles in next_ibs
+    add : written by bundle ib (i8 nhwc), read by the residual adds of the bundles in next_add_ibs
+A buffer is live from its producer to its last consumer, both included: a bundle reads its inputs while it writes its outputs.
+Two buffers may share bytes only if their lifetimes do not intersect.
+
+Buffers are placed largest first, each in the smallest gap left between the live buffers it overlaps (best-fit),
+or above all of them. Offsets & sizes are multiples of ARENA_ALIGN bytes, so buffers start aligned relative to the arena.
+'''
+
+ARENA_ALIGN = 64  # bytes: cache line, multiple of the AXI data width
+
+ArenaBuffer = namedtuple('ArenaBuffer', ['kind', 'ib', 'first', 'last', 'bytes', 'offset'])
+
+
+def align_up(n, align=ARENA_ALIGN):
+    return -(-n//align)*align
+
+
+def c_offset(offset):
+    '''
+    Offset as written into config_fw.h: ARENA_NONE (runtime.h) for a buffer the bundle does not have
+    '''
+    return 'ARENA_NONE' if offset == -1 else offset
+
+
+def get_out_bytes(hw, bundles, ib):
+    '''
+    Words & bytes of the output of an exported bundle: tiled input of the next bundle, or O_TYPE nhwc for the last one
+    '''
+    b = bundles[ib]
+    if ib == len(bundles)-1:
+        o_words = int(np.prod(b.o_int_shape))
+        return o_words, o_words*4 # int or float
+
+    b_next = bundles[ib+1]
+    o_words = b_next.xe_words[0] + (b_next.r.CP-1)*b_next.xe_words[-1]
+    o_bytes = (hw.X_BITS*b_next.xe_words[0])//8 + (b_next.r.CP-1)*((hw.X_BITS*b_next.xe_words[-1])//8)
+    return o_words, o_bytes
+
+
+def get_arena_buffers(hw, bundles):
+    '''
+    Buffers of exported bundles, with their lifetimes [first, last] in bundles & their real sizes. Not yet placed (offset=None).
+    '''
+    buffers = []
+    for ib, b in enumerate(bundles):
+        if len(b.next_ibs) != 0:
+            buffers += [ArenaBuffer('out', ib, ib, max(b.next_ibs), get_out_bytes(hw, bundles, ib)[1], None)]
+        if len(b.next_add_ibs) != 0:
+            buffers += [ArenaBuffer('add', ib, ib, max(b.next_add_ibs), b.r.ON*b.r.OH*b.r.OW*b.r.OC, None)]
+    return buffers
+
+
+def plan_arena(buffers, align=ARENA_ALIGN):
+    '''
+    Best-fit placement of buffers, largest first. Returns the placed buffers (in the order given) and the arena size in bytes.
+    '''
+    placed = {}
+    for i in sorted(range(len(buffers)), key=lambda i: (-buffers[i].bytes, buffers[i].first)):
+        buf = buffers[i]
+        size = align_up(buf.bytes, align)
+        live = sorted((p for p in placed.values() if p.first <= buf.last and buf.first <= p.last), key=lambda p: p.offset)
+
+        offset, best_gap, end = None, None, 0
+        for p in live:
+            gap = p.offset - end
+            if gap >= size and (best_gap is None or gap < best_gap):
+                offset, best_gap = end, gap
+            end = max(end, p.offset + align_up(p.bytes, align))
+        placed[i] = buf._replace(offset=end if offset is None else offset)
+
+    placed = [placed[i] for i in range(len(buffers))]
+    arena_bytes = max([p.offset + align_up(p.bytes, align) for p in placed], default=0)
+    return placed, arena_bytes
+
+
+def peak_live_bytes(buffers, n_bundles, align=ARENA_ALIGN):
+    '''
+    Largest sum of the sizes of the buffers live during one bundle: no placement can use less
+    '''
+    return max([sum(align_up(buf.bytes, align) for buf in buffers if buf.first <= ib <= buf.last) for ib in range(n_bundles)], default=0)
+
+
+def legacy_arena_bytes(hw, bundles, buffers):
+    '''
+    Bytes of the slot scheme the arena replaces: N_OUT_BUF slots of O_BYTES_MAX & N_ADD_BUF slots of NHWC_WORDS.
+    First-fit over slots in bundle order needs as many slots as buffers of a kind live at once.
+    '''
+    o_bytes_max = max(get_out_bytes(hw, bundles, ib)[1] for ib in range(len(bundles)))
+    nhwc_words_max = max(b.r.XN * b.r.XH * b.r.XW * b.r.CO for b in bundles)
+    n_live = lambda kind: max([sum(buf.kind == kind and buf.first <= ib <= buf.last for buf in buffers) for ib in range(len(bundles))], default=0)
+    return max(n_live('out'), 1)*o_bytes_max + n_live('add')*nhwc_words_max
+
+
+def plan_bundle_buffers(hw, bundles, align=ARENA_ALIGN):
+    '''
+    Plans the arena of exported bundles: sets b.out_offset & b.add_out_offset (-1 if none) and returns a report
+    '''
+    buffers, arena_bytes = plan_arena(get_arena_buffers(hw, bundles), align)
+
+    for b in bundles:
+        b.out_offset = b.add_out_offset = -1
+    for buf in buffers:
+        setattr(bundles[buf.ib], {'out': 'out_offset', 'add': 'add_out_offset'}[buf.kind], buf.offset)
+
+    print(f"{'kind':>5} {'ib':>4} {'live':>9} {'bytes':>12} {'offset':>12}")
+    for buf in sorted(buffers, key=lambda buf: (buf.offset, buf.first)):
+        print(f"{buf.kind:>5} {buf.ib:>4} {f'{buf.first}-{buf.last}':>9} {buf.bytes:>12} {buf.offset:>12}")
+
+    report = {
+        'arena_bytes': arena_bytes,
+        'peak_live_bytes': peak_live_bytes(buffers, len(bundles), align),
+        'legacy_bytes': legacy_arena_bytes(hw, bundles, buffers),
+    }
+    print(f"Arena: {arena_bytes} bytes (peak live: {report['peak_live_bytes']}), slot buffers: {report['legacy_bytes']} bytes")
+    return buffers, report
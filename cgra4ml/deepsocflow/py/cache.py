@@ -0,0 +1,157 @@
+import numpy as np
+import hashlib
+import os
+import pickle
+import shutil
+
+'''
+Content-addressed cache of per-bundle export artifacts.
+
+Each entry is a directory {cache_dir}/{key[:2]}/{key}/ where key hashes everything the export of a bundle depends on:
+    export.pkl     : arrays computed by XBundle.export (reorders, packed words, expected outputs of each pass)
+    {format}/      : test vectors of the bundle (txt or bin), named without the {ib}_ prefix
+Golden passes (see xmodel.get_golden) are entries too, keyed by golden_cache_key: their export.pkl holds the results of call_int.
+Entries are written to a temporary directory and renamed into place, so a partial entry is never read.
+
+store_dir/store_file do the same for compiled simulation models (see Hardware.simulate).
+'''
+
+EXPORT_CACHE_VERSION = 3  # bump when the export format changes, to invalidate old entries
+GOLDEN_CACHE_VERSION = 1  # same, for the golden passes
+
+HW_EXPORT_IGNORED = ['frequency_mhz', 'valid_prob', 'ready_prob', 'data_dir', 'config_baseaddr', 'async_resetn']
+
+
+def hash_update(h, item):
+    '''
+    Feeds arrays by dtype, shape & bytes, containers recursively, everything else by repr
+    '''
+    if isinstance(item, np.ndarray):
+        h.update(f'{item.dtype.str}{item.shape}'.encode())
+        h.update(np.ascontiguousarray(item).data)
+    elif isinstance(item, (list, tuple)):
+        h.update(f'{type(item).__name__}{len(item)}'.encode())
+        for i in item:
+            hash_update(h, i)
+    elif isinstance(item, dict):
+        hash_update(h, sorted(item.items(), key=lambda kv: str(kv[0])))
+    else:
+        h.update(repr(item).encode())
+    h.update(b'|')
+
+
+def hash_content(*items):
+    h = hashlib.sha256()
+    for item in items:
+        hash_update(h, item)
+    return h.hexdigest()
+
+
+def hw_export_params(hw):
+    '''
+    Hardware parameters that change exported data. Simulation knobs & paths are left out.
+    '''
+    return {k:v for k,v in hw.params.items() if k not in HW_EXPORT_IGNORED}
+
+
+def bundle_cache_key(hw, r, is_last, *arrays):
+    return hash_content(EXPORT_CACHE_VERSION, hw_export_params(hw), r._asdict(), is_last, *arrays)
+
+
+def golden_cache_key(weights, config, batch_size, backend, INT_BITS, seed, verify):
+    return hash_content('golden', GOLDEN_CACHE_VERSION, weights, config, batch_size, backend, INT_BITS, seed, verify)
+
+
+def cache_path(cache_dir, key):
+    return f'{cache_dir}/{key[:2]}/{key}'
+
+
+def cache_load(cache_dir, key):
+    path = f'{cache_path(cache_dir, key)}/export.pkl'
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def cache_store(cache_dir, key, artifacts):
+    path = cache_path(cache_dir, key)
+    if os.path.exists(path):
+        return
+    tmp = f'{path}.tmp{os.getpid()}'
+    os.makedirs(tmp, exist_ok=True)
+    with open(f'{tmp}/export.pkl', 'wb') as f:
+        pickle.dump(artifacts, f, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        os.rename(tmp, path)
+    except OSError:  # stored concurrently by another process
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def vectors_path(cache_dir, key, vector_format):
+    return f'{cache_path(cache_dir, key)}/{vector_format}'
+
+
+def has_vectors(cache_dir, key, vector_format):
+    return os.path.isdir(vectors_path(cache_dir, key, vector_format))
+
+
+def begin_vectors(cache_dir, key, vector_format):
+    '''
+    Returns a temporary directory to write the vectors of an entry into. Publish with end_vectors.
+    '''
+    tmp = f'{vectors_path(cache_dir, key, vector_format)}.tmp{os.getpid()}'
+    os.makedirs(tmp, exist_ok=True)
+    return tmp
+
+
+def end_vectors(cache_dir, key, vector_format, tmp):
+    try:
+        os.rename(tmp, vectors_path(cache_dir, key, vector_format))
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def link_file(src, dst):
+    '''
+    Hard-links src to dst, falls back to a copy across file systems.
+    Cached files are only ever read through the link: the simulation writes its outputs under other names.
+    '''
+    if os.path.exists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def link_vectors(cache_dir, key, vector_format, data_dir, prefix):
+    src_dir = vectors_path(cache_dir, key, vector_format)
+    for name in os.listdir(src_dir):
+        link_file(f'{src_dir}/{name}', f'{data_dir}/{prefix}{name}')
+
+
+def store_dir(src, dst, ignore=None):
+    '''
+    Copies directory src to dst atomically (temporary copy + rename). mtimes are kept, so make-based builds stay incremental.
+    '''
+    if os.path.exists(dst):
+        return
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f'{dst}.tmp{os.getpid()}'
+    shutil.copytree(src, tmp, ignore=ignore, symlinks=True)
+    try:
+        os.rename(tmp, dst)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def restore_dir(src, dst):
+    shutil.copytree(src, dst, symlinks=True, dirs_exist_ok=True)
+
+
+def store_file(src, dst):
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    tmp = f'{dst}.tmp{os.getpid()}'
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
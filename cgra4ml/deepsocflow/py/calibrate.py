@@ -0,0 +1,181 @@
+import numpy as np
+import json
+import os
+from collections import namedtuple
+
+from deepsocflow.py.utils import *
+from deepsocflow.py.cache import *
+from deepsocflow.py.cycles import *
+
+'''
+Calibration of the clock model against simulation.
+
+predict_bundle_performance counts, per bundle:
+    clocks = sum over passes of IT*(1 + XN*XL*XW*(1 + CM*KH))
+which is the sum of the terms below, each with coefficient 1. Pipeline fill, DELAY_MUL & DELAY_W_RAM, the header beats
+and the OCM handshakes are not in it. run_calibration simulates single-bundle micro-models, measures the cycles of each
+bundle (cycles.py) and fits one coefficient per term. The profile is stored per Hardware & used by predict_model_performance.
+'''
+
+CALIBRATION_TERMS = ['mac', 'column', 'iteration', 'transfer', 'bundle']
+ANALYTICAL_COEFFICIENTS = [1, 1, 1, 0, 0]  # predict_bundle_performance
+
+CALIBRATION_IGNORED = ['frequency_mhz', 'data_dir', 'config_baseaddr', 'target_cpu_int_bits'] # do not change cycles
+
+CalibrationPoint = namedtuple('CalibrationPoint', ['KH', 'KW', 'CI', 'CO', 'XH', 'XW', 'XN', 'strides'])
+
+
+def calibration_features(r):
+    '''
+    Counts of each of CALIBRATION_TERMS in a bundle with runtime params r
+    '''
+    return np.array([
+        r.IT * r.XN * r.XL * r.XW * r.KH * (r.CM_0 + (r.CP-1)*r.CM),  # mac       : CM*KH clocks per column of each pass
+        r.CP * r.IT * r.XN * r.XL * r.XW,                             # column    : per column of each pass
+        r.CP * r.IT,                                                  # iteration : weights load & pipeline fill (DELAY_MUL, DELAY_W_RAM)
+        r.CP * r.IT * r.XN * r.XL * (r.XW - r.KW//2),                 # transfer  : output transfer & OCM handshake per step
+        1,                                                            # bundle    : headers, DMA start & drain
+    ], dtype=np.float64)
+
+
+def calibrated_clocks(profile, r):
+    return float(np.dot(profile['coefficients'], calibration_features(r)))
+
+
+def calibration_key(hw):
+    return hash_content({k:v for k,v in hw.params.items() if k not in CALIBRATION_IGNORED})
+
+
+def calibration_path(hw, calibration_dir='calibration'):
+    return f'{calibration_dir}/{calibration_key(hw)[:16]}.json'
+
+
+def load_calibration(hw, calibration_dir='calibration'):
+    '''
+    Profile of run_calibration for this Hardware, None if it was never calibrated
+    '''
+    path = calibration_path(hw, calibration_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_calibration_points(hw):
+    '''
+    Micro-models spanning KH/KW, CI (one & several passes), XW, XN & strides, each varied around a base point, within hw limits
+    '''
+    k = min(3, hw.KH_MAX, hw.KW_MAX)
+    xw = min(8, hw.XW_MAX)
+    xh = min(2*hw.ROWS, hw.XH_MAX)
+    co = hw.COLS
+    cm = (hw.RAM_WEIGHTS_DEPTH - hw.CONFIG_BEATS)//k
+    base = CalibrationPoint(KH=k, KW=k, CI=8, CO=co, XH=xh, XW=xw, XN=1, strides=(1,1))
+
+    points = [base]
+    points += [base._replace(KH=kh, KW=kw) for kh, kw in [(1,1), (5,5), (7,7), (1,3), (3,1)] if kh <= hw.KH_MAX and kw <= hw.KW_MAX]
+    points += [base._replace(CI=ci) for ci in [3, 32, cm+1, 2*cm+5] if ci <= hw.CI_MAX]                  # CP = 1, 2, 3
+    points += [base._replace(CO=c) for c in [co//k//2 or 1, 3*co]]                                         # IT
+    points += [base._replace(XW=w) for w in [k//2+1, 2*xw, 4*xw] if w <= hw.XW_MAX]
+    points += [base._replace(XH=h) for h in [hw.ROWS, 4*hw.ROWS] if h <= hw.XH_MAX]
+    points += [base._replace(XN=n) for n in [2, 4] if n <= hw.XN_MAX]
+    points += [base._replace(strides=s) for s in [(2,2), (1,2)]]
+    return list(dict.fromkeys(points))
+
+
+def build_micro_model(point, sys_bits):
+    '''
+    Keras model of a single conv bundle. Imports TF/QKeras here: the rest of this module does not need them.
+    '''
+    from tensorflow import keras
+    from deepsocflow.py.xmodel import XModel
+    from deepsocflow.py.xbundle import XBundle
+    from deepsocflow.py.xlayers import XConvBN, XActivation
+
+    class MicroModel(XModel):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.b1 = XBundle(
+                core=XConvBN(
+                    k_int_bits=0, b_int_bits=0, filters=point.CO, kernel_size=(point.KH, point.KW), strides=point.strides,
+                    act=XActivation(sys_bits=sys_bits, o_int_bits=0, type='relu', slope=0)))
+
+        def call(self, x):
+            return self.b1(self.input_quant_layer(x))
+
+    x_in = keras.layers.Input((point.XH, point.XW, point.CI))
+    return keras.models.Model(inputs=[x_in], outputs=[MicroModel(sys_bits=sys_bits, x_int_bits=0)(x_in)])
+
+
+def fit_coefficients(A, y):
+    '''
+    Non-negative least squares: terms that come out negative are dropped & the rest refit
+    '''
+    active = A.any(axis=0)
+    while True:
+        coef = np.zeros(A.shape[1])
+        coef[active], *_ = np.linalg.lstsq(A[:, active], y, rcond=None)
+        if (coef >= 0).all():
+            return coef
+        active &= coef > 0
+
+
+def fit_calibration(hw, features, measured, points=None):
+    '''
+    Fits the coefficients of CALIBRATION_TERMS to measured cycles. Returns the profile, with the error of the fit on its points.
+    '''
+    A, y = np.array(features, dtype=np.float64), np.array(measured, dtype=np.float64)
+    coef = fit_coefficients(A, y)
+    predicted = A @ coef
+    rel = np.abs(predicted - y) / y
+    analytical = np.abs(A @ np.array(ANALYTICAL_COEFFICIENTS) - y) / y
+
+    return {
+        'key': calibration_key(hw),
+        'hw': hw.params,
+        'terms': CALIBRATION_TERMS,
+        'coefficients': coef.tolist(),
+        'points': [dict(p._asdict()) for p in points] if points else None,
+        'measured': y.tolist(),
+        'predicted': predicted.tolist(),
+        'error': {'max_rel': float(rel.max()), 'mean_rel': float(rel.mean()), 'analytical_max_rel': float(analytical.max())},
+    }
+
+
+def save_calibration(hw, profile, calibration_dir='calibration'):
+    path = calibration_path(hw, calibration_dir)
+    os.makedirs(calibration_dir, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(profile, f, indent=4)
+    return path
+
+
+def run_calibration(hw, points=None, SIM='verilator', SIM_PATH='', cache_dir=None, calibration_dir='calibration'):
+    '''
+    Simulates each micro-model (default: get_calibration_points), measures the cycles of its bundle from the cycle trace,
+    fits the profile and stores it in calibration_dir, keyed by the Hardware. Run in a working directory of its own:
+    the exports & the build go there, as with any simulation.
+    '''
+    from deepsocflow.py.xmodel import export_inference
+
+    points = points or get_calibration_points(hw)
+    sys_bits = SYS_BITS(x=hw.X_BITS, k=hw.K_BITS, b=hw.B_BITS)
+    hw.export_json()
+    hw.export()
+
+    features, measured = [], []
+    for i, point in enumerate(points):
+        print(f"\n\nCALIBRATION POINT {i+1}/{len(points)}: {point}\n\n")
+        model = build_micro_model(point, sys_bits)
+        graph = export_inference(model, hw, batch_size=point.XN, vector_format='bin', cache_dir=cache_dir)
+        hw.simulate(SIM=SIM, SIM_PATH=SIM_PATH, cache_dir=cache_dir)
+
+        rows = bundle_cycles(*load_cycle_trace('build'))
+        features += [calibration_features(graph.bundles[0].r)]
+        measured += [rows[0]['cycles']]
+        print(f"measured: {measured[-1]} cycles, analytical: {int(np.dot(ANALYTICAL_COEFFICIENTS, features[-1]))}")
+
+    profile = fit_calibration(hw, features, measured, points)
+    path = save_calibration(hw, profile, calibration_dir)
+    print(f"Calibration saved to {path}: {dict(zip(CALIBRATION_TERMS, profile['coefficients']))}, error: {profile['error']}")
+    return profile
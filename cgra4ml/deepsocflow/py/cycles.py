@@ -0,0 +1,128 @@
+import csv
+import json
+from collections import namedtuple
+
+'''
+Cycle trace of a simulation.
+
+The testbench exports its clock count (get_cycle) and writes into its working directory (build/):
+    cycles_fw.csv  : event,ib,ip,it,in,il,iw_kw2,cycle, from model_run when built with -DTRACE_CYCLES (simulate). Per bundle: bundle_begin, bundle_end.
+                     Per step (ip, it, n, l, w_kw2): wait_begin, wait_end (engine filled the OCM bank), step_end (bank drained)
+    cycles_dma.csv : channel,event,cycle,bytes, from the testbench. Per transfer on x, w, o: begin (descriptor taken), end (last byte)
+
+The firmware runs inside a DPI call, in zero simulated time: wait_end to step_end is always 0 here.
+Time the CPU takes on a board is estimated by the firmware model (count_firmware_events) instead.
+'''
+
+FwEvent  = namedtuple('FwEvent',  ['event', 'ib', 'ip', 'it', 'in_', 'il', 'iw_kw2', 'cycle'])
+DmaEvent = namedtuple('DmaEvent', ['channel', 'event', 'cycle', 'bytes'])
+
+DMA_CHANNELS = ['x', 'w', 'o']
+
+
+def load_cycle_trace(build_dir='build'):
+    with open(f'{build_dir}/cycles_fw.csv') as f:
+        fw = [FwEvent(row[0], *map(int, row[1:])) for row in list(csv.reader(f))[1:]]
+    with open(f'{build_dir}/cycles_dma.csv') as f:
+        dma = [DmaEvent(row[0], row[1], int(row[2]), int(row[3])) for row in list(csv.reader(f))[1:]]
+    return fw, dma
+
+
+def dma_transfers(dma):
+    '''
+    Pairs begin & end events of each channel, in order (transfers of a channel complete in order).
+    Returns {channel: [(begin, end, bytes)]}. Transfers still in flight at the end of the simulation are dropped.
+    '''
+    transfers = {}
+    for ch in DMA_CHANNELS:
+        begins = [e for e in dma if e.channel == ch and e.event == 'begin']
+        ends   = [e for e in dma if e.channel == ch and e.event == 'end']
+        transfers[ch] = [(b.cycle, e.cycle, b.bytes) for b, e in zip(begins, ends)]
+    return transfers
+
+
+def bundle_cycles(fw, dma):
+    '''
+    Per-bundle rows: cycles from bundle_begin to bundle_end, cycles spent waiting for the engine, steps,
+    cycles of each pass, and busy cycles & transfers of each DMA channel that began inside the bundle.
+    '''
+    transfers = dma_transfers(dma)
+    rows = []
+    for e in fw:
+        if e.event == 'bundle_begin':
+            row = {'ib': e.ib, 'begin': e.cycle, 'wait': 0, 'steps': 0, 'passes': {}}
+            rows += [row]
+        elif e.event == 'wait_begin':
+            wait_begin = e.cycle
+            row['passes'].setdefault(e.ip, [e.cycle, e.cycle])
+        elif e.event == 'wait_end':
+            row['wait'] += e.cycle - wait_begin
+        elif e.event == 'step_end':
+            row['steps'] += 1
+            row['passes'][e.ip][1] = e.cycle
+        elif e.event == 'bundle_end':
+            row['end'] = e.cycle
+            row['cycles'] = e.cycle - row['begin']
+
+    for row in rows:
+        row['passes'] = [end-begin for _, (begin, end) in sorted(row['passes'].items())]
+        for ch in DMA_CHANNELS:
+            inside = [(b, e) for b, e, _ in transfers[ch] if row['begin'] <= b < row.get('end', b+1)]
+            row[f'dma_{ch}'] = sum(e-b for b, e in inside)
+            row[f'dma_{ch}_transfers'] = len(inside)
+    return rows
+
+
+def chrome_trace(fw, dma, freq_mhz):
+    '''
+    Trace Event Format (chrome://tracing, ui.perfetto.dev). Times in us at freq_mhz, one track per level:
+    bundles, passes, iterations, engine (waiting for each OCM bank), and one per DMA channel.
+    '''
+    tracks = ['bundles', 'passes', 'iterations', 'engine'] + [f'dma {ch}' for ch in DMA_CHANNELS]
+    events = [{'ph': 'M', 'name': 'thread_name', 'pid': 0, 'tid': tid, 'args': {'name': name}} for tid, name in enumerate(tracks)]
+
+    def span(track, name, begin, end, **args):
+        events.append({'ph': 'X', 'name': name, 'pid': 0, 'tid': tracks.index(track), 'ts': begin/freq_mhz, 'dur': (end-begin)/freq_mhz, 'args': {'begin_cycle': begin, 'cycles': end-begin, **args}})
+
+    spans = {}  # (track, name): [begin, end], passes & iterations run from their first wait to their last drained bank
+    for e in fw:
+        if e.event == 'bundle_begin':
+            spans[('bundles', f'bundle {e.ib}')] = [e.cycle, e.cycle]
+        elif e.event == 'bundle_end':
+            spans[('bundles', f'bundle {e.ib}')][1] = e.cycle
+        elif e.event == 'wait_begin':
+            wait_begin = e.cycle
+            spans.setdefault(('passes',     f'bundle {e.ib} pass {e.ip}'),          [e.cycle, e.cycle])
+            spans.setdefault(('iterations', f'bundle {e.ib} pass {e.ip} it {e.it}'), [e.cycle, e.cycle])
+        elif e.event == 'wait_end':
+            span('engine', f'{e.ib}.{e.ip}.{e.it} n{e.in_} l{e.il} w{e.iw_kw2}', wait_begin, e.cycle, ib=e.ib, ip=e.ip, it=e.it, n=e.in_, l=e.il, w_kw2=e.iw_kw2)
+        elif e.event == 'step_end':
+            spans[('passes',     f'bundle {e.ib} pass {e.ip}')][1] = e.cycle
+            spans[('iterations', f'bundle {e.ib} pass {e.ip} it {e.it}')][1] = e.cycle
+
+    for (track, name), (begin, end) in spans.items():
+        span(track, name, begin, end)
+
+    for ch, transfers in dma_transfers(dma).items():
+        for begin, end, nbytes in transfers:
+            span(f'dma {ch}', f'{ch} {nbytes} B', begin, end, bytes=nbytes)
+
+    return {'traceEvents': events, 'displayTimeUnit': 'ns', 'otherData': {'freq_mhz': freq_mhz}}
+
+
+def export_cycle_trace(hw, build_dir='build', path=None):
+    '''
+    Parses the cycle trace of the last simulation, writes the timeline to path (default: {build_dir}/cycles.json)
+    and returns the per-bundle rows of bundle_cycles.
+    '''
+    fw, dma = load_cycle_trace(build_dir)
+    with open(path or f'{build_dir}/cycles.json', 'w') as f:
+        json.dump(chrome_trace(fw, dma, hw.FREQ), f)
+    return bundle_cycles(fw, dma)
+
+
+def print_bundle_cycles(rows):
+    print(f"{'ib':>4} {'cycles':>12} {'wait':>12} {'steps':>7} {'dma_x':>10} {'dma_w':>10} {'dma_o':>10}  passes")
+    for row in rows:
+        print(f"{row['ib']:>4} {row.get('cycles', -1):>12} {row['wait']:>12} {row['steps']:>7} {row['dma_x']:>10} {row['dma_w']:>10} {row['dma_o']:>10}  {row['passes']}")
+    print(f"total cycles: {sum(row.get('cycles', 0) for row in rows)}")
@@ -1,7 +1,13 @@
 import numpy as np
-from collections import namedtuple
+import json
+import os
+import io
+import contextlib
+import threading
+from collections import namedtuple, OrderedDict
 
 from deepsocflow.py.utils import *
+from deepsocflow.py.calibrate import *
 
 def get_runtime_params(hw, w_shape, x_shape, o_shape, core, pool, flatten):
 
@@ -156,7 +162,7 @@ def reorder_b_q2e_conv(b, hw, r):
 
 
 
-def reorder_w_q2e_conv(w, hw, r):
+def layout_w_q2e_conv(w, hw, r):
     # (KH, KW, Ci, CO)
     w = np.pad(w, ((0,0),(0,0),(0,0),(0,r.CO_PAD-r.CO)))        # (KH, KW, CI, CO_PAD)
     w = w.reshape(r.KH, r.KW, r.CI, r.IT, r.CO_PRL)             # (KH, KW, CI, IT, CO_PRL)
@@ -190,48 +196,50 @@ def reorder_w_q2e_conv(w, hw, r):
 
 
 
-def reorder_x_q2e_conv(x, hw, r):
-    print('input initial (XN, XH, XW, CI)=', x.shape)
-
-    x = np.pad(x, ((0,0),(0,r.XL*hw.ROWS-r.XH),(0,0),(0,0)))         # (XN, L*HL , XW, CI)
-    x = x.reshape  (r.XN, r.XL, hw.ROWS, r.XW, r.CI)                   # (XN, XL, HL, XW, CI)
-
-    zeros = np.zeros((r.XN,r.XL,hw.ROWS+r.X_PAD,r.XW,r.CI),x.dtype)  # (XN,XL,hw.ROWS+X_PAD,XW,CI)
-    zeros[:,:,:hw.ROWS,:,:] = x
-
-    ''' Fill bot rows from next '''
-    for l in range(r.XL):
-        if l == r.XL-1:
-            zeros[:,l, hw.ROWS: ,:,:] = np.zeros((r.XN,r.X_PAD,r.XW,r.CI),x.dtype)
-        else:
-            zeros[:,l, hw.ROWS: ,:,:] = x[:,l+1,:r.X_PAD,:,:]
+def iter_x_q2e_conv(x, hw, r):
+    '''
+    Yields the input of each pass, (XN, XL, XW, CM, hw.ROWS+X_PAD) flattened & padded to whole bytes.
+    Block l holds rows [l*ROWS, (l+1)*ROWS+X_PAD): its bottom X_PAD rows overlap the next block (zero past XH).
+    Each pass is gathered straight into its output buffer, so only one pass is held in memory at a time.
+    '''
+    rows = np.arange(r.XL)[:,None]*hw.ROWS + np.arange(hw.ROWS+r.X_PAD)[None,:]  # (XL, hw.ROWS+X_PAD) input row of each block row
+    rows_pad = rows >= r.XH
+    rows = np.minimum(rows, r.XH-1)
 
-    x = zeros                                                  # (XN,XL,hw.ROWS+X_PAD,XW,CI)
-    x = x.transpose(0,1,3,4,2)                                 # (XN,XL,XW,CI,hw.ROWS+X_PAD)
-    x = x.reshape((r.XN, r.XL, r.XW, r.CI, (hw.ROWS+r.X_PAD)))
+    x = x.transpose(0,2,3,1)                                         # (XN, XW, CI, XH), a view
+    words_per_byte = 8//hw.X_BITS
 
-    x_list = []
     ic_left = ic_right = 0
     for ip in range(r.CP):
         CM_p = r.CM_0 if ip==0 else r.CM
         ic_right += CM_p
 
-        xp = x[:,:,:, ic_left:ic_right, :]                              #(XN, XL, XW, CM, (hw.ROWS+r.X_PAD))
-        assert xp.shape == (r.XN, r.XL, r.XW, CM_p, (hw.ROWS+r.X_PAD))
+        size = r.XN * r.XL * r.XW * CM_p * (hw.ROWS+r.X_PAD)
+        xp = np.zeros(-(-size//words_per_byte)*words_per_byte, x.dtype)  # padded to whole bytes
+        xp_view = xp[:size].reshape(r.XN, r.XL, r.XW, CM_p, hw.ROWS+r.X_PAD).transpose(0,2,3,1,4) # (XN, XW, CM, XL, hw.ROWS+X_PAD)
 
-        xp = xp.flatten()
-        words_per_byte = 8//hw.X_BITS
-        pad = words_per_byte-(xp.size%words_per_byte)
-        pad = 0 if pad == words_per_byte else pad
-        xp = np.pad(xp, ((0,pad)))
+        np.take(x[:,:, ic_left:ic_right, :], rows, axis=3, out=xp_view, mode='clip')
+        xp_view[..., rows_pad] = 0
 
-        x_list += [xp]
+        yield xp
         ic_left = ic_right
-    return x_list
 
 
+def x_words_q2e_conv(hw, r):
+    '''
+    Words of the input of each pass, as yielded by iter_x_q2e_conv
+    '''
+    words_per_byte = 8//hw.X_BITS
+    return [-(-r.XN*r.XL*r.XW*CM_p*(hw.ROWS+r.X_PAD)//words_per_byte)*words_per_byte for CM_p in [r.CM_0] + [r.CM]*(r.CP-1)]
 
-def reorder_y_q2e_conv(y, hw, r):
+
+def reorder_x_q2e_conv(x, hw, r):
+    print('input initial (XN, XH, XW, CI)=', x.shape)
+    return list(iter_x_q2e_conv(x, hw, r))
+
+
+
+def layout_y_q2e_conv(y, hw, r):
     '''
     This is engine output: no striding (H=H, L=XL), last W interchanged
     '''
@@ -251,7 +259,7 @@ def reorder_y_q2e_conv(y, hw, r):
     return y
 
 
-def reorder_y_e2q_conv(y, hw, r):
+def layout_y_e2q_conv(y, hw, r):
     '''
     This is engine output: no striding (H=H, L=XL), last W interchanged
     '''
@@ -273,15 +281,171 @@ def reorder_y_e2q_conv(y, hw, r):
     return y
 
 
+'''
+Gather maps of the reorders
+
+The layout_* transforms above are fixed permutations of the words, with zero padding, given the runtime params & hardware.
+Each is compiled once, by running it on the 1-based flat indices of its input, into a gather map per output:
+output word i is input word index[i], or 0 where pad[i]. Maps are cached on the input shape and the fields of r & hw
+the transform reads, and applied with one np.take per output, for every bundle, pass & comparison of that layout.
+Indices are int32 (int64 past 2**31 words), so a map takes 4 bytes per word, +1 if it pads.
+'''
+
+REORDER_CACHE_BYTES = 2**27  # of the maps kept, least recently used dropped first. A map larger than this is not kept
+REORDER_MAPS = OrderedDict()
+REORDER_LOCK = threading.Lock() # guards REORDER_MAPS. Maps are compiled outside it, threads may compile the same one
+
+W_LAYOUT = (['KH', 'KW', 'CI', 'CO', 'CO_PAD', 'IT', 'CO_PRL', 'CP', 'CM_0', 'CM'], ['COLS', 'CONFIG_BEATS', 'K_BITS'])
+Y_LAYOUT = (['XN', 'XH', 'XW', 'XL', 'CO', 'CO_PAD', 'IT', 'CO_PRL', 'KW'], ['ROWS'])
+
+
+def compile_reorder(transform, shape):
+    '''
+    Gather maps [(index, pad)] of a transform from an array of shape to a list of arrays. pad is None if there is no padding.
+    '''
+    size = int(np.prod(shape))
+    dtype = np.int32 if size < np.iinfo(np.int32).max else np.int64
+    maps = []
+    for out in transform(np.arange(1, size+1, dtype=dtype).reshape(shape)):
+        out = np.asarray(out).astype(dtype, copy=False)
+        pad = out == 0
+        maps += [(np.maximum(out-1, 0), pad if pad.any() else None)]
+    return maps
+
+
+def maps_bytes(maps):
+    return sum(index.nbytes + (0 if pad is None else pad.nbytes) for index, pad in maps)
+
+
+def reorder_map(name, transform, shape, hw, r, layout):
+    '''
+    Cached gather maps of transform(array of shape, hw, r), returning a list of arrays
+    '''
+    r_fields, hw_fields = layout
+    key = (name, tuple(shape), tuple(getattr(r, f) for f in r_fields), tuple(getattr(hw, f) for f in hw_fields))
+    with REORDER_LOCK:
+        maps = REORDER_MAPS.get(key)
+        if maps is not None:
+            REORDER_MAPS.move_to_end(key)
+            return maps
+    maps = compile_reorder(lambda a: transform(a, hw, r), shape)
+    if maps_bytes(maps) > REORDER_CACHE_BYTES:
+        return maps
+    with REORDER_LOCK:
+        REORDER_MAPS[key] = maps
+        while sum(maps_bytes(m) for m in REORDER_MAPS.values()) > REORDER_CACHE_BYTES:
+            REORDER_MAPS.popitem(last=False)
+    return maps
+
+
+def gather(arr, index, pad):
+    out = np.take(np.asarray(arr).reshape(-1), index)
+    if pad is not None:
+        out[pad] = 0
+    return out
+
+
+def reorder_w_q2e_conv(w, hw, r):
+    '''
+    (KH, KW, CI, CO) -> per pass: (IT, CONFIG_BEATS+CM*KH*COLS), padded to whole bytes
+    '''
+    return [gather(w, *m) for m in reorder_map('w_q2e', layout_w_q2e_conv, w.shape, hw, r, W_LAYOUT)]
+
+
+def y_q2e_map(shape, hw, r):
+    return reorder_map('y_q2e', lambda a, hw, r: [layout_y_q2e_conv(a, hw, r)], shape, hw, r, Y_LAYOUT)[0]
+
+
+def reorder_y_q2e_conv(y, hw, r):
+    '''
+    (XN, XH, XW, CO) -> engine order (IT, XN, XL, XW*CO_PRL, ROWS)
+    '''
+    return gather(y, *y_q2e_map(y.shape, hw, r))
+
+
+def reorder_y_e2q_conv(y, hw, r):
+    '''
+    Engine order (IT, XN, XL, XW*CO_PRL, ROWS) -> (XN, XH, XW, CO), eg. to compare simulated outputs in NHWC
+    '''
+    return gather(y, *reorder_map('y_e2q', lambda a, hw, r: [layout_y_e2q_conv(a, hw, r)], np.shape(y), hw, r, Y_LAYOUT)[0])
+
+
+def index_to_nhwc(maps, shape, index):
+    '''
+    Maps a flat index of a reordered (engine order) vector back to the NHWC coordinates its word came from.
+    maps: gather maps [(index, pad)] of the reorder from an NHWC array of shape, one per concatenated output.
+    Padding & indices past the end map to None.
+    '''
+    for src, pad in maps:
+        if index < src.size:
+            if pad is not None and pad.reshape(-1)[index]:
+                return None
+            return tuple(int(c) for c in np.unravel_index(int(src.reshape(-1)[index]), shape))
+        index -= src.size
+    return None
+
+
 def pack_words_into_bytes (arr, bits):
+    '''
+    Packs words of 'bits' into bytes, first word in the LSBs. Packs along the last axis, so a whole
+    (IT, words) weight pass can be packed at once. Returns uint8 of shape (..., words*bits/8)
+    '''
     assert 8 % bits == 0, f"Bits {bits} should be factor of 8 for packing"
     w_words_per_byte = 8//bits
-    arr = np.frombuffer(arr.astype(np.int8).tobytes(), dtype=np.uint8)
-    arr = arr % 2**bits
-    arr = arr.reshape(arr.size//w_words_per_byte, w_words_per_byte)
-    for i_word in range(1, w_words_per_byte):
-        arr[:,0] += arr[:,i_word] << (i_word * bits) # pack multiple words into a byte
-    return arr[:,0].astype(np.uint8) # packed byte
+    arr = np.asarray(arr).astype(np.int8).view(np.uint8) & np.uint8(2**bits-1)
+    arr = arr.reshape(*arr.shape[:-1], arr.shape[-1]//w_words_per_byte, w_words_per_byte)
+    shifts = (np.arange(w_words_per_byte) * bits).astype(np.uint8)
+    return np.bitwise_or.reduce(arr << shifts, axis=-1).astype(np.uint8) # pack multiple words into a byte
+
+
+def save_vector(path, arr, vector_format='txt', dtype=np.int32):
+    '''
+    Saves a test vector, flattened.
+        txt: {path}.txt, one word per line
+        bin: {path}.bin, raw little-endian words of dtype, with a {path}.json sidecar of shape & dtype
+    '''
+    arr = np.asarray(arr)
+    if vector_format == 'bin':
+        dtype = np.dtype(dtype).newbyteorder('<')
+        arr.astype(dtype).tofile(f'{path}.bin')
+        with open(f'{path}.json', 'w') as f:
+            json.dump({'shape': list(arr.shape), 'dtype': dtype.str}, f)
+    else:
+        np.savetxt(f'{path}.txt', arr.flatten(), fmt='%f' if np.issubdtype(dtype, np.floating) else '%d')
+
+
+def save_vector_parts(path, parts, vector_format='txt', dtype=np.int32):
+    '''
+    Same file as save_vector of the concatenation of parts, written one part at a time. parts: iterable of arrays, eg. a generator
+    '''
+    size = 0
+    if vector_format == 'bin':
+        dtype = np.dtype(dtype).newbyteorder('<')
+        with open(f'{path}.bin', 'wb') as f:
+            for arr in parts:
+                arr = np.asarray(arr)
+                arr.astype(dtype).tofile(f)
+                size += arr.size
+        with open(f'{path}.json', 'w') as f:
+            json.dump({'shape': [size], 'dtype': dtype.str}, f)
+    else:
+        with open(f'{path}.txt', 'w') as f:
+            for arr in parts:
+                np.savetxt(f, np.asarray(arr).flatten(), fmt='%f' if np.issubdtype(dtype, np.floating) else '%d')
+
+
+def load_vector(path, dtype=np.int32, vector_format='txt'):
+    '''
+    Loads a flat test vector. bin files are memory-mapped, not read. dtype is taken from the sidecar when there is one,
+    so that the raw dumps of the firmware (runtime.h, DUMP_VECTORS_BIN) can be read too.
+    '''
+    if vector_format == 'bin':
+        if os.path.exists(f'{path}.json'):
+            with open(f'{path}.json', 'r') as f:
+                dtype = json.load(f)['dtype']
+        return np.memmap(f'{path}.bin', dtype=np.dtype(dtype).newbyteorder('<'), mode='r')
+    else:
+        return np.loadtxt(f'{path}.txt', dtype)
 
 
 def predict_bundle_performance(hw, r):
@@ -295,15 +459,12 @@ def predict_bundle_performance(hw, r):
         hw.X_BITS * (r.XN * r.XH   * r.XW * r.CO)
     mem_bits_p = \
         hw.X_BITS * (r.IT * r.XN   * r.XL * r.XW * r.CM   * (hw.ROWS + r.X_PAD-1)) +\
-        hw.K_BITS * (r.IT * r.CM_0 * r.KH * hw.COLS) +\
+        hw.K_BITS * (r.IT * r.CM   * r.KH * hw.COLS) +\
         hw.X_BITS * (r.XN * r.XH   * r.XW * r.CO)
 
     '''
-    Accurate mem access (output):
-        - baseline: next bundle input + padding
-        - p_add   - write & read
-        - pooling - write & read
-        - softmax - write & read
+    Rough mem access: pixels & weights of each pass, output once per pass.
+    See predict_bundle_traffic for the full traffic (partial sums, add, pooling, softmax, next bundle padding)
     '''
 
     clocks    = clocks_p0 + (r.CP-1)*clocks_p
@@ -316,30 +477,314 @@ def predict_bundle_performance(hw, r):
     return clocks, mem_bits, utilization, operations
 
 
-def predict_model_performance(hw):
+'''
+Traffic model
+
+DMA (engine side), per pass & iteration, as in dma_controller.sv & model_run:
+    w : one transfer of CONFIG_BEATS+CM*KH rows of COLS weights
+    x : one transfer of the pass input, XN*XL*XW*CM*(ROWS+X_PAD): each block carries X_PAD halo rows of the next
+    y : one transfer per (n, l, w_kw2) of ROWS*CO_PRL*w_last words of Y_OUT_BITS into the OCM banks
+CPU (firmware side), on the words it takes from the OCM:
+    psum    : i32 nhwc partial sums when CP > 1. Pass 0 writes, middle passes read & write, last pass reads
+    bias    : B_BITS per output channel, on the last pass
+    add     : i8 residual read (add), i8 copy of the output kept for a later add (add_out)
+    pool    : i32 nhwc write & read of the conv output
+    softmax : f32 exp written, then read twice (sum, divide) & written again
+    out     : tiled & halo-padded input of the next bundle, or the O_TYPE output of the last bundle
+
+Every stream goes over an AXI port of AXI_WIDTH bits at FREQ, in bursts of up to AXI_MAX_BURST_LEN beats.
+Read & write channels are independent, so a pass takes the longer of the two.
+'''
+
+AXI_BURST_OVERHEAD = 4  # clocks lost per burst (address handshake, DDR row switch), on top of its data beats
+
+Traffic = namedtuple('Traffic', ['count', 'clocks', 'read_bits', 'write_bits', 'read_clocks', 'write_clocks', 'memory_clocks', 'latency_clocks', 'bound'])
+
+
+def ceil_div(a, b):
+    return -(-a//b)
+
+
+def roofline_bound(memory_clocks, compute_clocks):
+    bound = np.where(memory_clocks > compute_clocks, 'memory', 'compute')
+    return str(bound) if bound.ndim == 0 else bound
+
+
+def axi_clocks(hw, bits, transfers=1, burst_overhead=AXI_BURST_OVERHEAD):
+    '''
+    Clocks to move bits in equal transfers: one AXI_WIDTH beat per clock, bursts of up to AXI_MAX_BURST_LEN beats
+    '''
+    transfers = np.maximum(transfers, 1)
+    beats  = ceil_div(ceil_div(bits, transfers), hw.AXI_WIDTH)
+    bursts = ceil_div(beats, hw.AXI_MAX_BURST_LEN)
+    return transfers * (beats + bursts*burst_overhead) * (np.asarray(bits) > 0)
+
+
+def predict_pass_traffic(hw, r, CM_p, psum_read, psum_write, last_pass, add=False, add_out=False, pool=False, softmax=False, next_r=None, is_last=False):
+    '''
+    Streams of one pass with CM_p input channels, as {name: (bits, transfers)} for the read & the write side.
+    psum_read, psum_write, last_pass: role of the pass, 0/1 (or arrays of them over a grid)
+    '''
+    conv_words = r.XN * r.XH  * r.XW  * r.CO   # engine output, nhwc
+    cyx_words  = r.XN * r.CYH * r.CYW * r.CO   # after conv striding
+    out_words  = r.XN * r.PYH * r.PYW * r.CO   # after pooling
+
+    read = {
+        'w'      : (r.IT * (hw.CONFIG_BEATS + CM_p*r.KH) * hw.COLS * hw.K_BITS, r.IT),
+        'x'      : (r.IT * r.XN * r.XL * r.XW * CM_p * (hw.ROWS + r.X_PAD) * hw.X_BITS, r.IT),
+        'psum'   : (psum_read * conv_words * 32, 1),
+        'bias'   : (last_pass * r.CO * hw.B_BITS, 1),
+        'add'    : (last_pass * add * cyx_words * 8, 1),
+        'pool'   : (last_pass * pool * cyx_words * 32, 1),
+        'softmax': (last_pass * softmax * 2*out_words * 32, 1),
+    }
+    write = {
+        'y'      : (r.IT * r.XN * r.XL * r.XW * hw.ROWS * r.CO_PRL * hw.Y_OUT_BITS, r.IT * r.XN * r.XL * (r.XW - r.KW//2)),
+        'psum'   : (psum_write * conv_words * 32, 1),
+        'add'    : (last_pass * add_out * out_words * 8, 1),
+        'pool'   : (last_pass * pool * cyx_words * 32, 1),
+        'softmax': (last_pass * softmax * 2*out_words * 32, 1),
+        'out'    : (last_pass * (0 if softmax else
+                                 out_words * 32 if is_last else
+                                 0 if next_r is None else
+                                 next_r.XN * next_r.XL * next_r.XW * next_r.CI * (hw.ROWS + next_r.X_PAD) * hw.X_BITS), 1),
+    }
+    return read, write
+
+
+def predict_bundle_traffic(hw, r, add=False, add_out=False, pool=False, softmax=False, next_r=None, is_last=False, burst_overhead=AXI_BURST_OVERHEAD, clocks_scale=1):
+    '''
+    Traffic & roofline of a bundle, per kind of pass: first, middle (CP-2 of them) & last (when CP > 1).
+    add, add_out, pool, softmax: what the bundle does after its last pass, see get_bundle_traffic_args
+    next_r: runtime params of the bundle taking the output. None if the output only feeds residual adds
+    clocks_scale: correction of the compute clocks, eg: calibrated / analytical clocks of the bundle
+
+    Returns {pass: Traffic} and the Traffic of the bundle, with the fields summed over its passes.
+    A pass is memory bound if its DMA & firmware streams take longer than the engine: its latency is the max of both.
+    '''
+    multi = (r.CP > 1)*1
+    kwargs = dict(add=add, add_out=add_out, pool=pool, softmax=softmax, next_r=next_r, is_last=is_last)
+
+    passes = {  # (count, CM_p, compute clocks, psum_read, psum_write, last_pass)
+        'first' : (1,                     r.CM_0, clocks_scale*r.IT*(1 + r.XN*r.XL*r.XW*(1 + r.CM_0*r.KH)), 0, multi, 1-multi),
+        'middle': (np.maximum(r.CP-2, 0), r.CM,   clocks_scale*r.IT*(1 + r.XN*r.XL*r.XW*(1 + r.CM  *r.KH)), 1, 1,     0      ),
+        'last'  : (multi,                 r.CM,   clocks_scale*r.IT*(1 + r.XN*r.XL*r.XW*(1 + r.CM  *r.KH)), 1, 0,     1      ),
+    }
+
+    out = {}
+    for name, (count, CM_p, clocks, psum_read, psum_write, last_pass) in passes.items():
+        read, write = predict_pass_traffic(hw, r, CM_p, psum_read, psum_write, last_pass, **kwargs)
+        read_clocks  = sum(axi_clocks(hw, bits, transfers, burst_overhead) for bits, transfers in read .values())
+        write_clocks = sum(axi_clocks(hw, bits, transfers, burst_overhead) for bits, transfers in write.values())
+        memory_clocks = np.maximum(read_clocks, write_clocks)
+        out[name] = Traffic(count=count, clocks=clocks,
+                            read_bits ={k: bits for k, (bits, _) in read .items()},
+                            write_bits={k: bits for k, (bits, _) in write.items()},
+                            read_clocks=read_clocks, write_clocks=write_clocks, memory_clocks=memory_clocks,
+                            latency_clocks=np.maximum(clocks, memory_clocks),
+                            bound=roofline_bound(memory_clocks, clocks))
+
+    total = Traffic(count=r.CP,
+                    **{f: sum(t.count*getattr(t, f) for t in out.values()) for f in ['clocks', 'read_clocks', 'write_clocks', 'memory_clocks', 'latency_clocks']},
+                    read_bits ={k: sum(t.count*t.read_bits [k] for t in out.values()) for k in out['first'].read_bits },
+                    write_bits={k: sum(t.count*t.write_bits[k] for t in out.values()) for k in out['first'].write_bits},
+                    bound=None)
+    # bundle is memory bound if the memory bound passes dominate its latency
+    memory_bound = sum(t.count*np.where(t.memory_clocks > t.clocks, t.latency_clocks, 0) for t in out.values())
+    total = total._replace(bound=roofline_bound(2*memory_bound, total.latency_clocks))
+    return out, total
+
+
+def get_bundle_traffic_args(bundles, rs, ib):
+    '''
+    Keyword args of predict_bundle_traffic for bundle ib, from the graph recorded by XBundle.call
+    '''
+    b = bundles[ib]
+    next_ibs = sorted(b.next_ibs)
+    return dict(add=b.add is not None, add_out=len(b.next_add_ibs) != 0, pool=b.pool is not None, softmax=b.softmax is not None,
+                next_r=rs[next_ibs[0]] if next_ibs else None, is_last=ib == len(bundles)-1)
+
+
+'''
+Firmware model
 
+model_run drains the OCM bank the engine just wrote while the engine fills the other one. Each step (ip, it, n, l, w_kw2)
+costs the CPU a handshake (wait, flush_cache, set_config) and the processing of the words of that bank.
+Tiny models spend most of their time here, not in the engine.
+
+Costs are ns per event on the PS. Defaults are rough figures for a Cortex-A53 at 1.2 GHz with -O3:
+calibrate them for a board with fit_firmware_costs.
+'''
+
+FirmwareCosts = namedtuple('FirmwareCosts', ['bundle', 'transfer', 'word', 'psum', 'output', 'add', 'pool', 'tile', 'softmax'])
+
+FIRMWARE_COSTS = FirmwareCosts(
+    bundle   = 2000, # bundle setup, last bank & the x DMA of the next bundle waiting for A_BUNDLE_DONE
+    transfer = 600,  # OCM handshake per step: poll/interrupt, flush_cache, set_config
+    word     = 4,    # each word read from the OCM, including padding
+    psum     = 6,    # read-add-write of a partial sum (CP > 1)
+    output   = 8,    # striding, bias & activation of each output
+    add      = 4,    # residual add read, or copy kept for a later add
+    pool     = 3,    # each value read in a pooling window
+    tile     = 6,    # write_x of each word of the next bundle's input, halo included
+    softmax  = 60,   # exp, sum & divide per output
+)
+
+
+def count_firmware_events(hw, r, add=False, add_out=False, pool=False, softmax=False, next_r=None, is_last=False):
+    '''
+    Number of events of each field of FirmwareCosts in model_run for one bundle. Args as in predict_bundle_traffic.
+    '''
+    cyx_words = r.XN * r.CYH * r.CYW * r.CO
+    out_words = r.XN * r.PYH * r.PYW * r.CO
+
+    return FirmwareCosts(
+        bundle   = 1,
+        transfer = r.CP * r.IT * r.XN * r.XL * (r.XW - r.KW//2),
+        word     = r.CP * r.IT * r.XN * r.XL * r.XW * r.CO_PRL * hw.ROWS,
+        psum     = (r.CP-1) * r.XN * r.XH * r.XW * r.CO,
+        output   = cyx_words,
+        add      = add * cyx_words + add_out * out_words,
+        pool     = pool * out_words * r.PKH * r.PKW,
+        tile     = 0 if softmax else out_words if is_last else 0 if next_r is None else
+                   next_r.XN * next_r.XL * next_r.XW * next_r.CI * (hw.ROWS + next_r.X_PAD),
+        softmax  = softmax * out_words,
+    )
+
+
+def fit_firmware_costs(counts, measured_ns):
+    '''
+    Least squares fit of FirmwareCosts to measured CPU time of bundles.
+    counts: list of count_firmware_events, one per bundle measured (from several models, to span the fields)
+    measured_ns: CPU time of each bundle in ns, eg: a timer around each bundle of model_run, DMA waits excluded
+    Fields with no events keep their default cost.
+    '''
+    A = np.array(counts, dtype=np.float64)
+    used = A.any(axis=0)
+    fit, *_ = np.linalg.lstsq(A[:,used], np.asarray(measured_ns, dtype=np.float64), rcond=None)
+    costs = np.array(FIRMWARE_COSTS, dtype=np.float64)
+    costs[used] = np.maximum(fit, 0)
+    return FirmwareCosts(*costs.tolist())
+
+
+def predict_bundle_latency(hw, r, engine_clocks, costs=FIRMWARE_COSTS, **kwargs):
+    '''
+    Microseconds of a bundle: engine (compute & memory, see predict_bundle_traffic) overlapped with the firmware.
+    Bank by bank, the slower of the two sets the pace, and one step of the faster one is not hidden.
+    Returns engine_us, firmware_us, latency_us
+    '''
+    counts = count_firmware_events(hw, r, **kwargs)
+    steps  = counts.transfer
+    firmware_us = sum(n*c for n, c in zip(counts, costs))/1000
+    steps_us    = firmware_us - costs.bundle/1000
+    engine_us   = engine_clocks / hw.FREQ
+    latency_us  = costs.bundle/1000 + max(engine_us, steps_us) + min(engine_us, steps_us)/steps
+    return engine_us, firmware_us, latency_us
+
+
+def get_bundle_runtime_params(hw, b, batch_size=1):
+    '''
+    Runtime params of a bundle from its recorded shapes alone (b.x_shape, b.w_shape, b.o_shape, set by XBundle.call),
+    with the same reshapes as XBundle.export. No tensors are allocated.
+    '''
+    if b.core.type == 'conv':
+        w_shape = b.w_shape
+        x_shape = (batch_size, *b.x_shape)
+    else:
+        CI, CO = b.w_shape
+        w_shape = (1, 1, CI, CO)            # (CI,CO) -> (KH,KW,CI,CO)
+        x_shape = (1, batch_size, 1, CI)    # (XN,CI) -> (XN, XH, XW, CI)
+    o_shape = (batch_size, *b.o_shape)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        r = get_runtime_params(hw=hw, w_shape=w_shape, x_shape=x_shape, o_shape=o_shape, core=b.core, pool=b.pool, flatten=b.flatten)
+    return r
+
+
+def summarize_performance(hw, rs, bundles=None, batch_size=None, costs=FIRMWARE_COSTS, calibration=None):
+    '''
+    Per-bundle & total predicted performance, from the runtime params of each bundle.
+    bundles: to take add, pooling, softmax & the next bundle from the graph. If None, bundles are assumed to be a plain chain.
+    batch_size: to report us_per_inference. costs: FirmwareCosts of the board
+    calibration: profile of run_calibration. Compute clocks come from its fit, and its error bound is reported
+    '''
     d_out = {
         'operations': [],
         'utilization_all': [],
         'clocks_all': [],
         'mem_bytes_all': [],
+        'traffic_bytes_all': [],
+        'memory_clocks_all': [],
+        'latency_clocks_all': [],
+        'bound_all': [],
+        'engine_us_all': [],
+        'firmware_us_all': [],
+        'latency_us_all': [],
     }
-    for b in BUNDLES:
-        clocks, mem_bits, utilization, operations = predict_bundle_performance(hw=hw, r=b.r)
+    for ib, r in enumerate(rs):
+        clocks, mem_bits, utilization, operations = predict_bundle_performance(hw=hw, r=r)
+        clocks_scale = 1
+        if calibration is not None:
+            clocks_scale = calibrated_clocks(calibration, r) / clocks
+            clocks = int(round(clocks * clocks_scale))
+            utilization = operations / (hw.ROWS * hw.COLS * clocks)
         d_out['operations'] += [operations]
         d_out['utilization_all'] += [utilization]
         d_out['clocks_all'] += [clocks]
         d_out['mem_bytes_all'] += [mem_bits/8]
 
-        print(f'---{b.ib}: util:{100*utilization:.2f} mem_mb:{mem_bits/1024**2:.2f} {b.r.XN=} {b.r.XH=} {b.r.XW=} {b.r.CI=} {b.r.CO=} {b.r.KH=} {b.r.KW=}')
+        is_last = ib == len(rs)-1
+        args = get_bundle_traffic_args(bundles, rs, ib) if bundles is not None else dict(next_r=None if is_last else rs[ib+1], is_last=is_last)
+        _, t = predict_bundle_traffic(hw=hw, r=r, clocks_scale=clocks_scale, **args)
+        d_out['traffic_bytes_all'] += [(sum(t.read_bits.values()) + sum(t.write_bits.values()))/8]
+        d_out['memory_clocks_all'] += [int(t.memory_clocks)]
+        d_out['latency_clocks_all'] += [int(t.latency_clocks)]
+        d_out['bound_all'] += [t.bound]
+
+        engine_us, firmware_us, latency_us = predict_bundle_latency(hw, r, t.latency_clocks, costs, **args)
+        d_out['engine_us_all'] += [float(engine_us)]
+        d_out['firmware_us_all'] += [float(firmware_us)]
+        d_out['latency_us_all'] += [float(latency_us)]
+
+        print(f'---{ib}: util:{100*utilization:.2f} mem_mb:{mem_bits/1024**2:.2f} traffic_mb:{d_out["traffic_bytes_all"][-1]/1024**2:.2f} {t.bound}-bound (compute:{clocks} memory:{int(t.memory_clocks)} clocks) latency_us:{latency_us:.2f} (engine:{engine_us:.2f} firmware:{firmware_us:.2f}) {r.XN=} {r.XH=} {r.XW=} {r.CI=} {r.CO=} {r.KH=} {r.KW=}')
     
     d_out['g_ops'] = sum(d_out['operations'])/1e9
     d_out['clocks_total'] = sum(d_out['clocks_all'])
     d_out['mem_bytes_total'] = sum(d_out['mem_bytes_all'])
+    d_out['traffic_bytes_total'] = sum(d_out['traffic_bytes_all'])
+    d_out['latency_clocks_total'] = sum(d_out['latency_clocks_all'])
+    d_out['memory_bound_bundles'] = sum(b == 'memory' for b in d_out['bound_all'])
 
     d_out['seconds_per_batch'] = d_out['clocks_total'] / (hw.FREQ * 1e6)
     d_out['frames_per_sec'] = hw.ROWS / d_out['seconds_per_batch']
     d_out['ms_per_frame'] = 1000 / d_out['frames_per_sec']
+    d_out['latency_seconds_per_batch'] = d_out['latency_clocks_total'] / (hw.FREQ * 1e6)  # engine & memory overlapped, per pass
+    d_out['us_per_batch'] = sum(d_out['latency_us_all'])                                    # end to end, with the firmware
+    d_out['calibration_error'] = calibration['error']['max_rel'] if calibration is not None else None
+    if calibration is not None:
+        print(f"Compute clocks calibrated against simulation: within {100*d_out['calibration_error']:.1f}% on {len(calibration['measured'])} micro-models")
+    if batch_size:
+        d_out['us_per_inference'] = d_out['us_per_batch'] / batch_size
+    return d_out
+
+
+def estimate_model_performance(hw, bundles, batch_size=1, costs=FIRMWARE_COSTS, calibration=None):
+    '''
+    Shape-only counterpart of predict_model_performance: no inference, no call_int, no reorders or export.
+    bundles: built XBundles in order, eg: get_bundles(model)
+    '''
+    return summarize_performance(hw, [get_bundle_runtime_params(hw, b, batch_size) for b in bundles], bundles, batch_size, costs, calibration)
+
+
+def predict_model_performance(hw, graph, costs=FIRMWARE_COSTS, calibration_dir='calibration'):
+    '''
+    graph: XGraph of an exported model, as returned by export_inference
+    Uses the calibration profile of hw in calibration_dir, if run_calibration was run for it
+    '''
+    with graph:
+        bundles = graph.bundles
+        batch_size = graph.batch_size
+        d_out = summarize_performance(hw, [b.r for b in bundles], bundles, batch_size, costs, load_calibration(hw, calibration_dir))
 
     with open('util.txt', 'w') as f:
         for line in d_out['utilization_all']:
@@ -349,4 +794,4 @@ def predict_model_performance(hw):
         for line in d_out['mem_bytes_all']:
             f.write(f"{line}\n")
 
-    return d_out
\ No newline at end of file
+    return d_out
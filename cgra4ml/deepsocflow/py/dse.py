@@ -0,0 +1,202 @@
+import numpy as np
+import itertools
+from collections import namedtuple
+from types import SimpleNamespace
+
+from deepsocflow.py.utils import *
+from deepsocflow.py.dataflow import *
+
+'''
+Design space exploration: predict_bundle_performance & predict_bundle_traffic evaluated over a grid of Hardware configurations at once.
+
+Every field of the runtime params & hardware is a NumPy array over the flattened grid, so the existing formulas
+run vectorized, one layer at a time. Thousands of configurations take milliseconds.
+'''
+
+LayerShape = namedtuple('LayerShape', ['type', 'KH', 'KW', 'CI', 'CO', 'XH', 'XW',  # per sample: batch size is a grid axis
+                                       'CYH', 'CYW', 'PYH', 'PYW',                   # after conv striding & pooling. None: unchanged
+                                       'add', 'add_out', 'pool', 'softmax', 'next'],
+                        defaults=(None, None, None, None, False, False, False, False, None))
+'''
+add, add_out, pool, softmax: what the bundle does after its last pass, as in get_bundle_traffic_args.
+next: index of the layer taking the output. None: the next one in the list, -1: none (the output only feeds residual adds)
+'''
+
+
+def pooled_size(Y, K, S, padding):
+    return (Y+S-1)//S if padding == 'same' else (Y-K+S)//S
+
+
+def get_layer_shapes(bundles):
+    '''
+    Layer shapes of built bundles, from the shapes & graph recorded by XBundle.call, eg: get_layer_shapes(get_bundles(model)).
+    No export needed. Dense layers have XH=XW=1: the batch is mapped to XH as in XBundle.export.
+    '''
+    layers = []
+    for b in bundles:
+        next_ibs = sorted(b.next_ibs)
+        flags = dict(add=b.add is not None, add_out=len(b.next_add_ibs) != 0, pool=b.pool is not None, softmax=b.softmax is not None,
+                     next=next_ibs[0] if next_ibs else -1)
+        if b.core.type != 'conv':
+            layers += [LayerShape('dense', 1, 1, *b.w_shape, 1, 1, **flags)]
+            continue
+        XH, XW = b.x_shape[:2]
+        CYH, CYW = -(-XH//b.core.strides[0]), -(-XW//b.core.strides[1])
+        PYH, PYW = CYH, CYW
+        if b.pool:
+            (PKH, PKW), (PSH, PSW), padding = b.pool.pool_layer.pool_size, b.pool.pool_layer.strides, b.pool.pool_layer.padding
+            PYH, PYW = pooled_size(CYH, PKH, PSH, padding), pooled_size(CYW, PKW, PSW, padding)
+        layers += [LayerShape('conv', *b.w_shape, XH, XW, CYH, CYW, PYH, PYW, **flags)]
+    return layers
+
+
+def clog2_vec(x):
+    return np.ceil(np.log2(x)).astype(np.int64)
+
+
+def get_runtime_params_vec(hw, layer):
+    '''
+    The fields of get_runtime_params used by the predictor & the checks of XBundle.export, as arrays over the grid.
+    hw: namespace of arrays (ROWS, COLS, RAM_WEIGHTS_DEPTH, XN...) and scalars (CONFIG_BEATS, X_PAD_MAX...)
+    '''
+    KH, KW, CI, CO = layer.KH, layer.KW, layer.CI, layer.CO
+
+    CO_PRL = hw.COLS // KW
+    EG     = np.maximum(CO_PRL, 1)             # invalid when 0, kept 1 to avoid division by zero
+    IT     = ceil_div(CO, EG)
+
+    CM     = np.maximum((hw.RAM_WEIGHTS_DEPTH - hw.CONFIG_BEATS)//KH, 1)
+    CP     = ceil_div(CI, CM)
+    CM_0   = np.where(CI % CM == 0, CM, CI % CM)
+
+    if layer.type == 'conv':
+        XN, XH, XW = hw.XN, layer.XH, layer.XW
+        CYH, CYW = (XH, XW) if layer.CYH is None else (layer.CYH, layer.CYW)
+        PYH, PYW = (CYH, CYW) if layer.PYH is None else (layer.PYH, layer.PYW)
+    else:
+        XN, XH, XW = 1, hw.XN, 1               # Dense: (XN,CI) -> (1,XN,1,CI)
+        CYH = PYH = XH
+        CYW = PYW = 1
+    XL     = ceil_div(XH, hw.ROWS)
+    X_PAD  = 0 if KH == 1 else hw.X_PAD_MAX
+
+    return SimpleNamespace(KH=KH, KW=KW, CI=CI, CO=CO, CO_PRL=CO_PRL, EG=EG, IT=IT, CM=CM, CP=CP, CM_0=CM_0,
+                           XN=XN, XH=XH, XW=XW, XL=XL, X_PAD=X_PAD, CYH=CYH, CYW=CYW, PYH=PYH, PYW=PYW)
+
+
+def check_runtime_params_vec(hw, r):
+    '''
+    Same constraints as XBundle.export & create_headers, as a boolean array over the grid
+    '''
+    cm_max = np.where(r.CP == 1, r.CM_0, r.CM)
+    EDGES  = cm_max * r.XW
+    edges_ok = True if (hw.RAM_EDGES_DEPTH is None or r.KH == 1) else (EDGES <= hw.RAM_EDGES_DEPTH)
+    ACC_WIDTH = hw.K_BITS + hw.X_BITS + clog2_vec(r.KH*r.KW*r.CM)
+
+    return ((r.CO_PRL >= 1) & ((hw.RAM_WEIGHTS_DEPTH - hw.CONFIG_BEATS)//r.KH >= 1) &
+            (r.KH <= hw.KH_MAX) & (r.KW <= hw.KW_MAX) & (r.CM <= hw.CI_MAX) &
+            (r.XH <= hw.XH_MAX) & (r.XW <= hw.XW_MAX) & (r.XN <= hw.XN_MAX) &
+            edges_ok &
+            (r.XW >= r.KH//2) & (ACC_WIDTH <= hw.Y_BITS))
+
+
+def get_grid(hw, processing_elements, ram_weights_depth, frequency_mhz, axi_width, batch_size):
+    '''
+    Flattened cartesian product of the swept parameters, on top of the fixed fields of hw
+    '''
+    grid = list(itertools.product(processing_elements, ram_weights_depth, frequency_mhz, axi_width, batch_size))
+    PE, RAM_WEIGHTS_DEPTH, FREQ, AXI_WIDTH, XN = [np.array(a) for a in zip(*grid)]
+    g = SimpleNamespace(**{k: getattr(hw, k) for k in ['X_BITS', 'K_BITS', 'Y_BITS', 'CONFIG_BEATS', 'X_PAD_MAX', 'KH_MAX', 'KW_MAX', 'CI_MAX', 'XH_MAX', 'XW_MAX', 'XN_MAX', 'RAM_EDGES_DEPTH', 'HEADER_WIDTH',
+                                                         'BITS_KW2', 'BITS_CIN_MAX', 'BITS_COLS_MAX', 'BITS_XN_MAX', 'B_BITS', 'Y_OUT_BITS', 'AXI_MAX_BURST_LEN']})
+    g.ROWS, g.COLS, g.RAM_WEIGHTS_DEPTH, g.FREQ, g.AXI_WIDTH, g.XN = PE[:,0], PE[:,1], RAM_WEIGHTS_DEPTH, FREQ, AXI_WIDTH, XN
+    g.L_MAX = np.ceil(hw.XH_MAX//g.ROWS).astype(np.int64)
+    g.BITS_BLOCKS_MAX = clog2_vec(g.L_MAX)
+    g.BITS_RAM_WEIGHTS_ADDR = clog2_vec(g.RAM_WEIGHTS_DEPTH)
+    return g
+
+
+def pareto_front(objectives):
+    '''
+    objectives: (N, M) array, all to be minimized. Returns a boolean mask of the non-dominated rows (ties are kept).
+    Each front member prunes the rows it dominates, so the cost is O(N * size of the front), not O(N^2).
+    '''
+    F = np.asarray(objectives, dtype=np.float64)
+    order = np.lexsort(F.T[::-1])              # front members come early, and prune the most
+    F, idx = F[order], order
+    i = 0
+    while i < len(F):
+        keep = np.any(F < F[i], axis=1) | np.all(F == F[i], axis=1)  # not dominated by row i
+        F, idx = F[keep], idx[keep]
+        i = np.count_nonzero(keep[:i]) + 1
+    mask = np.zeros(len(order), dtype=bool)
+    mask[idx] = True
+    return mask
+
+
+def explore(layers, hw, processing_elements, ram_weights_depth, frequency_mhz, axi_width, batch_size,
+            objectives=(('frames_per_sec', 'max'), ('pes', 'min'), ('ram_weights_bits', 'min'))):
+    '''
+    Evaluates predicted performance of the model over the grid of the given parameters. Other parameters are taken from hw.
+    layers: list of LayerShape, eg: get_layer_shapes(get_bundles(model))
+
+    Returns a dict of arrays over the flattened grid:
+        ROWS, COLS, RAM_WEIGHTS_DEPTH, FREQ, AXI_WIDTH, XN : the configuration
+        valid         : meets the constraints of XBundle.export for every layer
+        clocks        : compute clocks of the engine
+        memory_clocks : clocks of the DMA & firmware streams over AXI_WIDTH (predict_bundle_traffic)
+        latency_clocks: per pass, the max of compute & memory clocks. Sets seconds_per_batch & frames_per_sec
+        memory_bound_layers : layers whose latency is dominated by memory bound passes
+        mem_bytes, operations, utilization (of the PEs, over latency_clocks), frames_per_sec, pes, ram_weights_bits
+        pareto        : valid & not dominated on objectives
+    '''
+    g = get_grid(hw, processing_elements, ram_weights_depth, frequency_mhz, axi_width, batch_size)
+    N = g.ROWS.size
+
+    header_bits = g.BITS_KW2 + g.BITS_COLS_MAX + g.BITS_BLOCKS_MAX + 2*g.BITS_CIN_MAX + g.BITS_XN_MAX + 2*g.BITS_RAM_WEIGHTS_ADDR
+    valid = header_bits <= g.HEADER_WIDTH
+    clocks, mem_bits, operations = np.zeros(N, np.int64), np.zeros(N, np.int64), np.zeros(N, np.int64)
+    memory_clocks, latency_clocks, memory_bound = np.zeros(N, np.int64), np.zeros(N, np.int64), np.zeros(N, np.int64)
+
+    rs = [get_runtime_params_vec(g, layer) for layer in layers]
+    for i, (layer, r) in enumerate(zip(layers, rs)):
+        valid &= check_runtime_params_vec(g, r)
+        clocks_l, mem_bits_l, _, operations_l = predict_bundle_performance(hw=g, r=r)
+        clocks += clocks_l
+        mem_bits += mem_bits_l
+        operations += operations_l
+
+        i_next = i+1 if layer.next is None else layer.next
+        _, t = predict_bundle_traffic(hw=g, r=r, add=layer.add, add_out=layer.add_out, pool=layer.pool, softmax=layer.softmax,
+                                      next_r=rs[i_next] if 0 <= i_next < len(rs) else None, is_last=i == len(layers)-1)
+        memory_clocks += t.memory_clocks
+        latency_clocks += t.latency_clocks
+        memory_bound += t.bound == 'memory'
+
+    d = {'ROWS': g.ROWS, 'COLS': g.COLS, 'RAM_WEIGHTS_DEPTH': g.RAM_WEIGHTS_DEPTH, 'FREQ': g.FREQ, 'AXI_WIDTH': g.AXI_WIDTH, 'XN': g.XN}
+    d['valid'] = valid
+    d['clocks'] = clocks
+    d['memory_clocks'] = memory_clocks
+    d['latency_clocks'] = latency_clocks
+    d['memory_bound_layers'] = memory_bound
+    d['mem_bytes'] = mem_bits / 8
+    d['operations'] = operations
+    d['utilization'] = operations / (g.ROWS * g.COLS * latency_clocks)
+    d['seconds_per_batch'] = latency_clocks / (g.FREQ * 1e6)
+    d['frames_per_sec'] = g.XN / d['seconds_per_batch']
+    d['pes'] = g.ROWS * g.COLS
+    d['ram_weights_bits'] = 2 * g.RAM_WEIGHTS_DEPTH * g.COLS * g.K_BITS  # two weights RAMs of width K_BITS*COLS
+
+    F = np.stack([d[k] if sense == 'min' else -d[k] for k, sense in objectives], axis=-1)
+    pareto = np.zeros(N, dtype=bool)
+    pareto[valid] = pareto_front(F[valid])
+    d['pareto'] = pareto
+    return d
+
+
+def pareto_table(d, sort_by='frames_per_sec'):
+    '''
+    Rows of the Pareto front as a list of dicts, best first
+    '''
+    idx = np.flatnonzero(d['pareto'])
+    idx = idx[np.argsort(-d[sort_by][idx])]
+    return [{k: d[k][i].item() for k in d} for i in idx]
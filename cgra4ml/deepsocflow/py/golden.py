@@ -0,0 +1,246 @@
+import numpy as np
+import math
+
+from deepsocflow.py.utils import shift_round, div_round
+
+IM2COL_BLOCK_ELEMS = 2**24  # max elements of an im2col block, bounds the memory of conv2d_int
+F64_EXACT_BITS = 53         # float64 GEMM is exact while every partial sum stays below 2**53
+
+
+def _abs_max(a):
+    return max(-int(np.min(a, initial=0)), int(np.max(a, initial=0))) # np.abs wraps at the min of narrow ints
+
+
+def matmul_int(x, w):
+    '''
+    Exact integer matmul with int64 result.
+    Uses float64 BLAS when the accumulator is bounded below 2**53 (always, for X_BITS,K_BITS <= 8), else int64 matmul.
+    '''
+    if _abs_max(x) * _abs_max(w) * x.shape[-1] < 2**F64_EXACT_BITS:
+        return (x.astype(np.float64) @ w.astype(np.float64)).astype(np.int64)
+    return x.astype(np.int64) @ w.astype(np.int64)
+
+
+def get_same_pad(X, K, S):
+    '''Returns (Y, pad_before, pad_after) of padding='same', as in TF'''
+    Y = (X+S-1)//S
+    pad = max((Y-1)*S + K - X, 0)
+    return Y, pad//2, pad-pad//2
+
+
+def im2col_blocks(x, KH, KW, strides=(1,1), block_elems=IM2COL_BLOCK_ELEMS, dtype=np.float64):
+    '''
+    Yields (yh_beg, yh_end, cols) for blocks of output rows of a padding='same' conv.
+    cols: (XN*(yh_end-yh_beg)*YW, CI*KH*KW), columns ordered as (CI, KH, KW), so that each input channel is a contiguous slice.
+    '''
+    XN, XH, XW, CI = x.shape
+    CSH, CSW = strides
+    YH, pt, pb = get_same_pad(XH, KH, CSH)
+    YW, pl, pr = get_same_pad(XW, KW, CSW)
+
+    xp = np.pad(x.astype(dtype), ((0,0),(pt,pb),(pl,pr),(0,0)))
+    win = np.lib.stride_tricks.sliding_window_view(xp, (KH,KW), axis=(1,2))[:, ::CSH, ::CSW][:, :YH, :YW] # (XN, YH, YW, CI, KH, KW)
+
+    rows = max(1, block_elems // (XN*YW*CI*KH*KW))
+    for yh_beg in range(0, YH, rows):
+        yh_end = min(yh_beg+rows, YH)
+        yield yh_beg, yh_end, win[:, yh_beg:yh_end].reshape(-1, CI*KH*KW)
+
+
+def conv2d_int(x, w, strides=(1,1), ci_splits=None, dtype=np.int64, block_elems=IM2COL_BLOCK_ELEMS):
+    '''
+    Exact integer conv2d with padding='same', by blocked im2col & GEMM.
+    x: (XN, XH, XW, CI), w: (KH, KW, CI, CO). Returns (XN, YH, YW, CO)
+
+    ci_splits: channels per pass, eg. [CM_0, CM, CM...]. Returns partial sums of each pass: (P, XN, YH, YW, CO).
+        Each im2col block is shared by all passes, since a pass is a contiguous slice of its columns.
+    '''
+    XN, XH, XW, CI = x.shape
+    KH, KW, _, CO = w.shape
+    YH, YW = get_same_pad(XH, KH, strides[0])[0], get_same_pad(XW, KW, strides[1])[0]
+
+    c_bounds = np.cumsum([0] + list(ci_splits if ci_splits is not None else [CI])) * KH*KW
+    assert c_bounds[-1] == CI*KH*KW, f"Sum of ci_splits {ci_splits} != CI:{CI}"
+
+    f64_exact = _abs_max(x) * _abs_max(w) * KH*KW*CI < 2**F64_EXACT_BITS
+    mat_dtype = np.float64 if f64_exact else np.int64
+    w_mat = w.transpose(2,0,1,3).reshape(CI*KH*KW, CO).astype(mat_dtype)  # (CI*KH*KW, CO)
+
+    y = np.zeros((len(c_bounds)-1, XN, YH, YW, CO), dtype=dtype)
+    for yh_beg, yh_end, cols in im2col_blocks(x, KH, KW, strides, block_elems, mat_dtype):
+        for ip, (c_beg, c_end) in enumerate(zip(c_bounds[:-1], c_bounds[1:])):
+            y[ip, :, yh_beg:yh_end] = (cols[:, c_beg:c_end] @ w_mat[c_beg:c_end]).reshape(XN, yh_end-yh_beg, YW, CO)
+    return y if ci_splits is not None else y[0]
+
+
+def act_int(x, non_zero, plog_slope, shift_bits, bits):
+    '''Quantized (leaky) relu, as quant_lrelu in the firmware: scale, shift_round & clip'''
+    x = np.asarray(x, dtype=np.int64)
+    x = ((x < 0) * x) * non_zero + (((x > 0) * x) << plog_slope)
+    x = shift_round(x, shift_bits) # = np.around(x/2**shift_bits)
+    return np.clip(x, -2**(bits - plog_slope - 1), 2**(bits-1)-1)
+
+
+def softmax_float(x):
+    '''Float32 softmax as computed in the firmware. Returns (max, softmax)'''
+    x = np.asarray(x, dtype=np.float32)
+    x_max = x.max()
+    exp = np.exp(x - x_max).astype(np.float32)
+    return x_max, exp/np.sum(exp, axis=1, dtype=np.float32)[0]
+
+
+def get_pool_out_shape(YH, YW, pool_size, strides, padding):
+    '''Returns (PXH, PXW, p_st, q_st): pooled height & width, and top/left padding'''
+    PKH, PKW = pool_size
+    PSH, PSW = strides
+
+    if padding == "same":
+        PXH = (YH+PSH-1)//PSH
+        PXW = (YW+PSW-1)//PSW
+        p_st = max((PSH*(PXH-1)+PKH-YH)//2, 0)
+        q_st = max((PSW*(PXW-1)+PKW-YW)//2, 0)
+    else:
+        PXH = (YH-PKH+PSH)//PSH
+        PXW = (YW-PKW+PSW)//PSW
+        p_st = q_st = 0
+    return PXH, PXW, p_st, q_st
+
+
+def pool_windows(Y, PK, PS, PX, p_st):
+    '''
+    Window [lo, hi] (inclusive) along one axis for every pooled index, as computed by the edge sweep
+    in pool_int_reference & the firmware. Pooled indices that are never written are marked invalid.
+
+    Rows are visited as the bottom edge (iy) of a window. The unique valid iy in the last stride
+    [Y-PS, Y) sweeps the remaining pooled indices, moving both edges by PS, and clipping the bottom at Y-1.
+    '''
+    ix = np.arange(PX)
+    iy = PS*ix - p_st + PK - 1                  # bottom edge of the window of each ix
+    lo = np.maximum(PS*ix - p_st, 0)
+    hi = iy.copy()
+    valid = (iy >= 0) & (iy < Y)
+
+    sweep = np.flatnonzero(valid & (iy >= Y-PS))
+    if sweep.size:
+        ix_s = sweep[0]
+        j = ix[ix_s:] - ix_s
+        lo[ix_s:] = lo[ix_s] + j*PS
+        hi[ix_s:] = np.minimum(iy[ix_s] + j*PS, Y-1)
+        valid[ix_s:] = True
+
+    lo[~valid] = hi[~valid] = 0
+    return lo, hi, valid
+
+
+def _window_max(arr, axis, lo, hi, PK):
+    '''Max over [lo, hi] windows along axis, using a strided window view padded with int min'''
+    pad = [(0,0)]*arr.ndim
+    pad[axis] = (0, PK-1)
+    fill = np.iinfo(arr.dtype).min
+    windows = np.lib.stride_tricks.sliding_window_view(np.pad(arr, pad, constant_values=fill), PK, axis=axis)
+    windows = np.take(windows, lo, axis=axis)   # (..., PX, ..., PK)
+
+    mask_shape = [1]*windows.ndim
+    mask_shape[axis], mask_shape[-1] = lo.size, PK
+    mask = (np.arange(PK)[None,:] <= (hi-lo)[:,None]).reshape(mask_shape)
+    return np.where(mask, windows, fill).max(axis=-1)
+
+
+def _window_sum(arr, axis, lo, hi):
+    '''Sum over [lo, hi] windows along axis, using a cumulative sum'''
+    pad = [(0,0)]*arr.ndim
+    pad[axis] = (1, 0)
+    cs = np.pad(np.cumsum(arr, axis=axis), pad)
+    return np.take(cs, hi+1, axis=axis) - np.take(cs, lo, axis=axis)
+
+
+def pool_int(in_arr, type, pool_size, strides, padding):
+    '''
+    Integer max/avg pooling, bit-exact with pool_int_reference (and the firmware).
+    Windows are separable, so rows are reduced first, then columns. Runs in time linear in tensor size.
+    '''
+    in_arr = np.asarray(in_arr).astype(np.int64)
+    YN, YH, YW, YC = in_arr.shape
+    PKH, PKW = pool_size
+    PSH, PSW = strides
+    PXH, PXW, p_st, q_st = get_pool_out_shape(YH, YW, pool_size, strides, padding)
+
+    h_lo, h_hi, h_valid = pool_windows(YH, PKH, PSH, PXH, p_st)
+    w_lo, w_hi, w_valid = pool_windows(YW, PKW, PSW, PXW, q_st)
+
+    if type == 'max':
+        out_arr = _window_max(in_arr , 1, h_lo, h_hi, PKH)
+        out_arr = _window_max(out_arr, 2, w_lo, w_hi, PKW)
+    else:
+        out_arr = _window_sum(in_arr , 1, h_lo, h_hi)
+        out_arr = _window_sum(out_arr, 2, w_lo, w_hi)
+        count = (h_hi-h_lo+1)[:,None] * (w_hi-w_lo+1)[None,:]
+        out_arr = div_round(out_arr, count[None,:,:,None])
+
+    out_arr[:,~h_valid,:,:] = 0
+    out_arr[:,:,~w_valid,:] = 0
+    return out_arr
+
+
+def pool_int_reference(in_arr, type, pool_size, strides, padding):
+    '''
+    Pixel-by-pixel pooling, mirroring the loops in the firmware (runtime.h). Slow, kept to check pool_int.
+    '''
+    YN, YH, YW, YC = in_arr.shape
+    PKH, PKW = pool_size
+    PSH, PSW = strides
+    PXH, PXW, p_st, q_st = get_pool_out_shape(YH, YW, pool_size, strides, padding)
+
+    out_arr = np.zeros((YN, PXH, PXW, YC), dtype=int)
+
+    for n in range(YN):
+        for ic in range(YC):
+            for iyh in range(YH):
+                for iyw in range(YW):
+
+                    ph_end_const = iyh # iy(h,w) is the bottom-right of pooling window -> All values in pooling window have been computed
+                    pw_end_const = iyw
+
+                    ixh_before_stride = iyh+p_st-PKH+1
+                    ixw_before_stride = iyw+q_st-PKW+1
+
+                    ixh_beg = int(ixh_before_stride/PSH) # ix(hw) that corresponds to the pooling window
+                    ixw_beg = int(ixw_before_stride/PSW)
+                    if (ixh_before_stride % PSH != 0) or (ixw_before_stride % PSW != 0): # ix(hw) that corresponds to the window is skipped by pool striding
+                        continue
+
+                    if ixh_beg < 0 or ixw_beg <0: # skip with target ix(h,w) < 0
+                        continue
+
+                    ph_beg_const = max(PSH*ixh_beg-p_st, 0)-1 # p(h,w)_beg is the index of top left corner of pooling window. If negative, set to zero
+                    pw_beg_const = max(PSW*ixw_beg-q_st, 0)-1
+
+                    xh_sweep = PXH if iyh >= YH-PSH else ixh_beg+1 # ix(hw) is sweeped from ix(hw)_beg to x(h,w)_sweep. Normally sweep is 1.
+                    xw_sweep = PXW if iyw >= YW-PSW else ixw_beg+1 # But when iy(h,w) is at its edges, need to compute remaining ix(hw) pixels by sweeping
+
+                    ''' Handling edges '''
+                    ph_end, ph_beg = ph_end_const, ph_beg_const
+                    for ixh in range(ixh_beg, xh_sweep):
+                        pw_end, pw_beg = pw_end_const, pw_beg_const # move the pooling window back to start of sweep
+                        for ixw in range(ixw_beg, xw_sweep):
+
+                            ''' Pooling Window '''
+                            result = -math.inf if type == 'max' else 0
+                            for ipyh in range(ph_end, ph_beg,-1):
+                                for ipyw in range(pw_end, pw_beg,-1):
+
+                                    if type=='max':
+                                        result = max(result, in_arr[n,ipyh,ipyw,ic])
+                                    else:
+                                        result += in_arr[n,ipyh,ipyw,ic]
+
+                            count  = (ph_end-ph_beg)*(pw_end-pw_beg)
+                            result = result if type=='max' else div_round(result, count)
+                            ''' Writing '''
+                            out_arr[n,ixh,ixw,ic] = result
+
+                            pw_beg += PSW # move pooling window by stride
+                            pw_end = min(pw_end+PSW, YW-1)
+                        ph_beg += PSH # move pooling window by stride
+                        ph_end = min(ph_end+PSH, YH-1)
+    return out_arr
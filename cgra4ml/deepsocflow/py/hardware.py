@@ -3,7 +3,10 @@ import json
 import os
 import subprocess
 import glob
+import shutil
 from deepsocflow.py.utils import *
+from deepsocflow.py.cache import *
+from deepsocflow.py.cycles import *
 import deepsocflow
 import time
 
@@ -207,25 +210,71 @@ set CONFIG_BASEADDR    0x{self.CONFIG_BASEADDR}
 
 
 
-    def simulate(self, SIM='verilator', SIM_PATH=''):
+    def build_fingerprint(self, SIM, cmd, SIM_PATH=''):
+        '''
+        Hash of everything a compiled RTL model depends on: RTL & testbench sources, SV headers (config_hw.svh, config_tb.svh),
+        the compile commands and the simulator version. Firmware (sim.c, runtime.h, config_fw.h) is left out: it is rebuilt on its own.
+        '''
+        version_cmd = {'verilator': 'verilator --version', 'xsim': 'xvlog --version', 'icarus': 'iverilog -V'}[SIM]
+        version = subprocess.run(f'{SIM_PATH}{version_cmd}', shell=True, capture_output=True, text=True).stdout
+
+        headers = glob.glob(f"{self.MODULE_DIR}/rtl/**/*.svh", recursive=True) + glob.glob(f"{self.MODULE_DIR}/test/sv/**/*.svh", recursive=True)
+        files = sorted(set([os.path.normpath(s) for s in self.SOURCES + headers] + ['config_hw.svh', 'config_tb.svh']))
+        contents = [(f, open(f, 'rb').read() if os.path.exists(f) else None) for f in files]
+        return hash_content(SIM, cmd, version, contents)
+
 
+    def simulate(self, SIM='verilator', SIM_PATH='', cache_dir=None):
+        '''
+        cache_dir: shared directory of compiled RTL models, keyed by build_fingerprint. On a hit, the RTL is not compiled again:
+            verilator: the cached model is restored into build/ and only the firmware object (sim.o) is rebuilt & relinked
+            xsim     : the cached xsim.dir snapshot is restored, only the DPI library (sim.c) is compiled
+            icarus   : the cached build/a.out is restored (no firmware in this flow)
+        '''
         os.makedirs('build', exist_ok=True)
         print("\n\nCOMPILING...\n\n")
 
         if SIM == 'xsim':
-            assert subprocess.run(cwd="build", shell=True, args=fr'{SIM_PATH}xsc {self.MODULE_DIR}/c/sim.c --gcc_compile_options -I../ --gcc_compile_options -DSIM').returncode == 0
-            assert subprocess.run(cwd="build", shell=True, args=fr'{SIM_PATH}xvlog -sv -f ../sources.txt -i ../').returncode == 0
-            assert subprocess.run(cwd="build", shell=True, args=fr'{SIM_PATH}xelab {self.TB_MODULE} --snapshot {self.TB_MODULE} -log elaborate.log --debug typical -sv_lib dpi').returncode == 0
+            cmds = [fr'{SIM_PATH}xvlog -sv -f ../sources.txt -i ../', fr'{SIM_PATH}xelab {self.TB_MODULE} --snapshot {self.TB_MODULE} -log elaborate.log --debug typical -sv_lib dpi']
+            cached = f'{cache_dir}/xsim/{self.build_fingerprint(SIM, cmds, SIM_PATH)}' if cache_dir else None
+            hit = cached and os.path.exists(cached)
+            if hit:
+                print(f"Restoring compiled model from {cached}")
+                restore_dir(cached, 'build/xsim.dir') # before xsc, which writes the DPI library into xsim.dir
+            assert subprocess.run(cwd="build", shell=True, args=fr'{SIM_PATH}xsc {self.MODULE_DIR}/c/sim.c --gcc_compile_options -I../ --gcc_compile_options -DSIM --gcc_compile_options -DTRACE_CYCLES').returncode == 0
+            if not hit:
+                for cmd in cmds:
+                    assert subprocess.run(cwd="build", shell=True, args=cmd).returncode == 0
+                if cached:
+                    store_dir('build/xsim.dir', cached)
 
         if SIM == 'icarus':
             cmd = [ "iverilog", "-v", "-g2012", "-o", "build/a.out", "-I", "sv", "-s", self.TB_MODULE] + self.SOURCES
-            print(" ".join(cmd))
-            assert subprocess.run(cmd).returncode == 0
+            cached = f'{cache_dir}/icarus/{self.build_fingerprint(SIM, cmd)}.out' if cache_dir else None
+            if cached and os.path.exists(cached):
+                print(f"Restoring compiled model from {cached}")
+                shutil.copy2(cached, 'build/a.out')
+            else:
+                print(" ".join(cmd))
+                assert subprocess.run(cmd).returncode == 0
+                if cached:
+                    store_file('build/a.out', cached)
 
         if SIM == "verilator":
-            cmd = f'{SIM_PATH}verilator --binary -j 0 -O3 --relative-includes --top {self.TB_MODULE} -I../ -F ../sources.txt -CFLAGS -DSIM -CFLAGS -I../ {self.MODULE_DIR}/c/sim.c -CFLAGS -g --Mdir ./ -Wno-WIDTHTRUNC -Wno-WIDTHEXPAND -Wno-ASCRANGE -Wno-CASEINCOMPLETE -Wno-INITIALDLY'
-            print(cmd)
-            assert subprocess.run(cmd.split(' '), cwd='build').returncode == 0
+            cmd = f'{SIM_PATH}verilator --binary -j 0 -O3 --relative-includes --top {self.TB_MODULE} -I../ -F ../sources.txt -CFLAGS -DSIM -CFLAGS -DTRACE_CYCLES -CFLAGS -I../ {self.MODULE_DIR}/c/sim.c -CFLAGS -g --Mdir ./ -Wno-WIDTHTRUNC -Wno-WIDTHEXPAND -Wno-ASCRANGE -Wno-CASEINCOMPLETE -Wno-INITIALDLY'
+            cached = f'{cache_dir}/verilator/{self.build_fingerprint(SIM, cmd, SIM_PATH)}' if cache_dir else None
+            if cached and os.path.exists(cached):
+                print(f"Restoring compiled model from {cached}")
+                restore_dir(cached, 'build')
+                for f in ['sim.o', f'V{self.TB_MODULE}']: # firmware may differ from the cached build: always rebuild it
+                    if os.path.exists(f'build/{f}'):
+                        os.remove(f'build/{f}')
+                assert subprocess.run(['make', '-j', '-f', f'V{self.TB_MODULE}.mk'], cwd='build').returncode == 0
+            else:
+                print(cmd)
+                assert subprocess.run(cmd.split(' '), cwd='build').returncode == 0
+                if cached:
+                    store_dir('build', cached, ignore=shutil.ignore_patterns('*.csv', '*.vcd', '*.fst', '*.log', 'xsim*', 'a.out'))
         print("\n\nSIMULATING...\n\n")
         start = time.time()
 
@@ -240,6 +289,10 @@ set CONFIG_BASEADDR    0x{self.CONFIG_BASEADDR}
         
         print(f"\n\nSIMULATION TIME: {time.time()-start:.2f} seconds\n\n")
 
+        if SIM != 'icarus' and os.path.exists('build/cycles_fw.csv'):
+            print("CYCLES PER BUNDLE (timeline: build/cycles.json, open in ui.perfetto.dev)\n")
+            print_bundle_cycles(export_cycle_trace(self, 'build'))
+
 
     def export_vivado_tcl(self, board='zcu104', rtl_dir_abspath=None, scripts_dir_abspath=None, board_tcl_abspath=None):
 
@@ -0,0 +1,117 @@
+import os
+import sys
+import csv
+import time
+import itertools
+import traceback
+import multiprocessing
+import numpy as np
+
+from deepsocflow.py.cache import *
+from deepsocflow.py.hardware import *
+from deepsocflow.py.dataflow import *
+
+'''
+Parallel hardware parameter sweeps.
+
+Hardware.export, export_inference & Hardware.simulate write fixed file names (config_*.svh, config_fw.h, sources.txt,
+hardware.json, build/, vectors/) into the working directory. run_sweep gives each point its own workspace directory and
+runs it in its own process, so N points run side by side on N cores, sharing only the (process-safe) caches.
+'''
+
+
+def product_dict(**kwargs):
+    for instance in itertools.product(*(kwargs.values())):
+        yield dict(zip(kwargs.keys(), instance))
+
+
+def workspace_name(i, params):
+    return f"{i:03d}_{hash_content(params)[:8]}"
+
+
+def _run_point(args):
+    '''
+    Runs one point inside its workspace. A fresh process per point: no TF state leaks between points.
+    '''
+    job, i, params, workspace = args
+    os.makedirs(workspace, exist_ok=True)
+    os.chdir(workspace)
+
+    log = open('log.txt', 'w')
+    os.dup2(log.fileno(), 1) # redirect at fd level, to catch the simulator's output too
+    os.dup2(log.fileno(), 2)
+
+    row = {'point': i, 'workspace': workspace, **params}
+    start = time.time()
+    try:
+        result = job(params) or {}
+        row.update({k:v for k,v in result.items() if np.isscalar(v)}) # lists per bundle stay in the workspace
+        row['status'] = 'passed'
+    except BaseException as e:
+        traceback.print_exc()
+        row['status'] = f'failed: {type(e).__name__}: {str(e)[:200]}'
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    row['seconds'] = round(time.time()-start, 2)
+    return row
+
+
+def run_sweep(job, points, root='sweep', workers=None, mp_context='spawn'):
+    '''
+    job: called as job(params) with the workspace as working directory, returns a dict (scalars go into the table) or None.
+         Must be picklable: a module-level function, or functools.partial of one. Use absolute paths in its arguments.
+    points: list of dicts of Hardware parameters, eg: list(product_dict(...))
+    workers: processes running points at once. None: one per cpu.
+    mp_context: 'spawn' starts clean processes: the job loads everything itself (eg: the saved model). They import the main script
+                again (as __mp_main__), for its model classes: guard what they must not redo, eg: saving the model.
+                'fork' shares what the parent already loaded, but forks its TF threads in whatever state they are.
+
+    Returns the rows of the results table, also written to {root}/results.csv. Stdout of each point is in its workspace/log.txt
+    '''
+    root = os.path.abspath(root)
+    os.makedirs(root, exist_ok=True)
+    workers = min(workers or os.cpu_count(), len(points))
+
+    tasks = [(job, i, params, f'{root}/{workspace_name(i, params)}') for i, params in enumerate(points)]
+    print(f"Running {len(points)} points on {workers} processes, in {root}")
+
+    rows = []
+    with multiprocessing.get_context(mp_context).Pool(workers, maxtasksperchild=1) as pool:
+        for row in pool.imap_unordered(_run_point, tasks):
+            print(f"Point {row['point']}: {row['status']} in {row['seconds']} s")
+            rows += [row]
+    rows = sorted(rows, key=lambda row: row['point'])
+
+    fields = list(dict.fromkeys(k for row in rows for k in row))
+    with open(f'{root}/results.csv', 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+    print_table(rows, fields)
+    return rows
+
+
+def print_table(rows, fields):
+    width = {k: max(len(str(k)), *(len(str(row.get(k, ''))) for row in rows)) for k in fields}
+    print(' | '.join(f'{k:<{width[k]}}' for k in fields))
+    for row in rows:
+        print(' | '.join(f'{str(row.get(k, "")):<{width[k]}}' for k in fields))
+
+
+def verify_point(params, model_path, SIM='verilator', SIM_PATH='', batch_size=1, backend='tf', vector_format='txt', cache_dir=None):
+    '''
+    Standard sweep job: export the hardware & the model, simulate, verify, and return the predicted performance.
+    model_path & cache_dir should be absolute, the job runs inside its workspace. batch_size None: hw.ROWS of the point.
+    '''
+    from qkeras.utils import load_qmodel
+    from deepsocflow.py.xmodel import export_inference, verify_inference
+    model = load_qmodel(model_path)
+
+    hw = Hardware(**params)
+    hw.export_json()
+    hw.export() # Generates: config_hw.svh, config_hw.tcl
+
+    graph = export_inference(model, hw, batch_size=batch_size or hw.ROWS, backend=backend, vector_format=vector_format, cache_dir=cache_dir)
+    verify_inference(model, hw, SIM=SIM, SIM_PATH=SIM_PATH, vector_format=vector_format, cache_dir=cache_dir, workers=1, graph=graph) # a point per core already
+    return predict_model_performance(hw, graph)
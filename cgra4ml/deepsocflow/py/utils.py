@@ -1,12 +1,167 @@
-import tensorflow as tf 
-from tensorflow import keras
-from qkeras import *
 import numpy as np
+import threading
+from contextvars import ContextVar
 
-BUNDLES = []
 
-@keras.saving.register_keras_serializable()
-class SYS_BITS:
+class XGraph:
+    '''
+    Bundles of one model, in the order they were called, and the per call state of their layers (see GraphState):
+    the edges recorded by XBundle.call (ib, prev_ib, next_ibs, next_add_ibs, add.source_ib), the outputs & the golden
+    and export results. XModel.__call__ opens a new graph unless one is active:
+        with XGraph() as graph:
+            model(x)
+    The active graph is a context variable: threads & tasks each register into their own. Two graphs over one model
+    keep their own state, read & written on the layers while the graph is active.
+    '''
+    def __init__(self):
+        self.bundles = []
+        self.batch_size = None # of the forward pass, set by golden_forward
+        self.states = {}       # layer -> {attribute: value}
+        self._tokens = []
+
+    def __enter__(self):
+        self._tokens.append(CURRENT_GRAPH.set(self))
+        return self
+
+    def __exit__(self, *args):
+        CURRENT_GRAPH.reset(self._tokens.pop())
+
+    def add(self, bundle):
+        '''
+        Registers a bundle called in this graph. Its consumers are called after it & record themselves on it again.
+        '''
+        state = self.state(bundle)
+        state.update(ib=len(self.bundles), prev_ib=None, next_ibs=[], next_add_ibs=[])
+        self.bundles.append(bundle)
+        return state['ib']
+
+    def state(self, layer):
+        '''
+        Per call attributes of layer in this graph, from layer.graph_defaults() on first use
+        '''
+        state = self.states.get(layer)
+        if state is None:
+            state = self.states[layer] = layer.graph_defaults()
+        layer.__dict__['_last_graph'] = self # bypasses Keras attribute tracking
+        return state
+
+    def copy(self):
+        '''
+        Graph of the same bundles, from a copy of the state of each layer: attributes set while it is active do not reach this one.
+        The values are shared, so they are replaced (as export does), never changed in place.
+        '''
+        graph = XGraph()
+        graph.bundles, graph.batch_size = list(self.bundles), self.batch_size
+        graph.states = {layer: dict(state) for layer, state in self.states.items()}
+        return graph
+
+
+CURRENT_GRAPH = ContextVar('CURRENT_GRAPH', default=None)
+
+
+def current_graph():
+    return CURRENT_GRAPH.get()
+
+
+class GraphState:
+    '''
+    Mixin of the layers of an XBundle. Attributes named in GRAPH_STATE are per call: they are kept in the active XGraph,
+    keyed by layer, else in the graph the layer was last used in (or on the layer, if it was never called).
+    Each graph starts from graph_defaults().
+    '''
+    GRAPH_STATE = ()
+
+    def graph_defaults(self):
+        return {}
+
+    def graph_state(self):
+        graph = current_graph() or self.__dict__.get('_last_graph')
+        if graph is None:
+            return self.__dict__.setdefault('_graph_state', self.graph_defaults())
+        return graph.state(self)
+
+    def __setattr__(self, name, value):
+        if name in type(self).GRAPH_STATE:
+            self.graph_state()[name] = value
+        else:
+            super().__setattr__(name, value)
+
+    def __getattr__(self, name): # only called when the usual lookup fails
+        if name in type(self).GRAPH_STATE:
+            state = self.graph_state()
+            if name in state:
+                return state[name]
+        getattr_ = getattr(super(), '__getattr__', None)
+        if getattr_ is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return getattr_(name)
+
+
+VERIFY_LEVELS = ['off', 'sampled', 'full']
+VERIFY = {'level': 'full', 'samples': 1024, 'seed': 0}
+VERIFY_LOCK = threading.Lock()
+
+
+def set_verify(level='full', samples=None):
+    '''
+    Cross-checks of the integer golden model (call_int, XTensor.valid) against the float Keras model:
+        full    : every element
+        sampled : the same `samples` random elements of each pair of tensors
+        off     : none. export_inference then traces the Keras model symbolically, only to build the graph
+    '''
+    assert level in VERIFY_LEVELS, f"Verification level {level} not in {VERIFY_LEVELS}"
+    with VERIFY_LOCK:
+        VERIFY.update(level=level, samples=VERIFY['samples'] if samples is None else samples)
+
+
+def verify_settings():
+    '''
+    Snapshot of VERIFY, taken under its lock: level & samples of one check are from the same set_verify
+    '''
+    with VERIFY_LOCK:
+        return dict(VERIFY)
+
+
+def verify_index(*shapes, verify=None):
+    '''
+    Flat indices of the elements to cross-check in tensors of shapes: the same random ones if the VERIFY level is sampled,
+    else None (every element). Tensors of different shapes are checked whole, to be broadcast.
+    verify: snapshot of VERIFY (verify_settings) the caller has taken, else a new one
+    '''
+    verify = verify or verify_settings()
+    size = int(np.prod(shapes[0]))
+    if verify['level'] != 'sampled' or size <= verify['samples'] or any(tuple(s) != tuple(shapes[0]) for s in shapes):
+        return None
+    return np.random.default_rng(verify['seed']).integers(0, size, verify['samples'])
+
+
+def verify_samples(*arrays):
+    '''
+    Elements of same-shaped arrays to cross-check at the VERIFY level: the arrays as given, the same random flat indices of each,
+    or None if off. Arrays of different shapes are returned whole, to be broadcast.
+    '''
+    verify = verify_settings()
+    if verify['level'] == 'off':
+        return None
+    arrays = [np.asarray(a) for a in arrays]
+    idx = verify_index(*[a.shape for a in arrays], verify=verify)
+    return arrays if idx is None else [a.reshape(-1)[idx] for a in arrays]
+
+
+def check_close(out, ref, name):
+    '''
+    Asserts the integer result out matches the float result ref (XTensors), at the VERIFY level.
+    Nothing is converted if off. If sampled, only the sampled elements are: from the integers of out & gathered from ref.
+    '''
+    verify = verify_settings()
+    if verify['level'] == 'off':
+        return
+    idx = verify_index(out.shape, ref.shape, verify=verify)
+    out, ref = out.fvalues(idx), ref.fvalues(idx)
+    assert np.allclose(out, ref), f"{name} does not match. {(out.shape, ref.shape)} \nout:{out.reshape(-1)[:100]}, \nself.out:{ref.reshape(-1)[:100]}"
+
+
+class SYS_BITS:  # registered as a Keras serializable in xmodel.py, this module does not import TF
     def __init__(self, x, k, b):
         self.x = x
         self.k = k
@@ -14,7 +169,36 @@ class SYS_BITS:
     def get_config(self):
         return {'x': self.x, 'k': self.k, 'b': self.b}
     
+def int_dtype(bits):
+    '''
+    Narrowest signed NumPy integer holding words of bits (int64 if bits is not known)
+    '''
+    for dtype in [np.int8, np.int16, np.int32]:
+        if bits is not None and bits <= np.iinfo(dtype).bits:
+            return dtype
+    return np.int64
+
+
+def narrow_int(arr, bits):
+    '''
+    arr as integers of int_dtype(bits), without a copy if it already is. Values are checked to fit, unless VERIFY is off.
+    '''
+    dtype = int_dtype(bits)
+    if arr.dtype == dtype:
+        return arr
+    if verify_settings()['level'] != 'off' and arr.size and np.dtype(dtype).itemsize < arr.dtype.itemsize:
+        info = np.iinfo(dtype)
+        assert info.min <= arr.min() and arr.max() <= info.max, f"Values [{arr.min()}, {arr.max()}] do not fit in {bits} bits"
+    return arr.astype(dtype)
+
+
 class XTensor:
+    '''
+    Quantized tensor: ftensor (float) = itensor / 2**frac.
+    The integers are kept once, as a NumPy array in int_dtype(bits) (iarray): given as NumPy integers (exact beyond float32, 2**24),
+    or rounded from itensor on first use. ftensor of exact tensors is NumPy float32, made without TF. itensor is a TF tensor,
+    for the 'tf' backend only. Assigning ftensor (TF or NumPy) drops the integers kept.
+    '''
     def __init__(self, tensor, bits, frac=None, int=None, float_only=False, from_int=False):
         self.bits = bits
         self.float_only = float_only
@@ -24,34 +208,107 @@ class XTensor:
             self.frac = get_frac_bits(bits, int) if frac is None else frac
             self.int = get_int_bits(bits, frac) if int is None else int
 
-        tensor = tf.convert_to_tensor(tensor, dtype=tf.float32) if isinstance(tensor, np.ndarray) else tensor
+        self._iarray = self._itensor = self._ftensor = None
+        self._exact = from_int and isinstance(tensor, np.ndarray) and np.issubdtype(tensor.dtype, np.integer)
+        if self._exact:
+            self._iarray = narrow_int(tensor, bits)
+            return
+
+        if isinstance(tensor, np.ndarray):
+            import tensorflow as tf
+            tensor = tf.convert_to_tensor(tensor, dtype=tf.float32)
 
         if from_int:
             self._itensor = tensor
-            self.ftensor = tensor / 2**self.frac
         else:
-            self._itensor = None
-            self.ftensor = tensor
+            self._ftensor = tensor
+
+    def __getstate__(self):
+        '''
+        Pickled without TF: the integers as iarray (exact once restored), float-only tensors as NumPy
+        '''
+        state = dict(self.__dict__)
+        if not self.float_only and (self._iarray is not None or self._itensor is not None):
+            state.update(_iarray=self.iarray, _itensor=None, _ftensor=None, _exact=True, from_int=True)
+        elif self._ftensor is not None:
+            state.update(_ftensor=np.asarray(self._ftensor))
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    @property
+    def ftensor(self):
+        if self._ftensor is None and self._exact:
+            self._ftensor = (self._iarray / 2**self.frac).astype(np.float32)
+        elif self._ftensor is None and not self.float_only and (self._iarray is not None or self._itensor is not None):
+            self._ftensor = self.itensor / 2**self.frac
+        return self._ftensor
+
+    @ftensor.setter
+    def ftensor(self, tensor):
+        self._ftensor = tensor
+        self._iarray = self._itensor = None
+        self._exact = self.from_int = False
 
     @property
     def itensor(self):
         if self.float_only:
             raise ValueError("Only float tensor available")
         
-        if self.from_int:
+        if self._itensor is not None:
             return self._itensor
+        elif self._exact:
+            import tensorflow as tf
+            return tf.convert_to_tensor(self._iarray, dtype=tf.float32)
         else:  
             return self.ftensor * 2**self.frac
 
+    @property
+    def exact(self):
+        return self._exact
+
+    @property
+    def shape(self):
+        return tuple((self._iarray if self._iarray is not None else self._itensor if self._itensor is not None else self._ftensor).shape)
+
+    def fvalues(self, index=None):
+        '''
+        Float values as a NumPy array, or at flat indices only. Taken from the integers when there are, else gathered from ftensor.
+        '''
+        if not self.float_only and (self._iarray is not None or self._itensor is not None):
+            values = self.iarray if index is None else self.iarray.reshape(-1)[index]
+            return values / 2**self.frac
+        tensor = self.ftensor
+        if index is None:
+            return np.asarray(tensor)
+        if isinstance(tensor, np.ndarray):
+            return tensor.reshape(-1)[index]
+        import tensorflow as tf
+        return tf.gather(tf.reshape(tensor, [-1]), index).numpy()
 
     @property
-    def valid(self):
-        valid = (self.itensor.numpy() == self.itensor.numpy().astype(int)).all()
+    def iarray(self):
+        '''
+        Integer tensor as a NumPy array of int_dtype(bits). Exact if built from NumPy integers, else rounded from itensor once
+        '''
+        if self.float_only:
+            raise ValueError("Only float tensor available")
+        
+        if self._iarray is None:
+            self._iarray = narrow_int(np.rint(self.itensor.numpy()), self.bits)
+        return self._iarray
 
+    @property
+    def valid(self):
         if self.float_only:
             self.error = "Float only"
             return False
-        elif not valid:
+
+        samples = None if self.exact else verify_samples(self.itensor)
+        valid = samples is None or (samples[0] == samples[0].astype(int)).all()
+
+        if not valid:
             self.error = f"Wrong quantization:\n bits:{self.bits}\n frac:{self.frac}\n itensor:{self.itensor}"
             return False
         else:
@@ -73,7 +330,10 @@ class XTensor:
         s_shift = r_frac-self.frac
         t_shift = r_frac-other.frac
 
-        r = (self.itensor * 2**s_shift) + (other.itensor * 2**t_shift)
+        if self.exact:
+            r = (self.iarray.astype(np.int64) << s_shift) + (other.iarray.astype(np.int64) << t_shift)
+        else:
+            r = (self.itensor * 2**s_shift) + (other.itensor * 2**t_shift)
         r_tensor = XTensor(tensor=r, bits=r_bits, frac=r_frac, from_int=True)
         return r_tensor, (s_shift, t_shift)
 
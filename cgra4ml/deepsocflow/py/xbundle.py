@@ -11,10 +11,16 @@ from deepsocflow.py.xmodel import *
 from deepsocflow.py.xlayers import *
 from deepsocflow.py.hardware import *
 from deepsocflow.py.dataflow import *
+from deepsocflow.py.golden import *
+from deepsocflow.py.cache import *
 
 
 @keras.saving.register_keras_serializable()
-class XBundle(Layer):
+class XBundle(GraphState, Layer):
+    GRAPH_STATE = ('ib', 'prev_ib', 'next_ibs', 'next_add_ibs', 'out', 'inp', 'pre_softmax', 'softmax_frac', 'softmax_max_f',
+                   'x_shape', 'w_shape', 'o_shape', 'hw', 'r', 'x_int_shape', 'y_int_shape', 'cache_key', 'cache_hit',
+                   'be', 'we', 'ye_exp', 'ye_exp_shape', 'o_int', 'oe_sum_exp', 'oe_exp_nhwc', 'ye_exp_p', 'we_packed',
+                   'xe_words', 'we_words', 'o_int_shape', 'out_offset', 'add_out_offset')
 
     def __init__(self, core, pool=None, add_act=None, flatten=False, softmax=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -27,25 +33,21 @@ class XBundle(Layer):
             self.flatten.out = XTensor(None, None, float_only=True)
         self.softmax = Activation("softmax") if softmax else None
 
-        self.out = XTensor(None, None, float_only=True)
-        self.softmax_max_f = 0
-        self.softmax_frac = 0
-
-        self.ib = None
-        self.prev_ib = None
-        self.next_ibs = []
-        self.next_add_ibs = []
+    def graph_defaults(self):
+        return {'out': XTensor(None, None, float_only=True), 'softmax_max_f': 0, 'softmax_frac': 0,
+                'ib': None, 'prev_ib': None, 'next_ibs': [], 'next_add_ibs': []}
 
 
     def call(self, input_tensor, x_add=None, training=False):
 
-        self.ib = len(BUNDLES)
-        BUNDLES.append(self)
+        graph = current_graph()
+        assert graph is not None, "XBundle must be called inside an XModel, or with an active XGraph"
+        graph.add(self)
     
         x = input_tensor
         if hasattr(x, "ib"):
             self.prev_ib = x.ib
-            BUNDLES[self.prev_ib].next_ibs += [self.ib]
+            graph.bundles[self.prev_ib].next_ibs += [self.ib]
 
         print(f"{self.ib} x: {x.shape}, prev:{self.prev_ib}")
 
@@ -56,7 +58,7 @@ class XBundle(Layer):
 
             assert self.add is not None, "Activation function must be provided for add layer"
             self.add.source_ib = x_add.ib
-            BUNDLES[x_add.ib].next_add_ibs += [self.ib]
+            graph.bundles[x_add.ib].next_add_ibs += [self.ib]
 
             x = self.add([x, x_add])
             x = self.add.act(x)
@@ -74,70 +76,79 @@ class XBundle(Layer):
 
         self.out.ftensor = x
         x.ib = self.ib
+
+        ''' Shapes per sample, recorded on every call (also symbolic, when the model is built or loaded) for shape-only estimation '''
+        self.x_shape = tuple(input_tensor.shape[1:])
+        self.w_shape = tuple(self.core.kernel.shape)
+        self.o_shape = tuple(x.shape[1:])
         return x
     
-    def call_int(self, x, hw):
-
-        self.inp = x if self.ib == 0 else BUNDLES[self.prev_ib].out
+    def call_int(self, x, hw, backend='tf', graph=None):
+        '''
+        backend: 'tf' runs conv & dense in float32 TF. 'numpy' runs the exact integer engine in golden.py
+        graph: XGraph the bundle was called in, to take the outputs of the bundles feeding it
+        '''
+        self.inp = x if self.ib == 0 else graph.bundles[self.prev_ib].out
 
-        out = self.core.call_int(self.inp, hw)
-        out = self.core.act.call_int(out, hw)
+        out = self.core.call_int(self.inp, hw, backend)
+        out = self.core.act.call_int(out, hw, backend)
 
         if self.add:
             print(f"Bundle {self.ib} source_ib: {self.add.source_ib}")
-            out = self.add.call_int(out, hw)
-            out = self.add.act.call_int(out, hw)
+            out = self.add.call_int(out, hw, backend, graph)
+            out = self.add.act.call_int(out, hw, backend)
 
         if self.pool:
-            out = self.pool.call_int(out, hw)
-            out = self.pool.act.call_int(out, hw)
+            out = self.pool.call_int(out, hw, backend)
+            out = self.pool.act.call_int(out, hw, backend)
 
         if self.flatten:
-            out = XTensor(tensor=out.itensor.numpy().reshape(out.itensor.shape[0],-1), bits=out.bits, frac=out.frac, from_int=True)
+            out = XTensor(tensor=out.iarray.reshape(out.iarray.shape[0],-1), bits=out.bits, frac=out.frac, from_int=True)
             
         if self.softmax:
             self.pre_softmax = deepcopy(out)
             self.softmax_frac = out.frac
-            softmax_out = out.ftensor.numpy().astype(np.float32)
-            self.softmax_max_f = softmax_out.max()
-            exp = np.exp(softmax_out - self.softmax_max_f).astype(np.float32)
-            softmax_out = exp/np.sum(exp, axis=1, dtype=np.float32)[0]
-
-            assert np.all(np.argmax(self.out.ftensor, axis=-1) == np.argmax(softmax_out, axis=-1)), \
-                f"Softmax argmax does not match. \nout:{self.out.ftensor}, \nself.out:{softmax_out}"
-            out.ftensor = tf.convert_to_tensor(softmax_out, dtype=tf.float32) # replace with one calc from int
+            self.softmax_max_f, softmax_out = softmax_float(out.fvalues())
+
+            assert verify_settings()['level'] == 'off' or np.all(np.argmax(self.out.fvalues(), axis=-1) == np.argmax(softmax_out, axis=-1)), \
+                f"Softmax argmax does not match. \nout:{self.out.fvalues()}, \nself.out:{softmax_out}"
+            out.ftensor = softmax_out # NumPy float32, as the firmware computes it
             out.from_int = False
             out.float_only = True
         else:
-            assert np.allclose(out.ftensor, self.out.ftensor), \
-                f"Bundle output does not match. \nout:{out.ftensor.numpy().flatten()[:100]}, \nself.out:{self.out.ftensor.numpy().flatten()[:100]}"
+            check_close(out, self.out, "Bundle output")
         
         self.out = out
 
 
-    def export (self, hw, is_last):
+    def export (self, hw, is_last, cache_dir=None):
+        '''
+        cache_dir: if given, the arrays below are restored from (or stored to) a content-addressed cache,
+            keyed on the integer weights, input & output of the bundle, its runtime params and the hardware
+        The input of the passes is not made here: iter_xe yields it one pass at a time, as the files are written.
+        '''
 
         if not self.core.type == 'conv':
             print('Conv -> Dense Reshape')
-            CI,CO = self.core.w.itensor.shape
-            XN, _ = self.core.x.itensor.shape
-            w_int = self.core.w.itensor.numpy().reshape(1,1,CI,CO) # (CI,CO) -> (KH,KW,CI,CO)
-            x_int = self.core.x.itensor.numpy().reshape(1,XN,1,CI) # (XN,CI) -> (XN, XH, XW, CI)
-            y_int = self.core.y.itensor.numpy().reshape(1,XN,1,CO) # (XN,CI) -> (XN, XH, XW, CI)
-            o_int = (self.pre_softmax if self.softmax else self.out).itensor.numpy().reshape(1,XN,1,CO)
+            CI,CO = self.core.w.iarray.shape
+            XN, _ = self.core.x.iarray.shape
+            w_int = self.core.w.iarray.reshape(1,1,CI,CO) # (CI,CO) -> (KH,KW,CI,CO)
+            x_int = self.core.x.iarray.reshape(1,XN,1,CI) # (XN,CI) -> (XN, XH, XW, CI)
+            y_int_strided = self.core.y.iarray.reshape(1,XN,1,CO) # (XN,CI) -> (XN, XH, XW, CI)
+            o_int = (self.pre_softmax if self.softmax else self.out).iarray.reshape(1,XN,1,CO)
         else:
-            w_int = self.core.w.itensor.numpy()
-            x_int = self.core.x.itensor.numpy()
-            y_int = self.core.y.itensor.numpy()
-            o_int = (self.pre_softmax if self.softmax else self.out).itensor.numpy()
+            w_int = self.core.w.iarray
+            x_int = self.core.x.iarray
+            y_int_strided = self.core.y.iarray
+            o_int = (self.pre_softmax if self.softmax else self.out).iarray
 
-        b_int = self.core.b.itensor.numpy() if self.core.b else None
+        b_int = self.core.b.iarray if self.core.b else None
         
         r = get_runtime_params(
             hw=hw, 
             w_shape=w_int.shape, 
             x_shape=x_int.shape, 
-            o_shape=self.out.ftensor.numpy().shape, 
+            o_shape=self.out.shape, 
             core=self.core, 
             pool=self.pool,
             flatten = self.flatten,
@@ -160,32 +171,96 @@ class XBundle(Layer):
         assert ACC_WIDTH <= hw.Y_BITS, f"ACC_WIDTH:{ACC_WIDTH} > Y_BITS{hw.Y_BITS}"
 
         print(r)
+        self.hw, self.r = hw, r
+        self.x_int_shape, self.y_int_shape = x_int.shape, x_int.shape[:3] + (w_int.shape[-1],) # to map engine-order indices back to NHWC
+
+        self.cache_key = bundle_cache_key(hw, r, is_last, x_int, w_int, b_int, o_int) if cache_dir else None
+        cached = cache_load(cache_dir, self.cache_key) if cache_dir else None
+        self.cache_hit = cached is not None
+        if self.cache_hit:
+            print(f"Restored from cache: {self.cache_key}")
+            for k, v in cached.items():
+                setattr(self, k, v)
+            self.o_int = self.oe_exp_nhwc = o_int
+            self.set_sizes()
+            return
+
         check_sparsity(w_int, x_int)
 
+        '''
+        Prepare expected outputs for each pass, in one blocked integer conv over CM_0, CM, CM... channel slices.
+        Engine does not stride: it computes the stride-1 conv, which the firmware subsamples at (CSH_SHIFT, CSW_SHIFT).
+        The strided conv from call_int is checked against that subsampling.
+        '''
+        yp_all = conv2d_int(x_int, w_int, ci_splits=[r.CM_0] + [r.CM]*(r.CP-1), dtype=np.int32)  # (CP, XN, XH, XW, CO)
+        y_int = yp_all.sum(axis=0, dtype=np.int32)
+        assert np.array_equal(y_int[:, r.CSH_SHIFT::r.CSH, r.CSW_SHIFT::r.CSW, :], y_int_strided), \
+            f"Sum of passes does not match the conv from call_int, subsampled at (CSH_SHIFT, CSW_SHIFT)=({r.CSH_SHIFT}, {r.CSW_SHIFT})"
+
         self.be = reorder_b_q2e_conv(b_int, hw, r) if self.core.b else None
         self.we = reorder_w_q2e_conv(w_int, hw, r)
         self.ye_exp_shape = (r.IT, r.XN, r.XL, r.XW*r.CO_PRL, hw.ROWS)
-        self.ye_hw = np.zeros(self.ye_exp_shape)
 
-        self.xe = reorder_x_q2e_conv(x_int, hw, r)
         self.ye_exp = reorder_y_q2e_conv(y_int, hw, r)
         self.o_int = o_int
         self.oe_sum_exp = o_int if is_last else reorder_y_q2e_conv(y_int, hw, r)
         self.oe_exp_nhwc = o_int
-        print(f"x reshape: [int]:{self.core.x.itensor.shape}, int:{x_int.shape}. xe:{self.xe[0].shape}")
+        print(f"x reshape: [int]:{self.core.x.shape}, int:{x_int.shape}")
+        self.ye_exp_p = [reorder_y_q2e_conv(yp, hw, r) for yp in yp_all]
+
+        ''' Packed words, as streamed to wb.bin and x_sim.bin '''
+        self.we_packed = [pack_words_into_bytes(arr=we[:r.IT], bits=hw.K_BITS).tobytes() for we in self.we]
+
+        if cache_dir:
+            cache_store(cache_dir, self.cache_key, {k: getattr(self, k) for k in 
+                ['be', 'we', 'ye_exp', 'oe_sum_exp', 'ye_exp_p', 'ye_exp_shape', 'we_packed']})
+        self.set_sizes()
+
 
+    def set_sizes(self):
         '''
-        Prepare expected outputs for each pass
+        Sizes the header & the arena need, kept after release
         '''
-        self.ye_exp_p = []
-        ic_left = ic_right = 0
-        for ip in range(r.CP):
-            CM_p = r.CM_0 if ip==0 else r.CM
-            ic_right += CM_p
+        self.xe_words = x_words_q2e_conv(self.hw, self.r)
+        self.we_words = [we[0].size for we in self.we]
+        self.o_int_shape = self.o_int.shape
 
-            wp = w_int[:,:, ic_left:ic_right, :]
-            xp = x_int[:,:,:, ic_left:ic_right ]
-            yp = tf.keras.backend.conv2d(xp.astype(np.float32), wp.astype(np.float32), padding='same').numpy().astype(np.int32)
-            self.ye_exp_p += [reorder_y_q2e_conv(yp, hw, r)]
-            ic_left = ic_right
-        self.hw, self.r = hw, r
+
+    def iter_xe(self):
+        '''
+        Input of each pass in the engine order, with its packed bytes: (xe, xe_packed). Reordered from the input of the bundle
+        as it is asked for (iter_x_q2e_conv), so only one pass is held at a time. Needs the input: before release.
+        '''
+        x_int = self.core.x.iarray.reshape(self.x_int_shape)
+        for xe in iter_x_q2e_conv(x_int, self.hw, self.r):
+            yield xe, pack_words_into_bytes(arr=xe, bits=self.hw.X_BITS).tobytes()
+
+
+    def release_export(self):
+        '''
+        Drops the arrays of export once the files of the bundle are written. Keeps the biases (written last to wb.bin),
+        the runtime params & the sizes from set_sizes.
+        '''
+        self.we = self.ye_exp = self.ye_exp_p = self.oe_sum_exp = self.oe_exp_nhwc = self.o_int = None
+        self.we_packed = None
+
+
+    def release(self):
+        '''
+        Drops the arrays of call_int & export once the bundle is written (streaming export). Keeps the output (self.out)
+        for the bundles taking it, and what release_export keeps.
+        '''
+        self.release_export()
+        self.inp = self.pre_softmax = None
+        for layer in [self.core, self.core.act, self.add, self.add and self.add.act, self.pool, self.pool and self.pool.act]:
+            if layer:
+                state = layer.graph_state()
+                state.update({k: None for k in ['x', 'w', 'y'] if k in state})
+                layer.out = XTensor(None, None, float_only=True)
+
+
+    def release_output(self):
+        '''
+        Drops the output, after the last bundle taking it (next_ibs & next_add_ibs) has run
+        '''
+        self.out = XTensor(None, None, float_only=True)
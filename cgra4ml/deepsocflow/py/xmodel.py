@@ -3,6 +3,10 @@ from tensorflow import keras
 from keras.layers import Layer
 from qkeras import *
 import os
+import shutil
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 from deepsocflow.py.utils import *
@@ -10,8 +14,13 @@ from deepsocflow.py.xbundle import *
 from deepsocflow.py.xlayers import *
 from deepsocflow.py.hardware import *
 from deepsocflow.py.dataflow import *
+from deepsocflow.py.golden import *
+from deepsocflow.py.cache import *
+from deepsocflow.py.arena import *
 
 
+SYS_BITS = keras.saving.register_keras_serializable()(SYS_BITS)  # sys_bits of XModel.get_config
+
 
 class XInputAct(QActivation):
     def __init__(self, *args, **kwargs):            
@@ -36,30 +45,189 @@ class XModel(Layer):
             'x_int_bits': self.x_int_bits,
         })
         return config
+
+    def __call__(self, *args, **kwargs):
+        '''
+        Bundles called inside register into the active XGraph, or into a new one. self.graph: the graph of the last call
+        '''
+        graph = current_graph()
+        if graph is not None:
+            self.graph = graph
+            return super().__call__(*args, **kwargs)
+        with XGraph() as graph:
+            self.graph = graph
+            return super().__call__(*args, **kwargs)
     
 
 
-def export_inference(model, hw, batch_size=1):
-    
-    for b in BUNDLES:
-        b.next_ibs.clear()
-        b.next_add_ibs.clear()
-    BUNDLES.clear()
-        
+def get_bundles(model):
+    '''
+    XBundles of a built (or loaded) model, in the order of their call in the active graph, else their last call.
+    Walks the model, so no graph is needed.
+    '''
+    return sorted([l for l in model.submodules if isinstance(l, XBundle)], key=lambda b: b.ib)
+
+
+def get_graph(model):
+    '''
+    XGraph of the last call of the XModel inside model
+    '''
+    return [l for l in model.submodules if isinstance(l, XModel)][0].graph
+
+
+Golden = namedtuple('Golden', ['model', 'key', 'graph'])
+GOLDEN = [] # last golden pass, reused by export_inference across Hardware points
+GOLDEN_LOCK = threading.Lock()
+
+
+def golden_forward(model, batch_size=1, seed=0, trace=False):
+    '''
+    Keras forward pass on a random input drawn from seed, in a new XGraph. Returns the graph and the quantized input of the first bundle.
+    With VERIFY level off, the float results are not checked: the model is only traced on a symbolic input, to build the graph.
+    trace: only trace the model (whatever the VERIFY level), the input is not made and None is returned for it.
+    '''
     user_model = model.layers[1]
     input_shape = (batch_size, *model.inputs[0].shape[1:])
-    x_keras = tf.random.uniform(input_shape)
+    x_keras = tf.convert_to_tensor(np.random.default_rng(seed).random(input_shape, dtype=np.float32))
+    with XGraph() as graph:
+        if trace or verify_settings()['level'] == 'off':
+            out_keras = model(keras.layers.Input(input_shape[1:], batch_size=batch_size))
+        else:
+            out_keras = model(x_keras)
+    graph.batch_size = batch_size
+
+    for i, b in enumerate(graph.bundles):
+        print(f"Bundle {i}: {b}")
+
+    if trace:
+        return graph, None
     x_qtensor = user_model.input_quant_layer(x_keras)
-    out_keras = model(x_keras)
+    x = XTensor(tensor=x_qtensor, bits=user_model.sys_bits.x, int=user_model.x_int_bits)   
+    return graph, x
+
+
+def golden_inference(model, hw, batch_size=1, backend='tf', seed=0):
+    '''
+    Hardware independent part of export_inference: the Keras forward pass on a random input and the integer golden model
+    (call_int) of every bundle. Results are kept in the XGraph of the forward pass, which is returned with them.
+    hw is only used for the bits of the CPU integer (INT_BITS).
+    '''
+    assert backend in ['tf', 'numpy'], f"Backend {backend} not recognized"
+
+    graph, x = golden_forward(model, batch_size, seed)
+
+    print("\n-----------STARTING GOLDEN MODEL-----------\n")
+
+    with graph:
+        for ib, b in enumerate(graph.bundles):
+            print(f'-----------------ib:{ib}-----------------------')
+            b.call_int(x if ib==0 else None, hw, backend, graph)
+    return graph
 
+
+def bundle_layers(b):
+    '''
+    The bundle & its layers with per call state, by role
+    '''
+    layers = {'bundle': b, 'core': b.core, 'core.act': b.core.act, 'add': b.add, 'add.act': b.add and b.add.act,
+              'pool': b.pool, 'pool.act': b.pool and b.pool.act}
+    return {role: layer for role, layer in layers.items() if layer is not None}
+
+
+def golden_state(graph):
+    '''
+    Results of the golden pass in graph, per bundle & role of its layers. The inputs of the bundles are the outputs of others: left out.
+    '''
+    return [{role: {k: v for k, v in graph.state(layer).items() if k != 'inp'} for role, layer in bundle_layers(b).items()}
+            for b in graph.bundles]
+
+
+def restore_golden(model, batch_size, state):
+    '''
+    Graph of a golden pass from golden_state: the model is only traced, call_int is not run
+    '''
+    graph, _ = golden_forward(model, batch_size, trace=True)
+    assert len(graph.bundles) == len(state), f"Cached golden pass has {len(state)} bundles, the model {len(graph.bundles)}"
+    for b, b_state in zip(graph.bundles, state):
+        for role, layer in bundle_layers(b).items():
+            graph.state(layer).update(b_state[role])
+    return graph
+
+
+def get_golden(model, hw, batch_size=1, backend='tf', seed=0, cache_dir=None):
+    '''
+    The golden pass is keyed on the model (config & weights), batch size, backend, INT_BITS, seed & VERIFY level.
+    Returns the last one if the key matches, else the one cached in cache_dir, else runs a new one (and caches it).
+    Its results are in its own graph, so calls of the model since do not change them. Read only: export in a copy (XGraph.copy).
+    '''
+    key = golden_cache_key(model.get_weights(), model.to_json(), batch_size, backend, hw.INT_BITS, seed, verify_settings()['level'])
+    with GOLDEN_LOCK:
+        g = GOLDEN[0] if len(GOLDEN) != 0 else None
+    if g is not None and g.model is model and g.key == key:
+        print("Reusing the golden model of the previous export")
+        return g
+
+    cached = cache_load(cache_dir, key) if cache_dir else None
+    if cached is not None:
+        print(f"Restored the golden model from cache: {key}")
+        graph = restore_golden(model, batch_size, cached)
+    else:
+        graph = golden_inference(model, hw, batch_size, backend, seed)
+        if cache_dir:
+            cache_store(cache_dir, key, golden_state(graph))
+
+    g = Golden(model, key, graph)
+    with GOLDEN_LOCK:
+        GOLDEN[:] = [g]
+    return g
+
+
+def export_inference(model, hw, batch_size=1, backend='tf', vector_format='txt', cache_dir=None, stream=False, seed=0):
+    '''
+    backend: 'tf' computes the integer golden model through float32 TF ops.
+             'numpy' uses the exact integer engine in golden.py (int64 accumulation, no TF ops).
+    vector_format: 'txt' writes test vectors as text, for debugging.
+                   'bin' writes raw little-endian arrays with .json sidecars, and makes the firmware dump binary (DUMP_VECTORS_BIN)
+    cache_dir: content-addressed cache of the golden pass, per-bundle export artifacts & test vectors (see cache.py). An unchanged bundle
+               (same integer weights, input & output, runtime params and hardware) is restored and its vectors hard-linked.
+    seed: of the random input. The same seed gives the same input, so the same golden pass & cache hits.
+
+    stream: runs call_int & export bundle by bundle, writes the files of each bundle as soon as it is exported and releases
+            its arrays. Outputs are released after the last bundle taking them (next_ibs & next_add_ibs), so the memory
+            held is bounded by the largest live set of activations, not the whole network. The golden model is not kept for reuse.
+            Without stream, the golden results are kept and only the export arrays of each bundle are released once written.
+            verify_inference reads the expected outputs from the vectors in both modes.
+
+    The golden model (forward pass & call_int) does not depend on the hardware: it is run once & reused by later calls with
+    the same model, weights, batch size, backend, INT_BITS, seed and VERIFY level, also across processes with cache_dir (see get_golden).
+    Only the hardware specific part runs per Hardware, in a copy of the golden graph (XGraph.copy): the golden one stays as it was,
+    for exports to other Hardware, also from other threads.
+
+    Returns the XGraph of this export, to pass to verify_inference & predict_model_performance. The runtime params & sizes of the bundles
+    for hw are kept in it: activate it (with graph:) to read them on the bundles, if the model is exported or called again since.
+    '''
+    assert backend in ['tf', 'numpy'], f"Backend {backend} not recognized"
+    assert vector_format in ['txt', 'bin'], f"Vector format {vector_format} not recognized"
+
+    user_model = model.layers[1]
     assert hw.X_BITS == user_model.sys_bits.x
     assert hw.K_BITS == user_model.sys_bits.k
     assert hw.B_BITS >= user_model.sys_bits.b
 
-    for i, b in enumerate(BUNDLES):
-        print(f"Bundle {i}: {b}")
+    if stream:
+        graph, x = golden_forward(model, batch_size, seed)
+    else:
+        graph = get_golden(model, hw, batch_size, backend, seed, cache_dir).graph.copy()
+
+    with graph:
+        return export_graph(graph, hw, backend, vector_format, cache_dir, stream, x if stream else None)
+
 
-    x = XTensor(tensor=x_qtensor, bits=hw.X_BITS, int=user_model.x_int_bits)   
+def export_graph(graph, hw, backend, vector_format, cache_dir, stream, x):
+    '''
+    Hardware specific part of export_inference, with graph active. x: input of the first bundle, when streaming
+    '''
+    bundles = graph.bundles
 
 
     '''
@@ -75,76 +243,65 @@ def export_inference(model, hw, batch_size=1):
 
     print("\n-----------STARTING EXPORT-----------\n")
 
+    ''' Bundles whose output is last used by bundle ib: its consumers (next_ibs & next_add_ibs), or itself if none '''
+    release_at = [[] for _ in bundles]
+    for b in bundles:
+        release_at[max([b.ib] + b.next_ibs + b.next_add_ibs)] += [b]
 
-    add_buffer_map = []
-    out_buffer_map = []
+    type_d = { 'np': {8: np.int8, 16: np.int16, 32: np.int32, 64: np.int64} }
 
-    for ib, b in enumerate(BUNDLES):
-        print(f'-----------------ib:{ib}-----------------------')
-        b.call_int(x if ib==0 else None, hw)
-        b.export(hw, False)
-   
-        '''
-        OUTPUT BUFFER ALLOCATION
-        '''
-        print(f'input_out_map:{out_buffer_map}')
-
-        '''Find and assign a free buffer. If not, add new buffer'''
-        b.out_buffer_idx = -1
-        next_ibs = sorted(deepcopy(b.next_ibs))
-        if len(next_ibs) != 0:
-            for im in range(len(out_buffer_map)):
-                if out_buffer_map[im] is None:
-                    out_buffer_map[im] = {'in':b.ib, 'out':next_ibs}
-                    b.out_buffer_idx = im
-                    break
-            else: #m if break is not hit
-                b.out_buffer_idx = len(out_buffer_map)
-                out_buffer_map += [{'in':b.ib, 'out':next_ibs}]
-        
-        print('out_buffer_idx:', b.out_buffer_idx)
-
-        '''Free the buffers whose last destination is current bundle'''
-        for im in range(len(out_buffer_map)):
-            buf = out_buffer_map[im]
-            if buf is not None:
-                if buf['out'][-1] == b.ib:
-                    out_buffer_map[im] = None
+    '''
+    Packed chunks are streamed to the files as they are produced, in the order the firmware reads them:
+        wb.bin    : weights [ib, ip, it], then biases [ib]
+        x_all.bin : inputs of all bundles [ib, ip] = concat of {ib}_x_sim.bin
+        x.bin     : input of bundle 0 = 0_x_sim.bin
+        wbx.bin   : wb.bin + x.bin
+    '''
+    with open(f"{hw.DATA_DIR}/wb.bin", 'wb') as f_wb, open(f"{hw.DATA_DIR}/x_all.bin", 'wb') as f_x_all:
+        for ib, b in enumerate(bundles):
+            print(f'-----------------ib:{ib}-----------------------')
+            if stream:
+                b.call_int(x if ib==0 else None, hw, backend, graph)
+            b.export(hw, False, cache_dir)
+
+            for we in b.we_packed:
+                f_wb.write(we) # all iterations of a pass at once
+            with open(f"{hw.DATA_DIR}/{ib}_x_sim.bin", 'wb') as f_x:
+                save_bundle_vectors(hw, b, vector_format, cache_dir, x_files=[f_x, f_x_all])
+
+            if ib == len(bundles)-1:
+                y_exp = (b.out.fvalues() if b.softmax else b.o_int).flatten() 
+                save_vector(f"{hw.DATA_DIR}/y_exp", y_exp, vector_format, np.float32 if b.softmax else np.int32)
+                for i in range(len(y_exp)):
+                    if (i < 20 or len(y_exp)-i < 20):
+                        print(f"y_exp {i}: {y_exp[i]}")
+
+            if stream:
+                b.release()
+                for b_done in release_at[ib]:
+                    b_done.release_output()
+            else:
+                b.release_export() # the golden results stay, for the next export
 
-        print(f'out_buffer_map:{out_buffer_map}')
+        for b in bundles:
+            if b.core.b:
+                f_wb.write(b.be.astype(type_d['np'][hw.B_BITS]).tobytes())
 
+    shutil.copyfile(f"{hw.DATA_DIR}/0_x_sim.bin", f"{hw.DATA_DIR}/x.bin")
+    shutil.copyfile(f"{hw.DATA_DIR}/wb.bin", f"{hw.DATA_DIR}/wbx.bin")
+    with open(f"{hw.DATA_DIR}/wbx.bin", 'ab') as f_wbx, open(f"{hw.DATA_DIR}/x.bin", 'rb') as f_x:
+        shutil.copyfileobj(f_x, f_wbx)
 
-        
-        '''
-        ADD BUFFER ALLOCATION
-        '''
-        print(f'input_add_map:{add_buffer_map}')
-
-        '''Find and assign a free buffer. If not, add new buffer'''
-        b.add_out_buffer_idx = -1
-        if len(b.next_add_ibs) != 0:
-            for im in range(len(add_buffer_map)):
-                if add_buffer_map[im] is None:
-                    add_buffer_map[im] = {'in':b.ib, 'out':b.next_add_ibs}
-                    b.add_out_buffer_idx = im
-                    break
-            else: #m if break is not hit
-                b.add_out_buffer_idx = len(add_buffer_map)
-                add_buffer_map += [{'in':b.ib, 'out':b.next_add_ibs}]
-        
-        print('add_out_buffer_idx:', b.add_out_buffer_idx)
+    print(f'Weights, inputs, outputs saved to {hw.DATA_DIR}/ib_ip_it_*.{vector_format}')
 
-        '''Free the buffers whose last destination is current bundle'''
-        for im in range(len(add_buffer_map)):
-            buf = add_buffer_map[im]
-            if buf is not None:
-                if buf['out'][-1] == b.ib:
-                    add_buffer_map[im] = None
 
-        print(f'add_buffer_map:{add_buffer_map}')     
+    '''
+    BUFFER ALLOCATION: offsets of the output & add buffers in one arena, from their lifetimes
+    '''
+    arena_buffers, arena_report = plan_bundle_buffers(hw, bundles)
 
 
-    d_perf = predict_model_performance(hw=hw)
+    d_perf = predict_model_performance(hw, graph)
     print(f"Predicted performance: {d_perf}")
 
     '''
@@ -153,30 +310,20 @@ def export_inference(model, hw, batch_size=1):
     x_bytes_all = x_bytes = w_bytes = b_words = x_bytes_max = nhwc_words_max = o_bytes_max = o_words_max = 0
     with open (f'./config_fw.h', 'w') as ch:
 
-        ch.write(f"#define N_BUNDLES {len(BUNDLES)}\n")
+        ch.write(f"#define N_BUNDLES {len(bundles)}\n")
         ch.write(f"Bundle_t bundles [N_BUNDLES] = {{\n")
         
-        for ib, b in enumerate(BUNDLES):
+        for ib, b in enumerate(bundles):
             assert ib == b.ib
 
-            w_bpt    = (hw.K_BITS*b.we[-1][0].size)//8
-            w_bpt_p0 = (hw.K_BITS*b.we[0][0].size)//8
-            x_bpt    = (hw.X_BITS*b.xe[-1].size)//8 
-            x_bpt_p0 = (hw.X_BITS*b.xe[0].size )//8
+            w_bpt    = (hw.K_BITS*b.we_words[-1])//8
+            w_bpt_p0 = (hw.K_BITS*b.we_words[0] )//8
+            x_bpt    = (hw.X_BITS*b.xe_words[-1])//8 
+            x_bpt_p0 = (hw.X_BITS*b.xe_words[0] )//8
             
-            if ib == len(BUNDLES)-1:
-                o_words_b = b.o_int.size
-                o_bytes_b = o_words_b*4 # int or float
+            o_words_b, o_bytes_b = get_out_bytes(hw, bundles, ib)
+            if ib == len(bundles)-1:
                 o_words = o_words_b
-            else:
-                b_next    = BUNDLES[ib+1]
-                o_wpt     = b_next.xe[-1].size
-                o_wpt_p0  = b_next.xe[0].size
-                o_words_b = o_wpt_p0 + (b_next.r.CP-1)*o_wpt
-
-                o_bpt = (hw.X_BITS*b_next.xe[-1].size)//8
-                o_bpt_p0 = (hw.X_BITS*b_next.xe[0].size)//8
-                o_bytes_b = o_bpt_p0 + (b_next.r.CP-1)*o_bpt
 
             xp_words  = b.r.XN * b.r.XL * b.r.XW * (hw.ROWS+b.r.X_PAD)
 
@@ -205,9 +352,8 @@ def export_inference(model, hw, batch_size=1):
             (aa_nzero, aa_shift, aa_pl_scale) = (b.add .act.non_zero, b.add .act.shift_bits, b.add .act.plog_slope)if b.add  is not None else (0,0,0)
             (pa_nzero, pa_shift, pa_pl_scale) = (b.pool.act.non_zero, b.pool.act.shift_bits, b.pool.act.plog_slope)if b.pool is not None else (0,0,0)
 
-            add_out_buffer_idx = b.add_out_buffer_idx
-            add_in_buffer_idx = BUNDLES[b.add.source_ib].add_out_buffer_idx if b.add is not None else -1
-            in_buffer_idx = BUNDLES[b.prev_ib].out_buffer_idx if b.prev_ib is not None else -1
+            add_in_offset = bundles[b.add.source_ib].add_out_offset if b.add is not None else -1
+            in_offset = bundles[b.prev_ib].out_offset if b.prev_ib is not None else -1
 
             if b.pool is None:
                 pool_type = 'POOL_NONE'
@@ -216,20 +362,20 @@ def export_inference(model, hw, batch_size=1):
             elif b.pool.type == 'avg':
                 pool_type = 'POOL_AVG'
 
-            out_type = 'float' if (ib == len(BUNDLES)-1 and b.softmax) else 'int32_t'
+            out_type = 'float' if (ib == len(bundles)-1 and b.softmax) else 'int32_t'
 
             ch.write(f"   {{.n={b.r.XN:<3}, .l={b.r.XL:<3}, .kw={b.r.KW:<3}, .coe={y_coe:<3}, .h={b.r.XH:<3}, .w={b.r.XW:<3}, .ci={b.r.CI:<4}, .co={b.r.CO:<4}, .w_kw2={b.r.XW-b.r.KW//2:<3}, .t={b.r.IT:<3}, .p={b.r.CP:<3}, .cm={b.r.CM:<3}, .cm_p0={b.r.CM_0:<3}, .on={b.r.ON:<3}, .oh={b.r.OH:<3}, .ow={b.r.OW:<3}, .oc={b.r.OC:<4}, .ch={b.r.CYH:<3}, .ph={b.r.PYH:<3}, .cw={b.r.CYW:<3}, .pw={b.r.PYW:<3}, .pkh={b.r.PKH:<3}, .psh={b.r.PSH:<3}, .pkw={b.r.PKW:<3}, .psw={b.r.PSW:<3}, ")
             ch.write(     f".xp_words={xp_words:<6}, .b_offset={b_words:<5}, .w_bpt={w_bpt:<5}, .w_bpt_p0={w_bpt_p0:<5}, .x_bpt={x_bpt:<8}, .x_bpt_p0={x_bpt_p0:<8}, .o_words={o_words_b:<8}, .o_bytes={o_bytes_b:<8}, ")
-            ch.write(     f".ib_out={ib_out:<4}, .in_buffer_idx={in_buffer_idx:<3}, .out_buffer_idx={b.out_buffer_idx:<3}, .add_out_buffer_idx={add_out_buffer_idx:<2}, .add_in_buffer_idx={add_in_buffer_idx:<2}, ")
+            ch.write(     f".ib_out={ib_out:<4}, .in_offset={c_offset(in_offset):<10}, .out_offset={c_offset(b.out_offset):<10}, .add_out_offset={c_offset(b.add_out_offset):<10}, .add_in_offset={c_offset(add_in_offset):<10}, ")
             ch.write(     f".is_bias={1*(b.core.b is not None):<3}, .is_flatten={1*(b.flatten is not None):<3}, .is_softmax={1*(b.softmax is not None):<3}, ")
             ch.write(     f".x_pad={b.r.X_PAD:<3}, .b_val_shift={b.core.bias_val_shift:<3}, .b_bias_shift={b.core.bias_b_shift:<3}, .ca_nzero={ca_nzero:<3}, .ca_shift={ca_shift:<3}, .ca_pl_scale={ca_pl_scale:<3}, .aa_nzero={aa_nzero:<3}, .aa_shift={aa_shift:<3}, .aa_pl_scale={aa_pl_scale:<3}, .pa_nzero={pa_nzero:<3}, .pa_shift={pa_shift:<3}, .pa_pl_scale={pa_pl_scale:<3}, .softmax_frac={b.softmax_frac:<3}, ")
             ch.write(     f".csh={b.r.CSH:<3}, .csh_shift={b.r.CSH_SHIFT:<3}, .psh_shift={b.r.PSH_SHIFT:<3}, .csw={b.r.CSW:<3}, .csw_shift={b.r.CSW_SHIFT:<3}, .psw_shift={b.r.PSW_SHIFT:<3}, .pool={pool_type:<10}, ")
             ch.write(     f".softmax_max_f={b.softmax_max_f:<15}, ")
             ch.write(     f".header={b.r.header:>23}u, ")
-            ch.write(     f".debug_nhwc_words={b.oe_exp_nhwc.size:<9} }}")
+            ch.write(     f".debug_nhwc_words={int(np.prod(b.o_int_shape)):<9} }}")
             
             b_words += b.be.size if b.core.b else 0
-            if b.ib != len(BUNDLES)-1:
+            if b.ib != len(bundles)-1:
                 ch.write(',\n')
 
 
@@ -240,8 +386,7 @@ def export_inference(model, hw, batch_size=1):
         ch.write(f"#define PE_ROWS     {hw.ROWS}\n")
         ch.write(f"#define PE_COLS     {hw.COLS}\n\n")
 
-        ch.write(f"#define N_OUT_BUF   {max(len(out_buffer_map),1)}\n")
-        ch.write(f"#define N_ADD_BUF   {len(add_buffer_map) if len(add_buffer_map) > 0 else ''}\n")
+        ch.write(f"#define ARENA_BYTES {max(arena_report['arena_bytes'], ARENA_ALIGN)}\n")
         ch.write(f"#define WB_BYTES    {w_bytes + (b_words*hw.B_BITS)//8}\n")
         ch.write(f"#define W_BYTES     {w_bytes}\n")
         ch.write(f"#define X_BYTES     {x_bytes}\n")
@@ -256,140 +401,196 @@ def export_inference(model, hw, batch_size=1):
         ch.write(f"#define B_WORDS     {b_words}\n")
         ch.write(f"#define AXI_WIDTH   {hw.AXI_WIDTH}\n")
         ch.write(f"#define CONFIG_BASEADDR 0x{hw.CONFIG_BASEADDR}\n")
-        ch.write(f'#define DATA_DIR   "../{hw.DATA_DIR}"\n\n')
+        ch.write(f'#define DATA_DIR   "../{hw.DATA_DIR}"\n')
+        ch.write(f"#define DUMP_VECTORS_BIN\n\n" if vector_format == 'bin' else "\n")
 
         mask_nums = [(2**hw.X_BITS-1) << (p*hw.X_BITS)  for p in range(8//hw.X_BITS)]
         mask_nums = ~np.array(mask_nums, dtype=np.uint8)
         ch.write(f"static const uint8_t X_POSITION_INVERTED_MASKS [] = {{ {', '.join([str(n) for n in mask_nums])} }};\n")
 
-        '''
-        Write Binary Files
-        '''
-        type_d = { 'np': {8: np.int8, 16: np.int16, 32: np.int32, 64: np.int64} }
+    return graph
 
-        w_bitstring = b''
-        x_bitstring = b''
-        b_bitstring = b''
-        x_bitstring_0 = b''
 
-        for ib, b in enumerate(BUNDLES):
-            assert ib == b.ib
-            x_bitstring_b = b''
-            if b.core.b:
-                b_bitstring += b.be.astype(type_d['np'][hw.B_BITS]).tobytes()
-            for ip in range(b.r.CP):
-                xe = pack_words_into_bytes(arr=b.xe[ip].flatten(), bits=hw.X_BITS)
-                x_bitstring_b += xe.tobytes()
-                    
-                for it in range(b.r.IT):
-                    we = pack_words_into_bytes(arr=b.we[ip][it].flatten(), bits=hw.K_BITS)
-                    w_bitstring += we.tobytes()
-            x_bitstring += x_bitstring_b
-            with open(f"{hw.DATA_DIR}/{ib}_x_sim.bin", 'wb') as f: 
-                f.write(x_bitstring_b)
-            if ib==0:
-                x_bitstring_0 = x_bitstring_b
-        with open(f"{hw.DATA_DIR}/x.bin", 'wb') as f: 
-            f.write(x_bitstring_0)
-
-        with open(f"{hw.DATA_DIR}/wb.bin", 'wb') as f: 
-            f.write(w_bitstring + b_bitstring)
-
-        with open(f"{hw.DATA_DIR}/wbx.bin", 'wb') as f: 
-            f.write(w_bitstring + b_bitstring + x_bitstring_0)
-
-        with open(f"{hw.DATA_DIR}/x_all.bin", 'wb') as f: 
-            f.write(x_bitstring)
+Mismatch = namedtuple('Mismatch', ['name', 'ib', 'ip', 'it', 'index', 'nhwc', 'count', 'sim', 'exp'])
 
 
-        '''
-        Write Text files of vectors
-        '''
-        for ib, b in enumerate(BUNDLES):
-            assert ib == b.ib
-            np.savetxt(f"{hw.DATA_DIR}/{b.ib}_y_nhwc_exp.txt", b.oe_exp_nhwc.flatten(), fmt='%d')
-            np.savetxt(f"{hw.DATA_DIR}/{b.ib}_xe.txt", np.concatenate([a.flatten() for a in b.xe]), fmt='%d')
-            for ip in range(b.r.CP):
-                CM_p = b.r.CM_0 if ip==0 else b.r.CM
-
-                xp = b.xe[ip].flatten()
-                np.savetxt(f"{hw.DATA_DIR}/{b.ib}_{ip}_x.txt", xp, fmt='%d')
-
-                for it in range(b.r.IT):
-                    wp = b.we[ip][it].flatten()            
-                    assert wp.shape == ((CM_p*b.r.KH+hw.CONFIG_BEATS)*hw.COLS,), f"{wp.shape} != {(CM_p*b.r.KH+hw.CONFIG_BEATS)*hw.COLS}"
-                    np.savetxt(f"{hw.DATA_DIR}/{b.ib}_{ip}_{it}_w.txt", wp, fmt='%d')
-                    np.savetxt(f"{hw.DATA_DIR}/{b.ib}_{ip}_{it}_y_exp.txt", b.ye_exp_p[ip][it].flatten(), fmt='%d')
-        
-        y_exp = (b.out.ftensor.numpy() if b.softmax else b.o_int).flatten() 
-        np.savetxt(f"{hw.DATA_DIR}/y_exp.txt", y_exp, fmt= '%f' if b.softmax else '%d')
-        for i in range(len(y_exp)):
-            if (i < 20 or len(y_exp)-i < 20):
-                print(f"y_exp {i}: {y_exp[i]}")
-        
-        print(f'Weights, inputs, outputs saved to {hw.DATA_DIR}/ib_ip_it_*.txt')
+def save_bundle_vectors(hw, b, vector_format='txt', cache_dir=None, x_files=()):
+    '''
+    Test vectors of an exported bundle. With a cache, they are written once into the cache entry of the bundle & hard-linked from there.
+    x_files: binary files taking the packed input of each pass (x_sim.bin, x_all.bin). Each pass is reordered (b.iter_xe),
+    written to them & to its vectors before the next is made.
+    '''
+    if cache_dir and has_vectors(cache_dir, b.cache_key, vector_format):
+        link_vectors(cache_dir, b.cache_key, vector_format, hw.DATA_DIR, prefix=f"{b.ib}_")
+        for _ in write_xe(b, x_files):
+            pass
+        return
+
+    vec_dir, prefix = (begin_vectors(cache_dir, b.cache_key, vector_format), '') if cache_dir else (hw.DATA_DIR, f"{b.ib}_")
+    save_vector(f"{vec_dir}/{prefix}y_nhwc_exp", b.oe_exp_nhwc, vector_format, np.int32)
+    save_vector(f"{vec_dir}/{prefix}y_sum_exp", b.oe_sum_exp, vector_format, np.int32)
+    save_vector_parts(f"{vec_dir}/{prefix}xe", write_xe(b, x_files, vec_dir, prefix, vector_format), vector_format, np.int8)
+    for ip in range(b.r.CP):
+        CM_p = b.r.CM_0 if ip==0 else b.r.CM
+
+        for it in range(b.r.IT):
+            wp = b.we[ip][it].flatten()            
+            assert wp.shape == ((CM_p*b.r.KH+hw.CONFIG_BEATS)*hw.COLS,), f"{wp.shape} != {(CM_p*b.r.KH+hw.CONFIG_BEATS)*hw.COLS}"
+            save_vector(f"{vec_dir}/{prefix}{ip}_{it}_w", wp, vector_format, np.int8)
+            save_vector(f"{vec_dir}/{prefix}{ip}_{it}_y_exp", b.ye_exp_p[ip][it], vector_format, np.int32)
+
+    if cache_dir:
+        end_vectors(cache_dir, b.cache_key, vector_format, vec_dir)
+        link_vectors(cache_dir, b.cache_key, vector_format, hw.DATA_DIR, prefix=f"{b.ib}_")
+
+
+def write_xe(b, x_files, vec_dir=None, prefix='', vector_format='txt'):
+    '''
+    Yields the input of each pass of b once its packed bytes are written to x_files, and its vector ({ip}_x) to vec_dir if given
+    '''
+    for ip, (xe, xe_packed) in enumerate(b.iter_xe()):
+        for f in x_files:
+            f.write(xe_packed)
+        if vec_dir is not None:
+            save_vector(f"{vec_dir}/{prefix}{ip}_x", xe, vector_format, np.int8)
+        yield xe
+
+
+def compare_vector(path, exp, dtype=np.int32, vector_format='txt', atol=0, exp_dtype=None):
+    '''
+    Loads one simulated vector and compares it against exp: the path of a vector saved by export_inference (loaded as exp_dtype),
+    or of a packed .bin (exp_dtype None). Both are memory-mapped with vector_format 'bin'.
+    Returns None if they match, else (first differing flat index, mismatch count, sim value, exp value).
+    '''
+    if exp_dtype is None:
+        sim = np.memmap(path, dtype=np.uint8, mode='r')
+        exp = np.memmap(exp,  dtype=np.uint8, mode='r')
+    else:
+        sim = load_vector(path, dtype, vector_format)
+        exp = load_vector(exp, exp_dtype, vector_format)
+
+    if sim.size != exp.size:
+        return min(sim.size, exp.size), abs(exp.size-sim.size), f'size {sim.size}', f'size {exp.size}'
 
+    bad = ~np.isclose(sim, exp, rtol=0, atol=atol) if atol else (sim != exp)
+    count = int(np.count_nonzero(bad))
+    if count == 0:
+        return None
+    index = int(np.argmax(bad))
+    return index, count, sim[index].item(), exp[index].item()
 
-def verify_inference(model, hw, SIM, SIM_PATH):
+
+def _compare_task(task):
+    return compare_vector(**task[1])
+
+
+def mismatch_nhwc(hw, bundles, name, ib, it, index, sim, exp):
+    '''
+    NHWC coordinates of a mismatch: in the conv output of the bundle for raw/sum,
+    in the output for nhwc & last bundle, in the input of the next bundle for tiled/packed.
+    '''
+    b, is_last = bundles[ib], ib == len(bundles)-1
+
+    if name == 'y_nhwc' or (is_last and name in ['y_sum', 'y_tiled']):
+        return tuple(int(c) for c in np.unravel_index(index, b.o_int_shape)) if index < np.prod(b.o_int_shape) else None
+    if name in ['y_raw', 'y_sum']:
+        src, pad = y_q2e_map(b.y_int_shape, b.hw, b.r)
+        return index_to_nhwc([(src[it], None if pad is None else pad[it])] if name == 'y_raw' else [(src, pad)], b.y_int_shape, index)
+
+    bn = bundles[ib+1]
+    if name == 'y_packed' and isinstance(sim, int):  # byte index -> index of its first differing word
+        diff = sim ^ exp
+        index = index * (8//hw.X_BITS) + ((diff & -diff).bit_length()-1)//hw.X_BITS
+    return index_to_nhwc(compile_reorder(lambda a: iter_x_q2e_conv(a, bn.hw, bn.r), bn.x_int_shape), bn.x_int_shape, index)
+
+
+def verify_inference(model, hw, SIM, SIM_PATH, vector_format='txt', workers=None, raise_on_error=True, cache_dir=None, graph=None):
+    '''
+    graph: XGraph returned by export_inference. None: the graph of the last call of the model
+    vector_format: must match export_inference. With 'bin', outputs of the simulation are memory-mapped, not parsed.
+    workers: threads comparing the vectors in parallel (NumPy releases the GIL). None: one per cpu, 1: in this thread
+    cache_dir: shared cache of compiled RTL models (see Hardware.simulate). Can be the same directory as export_inference's
+
+    Tasks carry only paths: each comparison loads the expected vector saved by export_inference & the simulated one itself.
+    Results are consumed in bundle order, stopping at the first mismatch, which is raised (or returned) as a
+    Mismatch(name, ib, ip, it, index, nhwc, count, sim, exp). Returns None if all outputs match.
+    '''
 
     '''
     RUN SIMULATION
     '''
-    hw.simulate(SIM=SIM, SIM_PATH=SIM_PATH)
+    hw.simulate(SIM=SIM, SIM_PATH=SIM_PATH, cache_dir=cache_dir)
+    with graph or get_graph(model) as graph:
+        return verify_graph(graph, hw, vector_format, workers, raise_on_error)
 
 
+def verify_graph(graph, hw, vector_format, workers, raise_on_error):
     '''
-    CHECK ERROR
+    Comparisons of verify_inference, with graph active
+    '''
+    bundles = graph.bundles
+
+
     '''
-    for ib, b in enumerate(BUNDLES):
+    COLLECT CHECKS: ((name, ib, ip, it), compare_vector kwargs)
+    '''
+    tasks = []
+    for ib, b in enumerate(bundles):
         assert ib == b.ib
-        
-        ''' Verify raw output '''
+        is_last = ib == len(bundles)-1
+        path = f"{hw.DATA_DIR}/{b.ib}"
+        saved = lambda name, dtype: dict(exp=f"{hw.DATA_DIR}/{name}", exp_dtype=dtype) # expected output, saved by export_inference
+
+        ''' Raw output of each pass & iteration '''
         for ip in range(b.r.CP):
             for it in range(b.r.IT):
-                y_raw_exp = b.ye_exp_p[ip][it]
-                y_raw_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_{ip}_{it}_y_raw_sim.txt", np.int32)[:y_raw_exp.size].reshape(y_raw_exp.shape)
-                error = np.sum(np.abs(y_raw_exp-y_raw_sim))
-                assert error == 0, f"Error={error}, for y_raw_sim at {b.ib=}_{ip=}_{it=}"
-
-        ''' Verify sum output '''
-        y_sum_exp = b.oe_sum_exp
-        y_sum_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_y_sum_sim.txt", np.int32)[:y_sum_exp.size].reshape(y_sum_exp.shape)
-        error = np.sum(np.abs(y_sum_exp-y_sum_sim))
-        assert error == 0, f"Error={error}, for y_sum_sim at {b.ib=}"
-
-        ''' Verify processed output HWC'''
-        if not (ib == len(BUNDLES)-1 and b.softmax):
-            y_nhwc_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_y_nhwc_sim.txt",np.int32).reshape(b.oe_exp_nhwc.shape)
-            error = np.sum(np.abs(y_nhwc_sim - b.oe_exp_nhwc))
-            assert error == 0, f"sim:\n{y_nhwc_sim[0,:,:,0]}\n exp:\n{b.oe_exp_nhwc[0,:,:,0]}\n input:\n{b.pool.x.itensor.numpy()[0,:,:,0] if b.pool else None}"
-
-
-        ''' Verify tiled output'''
-        if (ib == len(BUNDLES)-1):
-            if b.softmax:
-                y_tiled_exp = b.out.ftensor.numpy().reshape(1,b.r.XN,1,b.r.CO)
-                y_tiled_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_y_tiled_sim.txt", np.float32).reshape(y_tiled_exp.shape)
-                error = np.max(np.abs(y_tiled_sim-y_tiled_exp))
-                assert np.allclose(y_tiled_sim, y_tiled_exp, atol=0.5), f"Error={error}, \nsub:\n{y_tiled_sim-y_tiled_exp} for y_tiled_sim at {b.ib=}. \n y_tiled_sim=\n{y_tiled_sim} \n y_tiled_exp=\n{y_tiled_exp}\n \npre_softmax=\n{b.pre_softmax}"
-            else:
-                y_tiled_exp = b.o_int
-                y_tiled_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_y_tiled_sim.txt", np.float32).reshape(y_tiled_exp.shape)
-                error = np.sum(np.abs(y_tiled_sim-y_tiled_exp))
-                assert error == 0, f"Error={error}, for y_tiled_sim at {b.ib=}"
+                tasks += [(('y_raw', ib, ip, it), dict(path=f"{path}_{ip}_{it}_y_raw_sim", **saved(f"{ib}_{ip}_{it}_y_exp", np.int32), vector_format=vector_format))]
+
+        ''' Sum output '''
+        tasks += [(('y_sum', ib, None, None), dict(path=f"{path}_y_sum_sim", **saved(f"{ib}_y_sum_exp", np.int32), vector_format=vector_format))]
+
+        ''' Processed output HWC'''
+        if not (is_last and b.softmax):
+            tasks += [(('y_nhwc', ib, None, None), dict(path=f"{path}_y_nhwc_sim", **saved(f"{ib}_y_nhwc_exp", np.int32), vector_format=vector_format))]
+
+        ''' Tiled output'''
+        if is_last and b.softmax:
+            exp, dtype, atol = saved("y_exp", np.float32), np.float32, 0.5
+        elif is_last:
+            exp, dtype, atol = saved("y_exp", np.int32), (np.float32 if vector_format=='txt' else np.int32), 0
         else:
-            y_tiled_exp = np.concatenate([a.flatten() for a in BUNDLES[ib+1].xe])
-            y_tiled_sim = np.loadtxt(f"{hw.DATA_DIR}/{b.ib}_y_tiled_sim.txt", np.float32).reshape(y_tiled_exp.shape)
-            error = np.sum(np.abs(y_tiled_sim-y_tiled_exp))
-            assert error == 0, f"Error={error}, for y_tiled_sim at {b.ib=}"
-
-        ''' Verify packed output'''
-        if ib != len(BUNDLES)-1 and len(b.next_ibs) != 0:
-            with open(f'{hw.DATA_DIR}/{ib}_y_packed_sim.bin', 'rb') as f_sim, open(f'{hw.DATA_DIR}/{ib+1}_x_sim.bin', 'rb') as f_exp:
-                y_packed_sim = np.frombuffer(f_sim.read(), dtype=np.uint8)
-                y_packed_exp = np.frombuffer(f_exp.read(), dtype=np.uint8)
-            diff  = y_packed_sim-y_packed_exp
-            error = np.sum(np.abs(diff))
-            assert error == 0, f"Error={error}, for y_packed_sim at {b.ib=}, y_packed_sim=\n{y_packed_sim[:100]} \n y_packed_exp=\n{y_packed_exp[:100]}\n, diff=\n{diff.tolist()}\n  y_packed_sim=\n{y_packed_sim.tolist()} \n y_packed_exp=\n{y_packed_exp.tolist()}\n"
-            
-        print(f"Bundle {b.ib}, Error: {error}. Passed")
\ No newline at end of file
+            exp, dtype, atol = saved(f"{ib+1}_xe", np.int8), (np.float32 if vector_format=='txt' else np.int8), 0
+        tasks += [(('y_tiled', ib, None, None), dict(path=f"{path}_y_tiled_sim", **exp, dtype=dtype, vector_format=vector_format, atol=atol))]
+
+        ''' Packed output'''
+        if not is_last and len(b.next_ibs) != 0:
+            tasks += [(('y_packed', ib, None, None), dict(path=f"{path}_y_packed_sim.bin", exp=f"{hw.DATA_DIR}/{ib+1}_x_sim.bin"))]
+
+
+    '''
+    CHECK ERROR
+    '''
+    workers = workers or os.cpu_count()
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    results = pool.map(_compare_task, tasks) if pool else map(_compare_task, tasks) # yielded in order of tasks
+    last_of_bundle = {t[0][1]: t[0] for t in tasks}
+
+    mismatch = None
+    try:
+        for ((name, ib, ip, it), _), result in zip(tasks, results):
+            if result is not None:
+                index, count, sim, exp = result
+                nhwc = mismatch_nhwc(hw, bundles, name, ib, it, index, sim, exp)
+                mismatch = Mismatch(name, ib, ip, it, index, nhwc, count, sim, exp)
+                break
+            if (name, ib, ip, it) == last_of_bundle[ib]:
+                print(f"Bundle {ib}, Error: 0. Passed")
+    finally:
+        if pool:
+            pool.shutdown(wait=True, cancel_futures=True) # early exit: drop the comparisons not yet started
+
+    if mismatch is None:
+        return None
+    print(mismatch)
+    assert not raise_on_error, f"{mismatch.count} mismatches in {mismatch.name}_sim at ib={mismatch.ib}, ip={mismatch.ip}, it={mismatch.it}. First at index {mismatch.index}, nhwc={mismatch.nhwc}: sim={mismatch.sim}, exp={mismatch.exp}"
+    return mismatch
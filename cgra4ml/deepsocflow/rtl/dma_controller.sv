@@ -220,7 +220,7 @@ module dma_controller #(
   // Increment m_xd_addr
   always_ff @(posedge clk)
     if (!rstn)               m_xd_addr <= 0;
-    else if (x_ram_rd_valid) m_xd_addr <= ram_xb_base_addr; // ib==0 ? mem.x : mem.out_buffers[bundles[ib].in_buffer_idx]
+    else if (x_ram_rd_valid) m_xd_addr <= ram_xb_base_addr; // ib==0 ? mem.x : mem.arena + bundles[ib].in_offset
     else if (lc_xt)          m_xd_addr <= m_xd_addr + AXI_ADDR_WIDTH'(m_xd_len); // increment address every p (after t transfers)
 
   always_ff @(posedge clk)
@@ -53,6 +53,7 @@ module axi_sys_tb;
 
   export "DPI-C" function get_config;
   export "DPI-C" function set_config;
+  export "DPI-C" function get_cycle;
   import "DPI-C" context function byte get_byte_a32 (int unsigned addr);
   import "DPI-C" context function void set_byte_a32 (int unsigned addr, byte data);
   import "DPI-C" context function chandle get_mp ();
@@ -66,6 +67,15 @@ module axi_sys_tb;
   endfunction
 
 
+  longint cycle = 0; // clocks since reset, timestamps of the cycle trace
+  always_ff @(posedge clk)
+    if (rstn) cycle <= cycle + 1;
+
+  function automatic longint get_cycle();
+    return cycle;
+  endfunction
+
+
   function automatic set_config(chandle config_base, input int offset, input int data);
     if (offset < 16) dut.OC_TOP.CONTROLLER.cfg        [offset   ] <= data;
     else             dut.OC_TOP.CONTROLLER.sdp_ram.RAM[offset-16] <= data;
@@ -94,14 +104,30 @@ module axi_sys_tb;
   //   $finish;
   // end
 
-  integer file_trace;
+  // Cycle trace of DMA transfers: cycle the descriptor is taken (begin) & the cycle its last byte moves (end)
+  `define TRACE_DMA(CH, DESC, LEN, BYTES, PENDING, MOVED) \
+    if (DESC) begin \
+      PENDING.push_back(LEN); \
+      $fdisplay(file_cycles, "%s,begin,%0d,%0d", CH, cycle, LEN); \
+    end \
+    MOVED += BYTES; \
+    while (PENDING.size() != 0 && MOVED >= PENDING[0]) begin \
+      $fdisplay(file_cycles, "%s,end,%0d,%0d", CH, cycle, PENDING[0]); \
+      MOVED -= PENDING.pop_front(); \
+    end
+
+  integer file_trace, file_cycles;
   int p_bytes, w_bytes, o_bytes, p_stall, w_stall, p_addr, w_addr, o_addr;
+  int x_pending[$], w_pending[$], o_pending[$];
+  int x_moved = 0, w_moved = 0, o_moved = 0;
   initial begin
     file_trace = $fopen("trace.csv", "w");
-    if (file_trace == 0) begin
+    file_cycles = $fopen("cycles_dma.csv", "w");
+    if (file_trace == 0 || file_cycles == 0) begin
         $display("ERROR: Could not open file.");
         $finish;
     end
+    $fdisplay(file_cycles, "channel,event,cycle,bytes");
     wait(rstn);
     forever begin
       @(posedge clk);
@@ -116,6 +142,11 @@ module axi_sys_tb;
       o_addr  = o_we_output ? (o_waddr_output  << LSB) : 0;
 
       $fdisplay(file_trace, "%d,%d,%d,%d,%d,%d,%d,%d", p_bytes, w_bytes, o_bytes, p_stall, w_stall, p_addr, w_addr, o_addr);
+
+      // reads move whole beats: lengths are rounded up to them
+      `TRACE_DMA("x", dut.OC_TOP.CONTROLLER.m_xd_valid && dut.OC_TOP.CONTROLLER.m_xd_ready, (int'(dut.OC_TOP.CONTROLLER.m_xd_len)+C_S_AXI_DATA_WIDTH/8-1)/(C_S_AXI_DATA_WIDTH/8)*(C_S_AXI_DATA_WIDTH/8), p_bytes, x_pending, x_moved)
+      `TRACE_DMA("w", dut.OC_TOP.CONTROLLER.m_wd_valid && dut.OC_TOP.CONTROLLER.m_wd_ready, (int'(dut.OC_TOP.CONTROLLER.m_wd_len)+C_S_AXI_DATA_WIDTH/8-1)/(C_S_AXI_DATA_WIDTH/8)*(C_S_AXI_DATA_WIDTH/8), w_bytes, w_pending, w_moved)
+      `TRACE_DMA("o", dut.OC_TOP.CONTROLLER.m_od_valid && dut.OC_TOP.CONTROLLER.m_od_ready, int'(dut.OC_TOP.CONTROLLER.m_od_len), o_bytes, o_pending, o_moved)
     end
   end
 
@@ -133,6 +164,7 @@ module axi_sys_tb;
 
     print_output(mpv);
     $fclose(file_trace);
+    $fclose(file_cycles);
     $finish;
   end
 
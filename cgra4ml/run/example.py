@@ -182,10 +182,10 @@ hw.export_vivado_tcl(board='zcu104')
 '''
 VERIFY & EXPORT
 '''
-export_inference(loaded_model, hw, batch_size=1)
-verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH)
+graph = export_inference(loaded_model, hw, batch_size=1)
+verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH, graph=graph)
 
-d_perf = predict_model_performance(hw)
+d_perf = predict_model_performance(hw, graph)
 pp = pprint.PrettyPrinter(indent=4)
 print(f"Predicted Performance")
 pp.pprint(d_perf)
\ No newline at end of file
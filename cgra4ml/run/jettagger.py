@@ -162,10 +162,6 @@ loaded_model = load_qmodel("mnist.h5")
 
 
 
-def product_dict(**kwargs):
-    for instance in itertools.product(*(kwargs.values())):
-        yield dict(zip(kwargs.keys(), instance))
-
 @pytest.mark.parametrize("PARAMS", list(product_dict(
                                         processing_elements  = [(16,32)   ],
                                         frequency_mhz        = [ 250     ],
@@ -202,10 +198,10 @@ def test_dnn_engine(PARAMS):
     '''
     VERIFY & EXPORT
     '''
-    export_inference(loaded_model, hw, hw.ROWS)
-    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH)
+    graph = export_inference(loaded_model, hw, hw.ROWS)
+    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH, graph=graph)
 
-    d_perf = predict_model_performance(hw)
+    d_perf = predict_model_performance(hw, graph)
     pp = pprint.PrettyPrinter(indent=4)
     print(f"Predicted Performance")
     pp.pprint(d_perf)
@@ -12,6 +12,7 @@ from keras.utils import to_categorical
 from qkeras.utils import load_qmodel
 import numpy as np
 import pprint
+from functools import partial
 #from read_point_cloud import * 
 #from preprocess import *
 import tensorflow as tf
@@ -240,7 +241,8 @@ model.summary(expand_nested=True)
 Save & Reload
 '''
 
-save_model(model, "mnist.h5")
+if __name__ != '__mp_main__': # sweep workers (spawn) import this script again, for the model classes only
+    save_model(model, "mnist.h5")
 loaded_model = load_qmodel("mnist.h5")
 
 #score = loaded_model.evaluate(test_loader, verbose=0)
@@ -249,11 +251,7 @@ loaded_model = load_qmodel("mnist.h5")
 
 
 
-def product_dict(**kwargs):
-    for instance in itertools.product(*(kwargs.values())):
-        yield dict(zip(kwargs.keys(), instance))
-
-@pytest.mark.parametrize("PARAMS", list(product_dict(
+POINTS = list(product_dict(
                                         processing_elements  = [(16,32)   ],
                                         frequency_mhz        = [ 250     ],
                                         bits_input           = [ 8       ],
@@ -273,7 +271,9 @@ def product_dict(**kwargs):
                                         valid_prob           = [ 1     ],
                                         ready_prob           = [ 1     ],
                                         data_dir             = ['vectors'],
-                                    )))
+                                    ))
+
+@pytest.mark.parametrize("PARAMS", POINTS)
 def test_dnn_engine(PARAMS):
 
     '''
@@ -289,10 +289,17 @@ def test_dnn_engine(PARAMS):
     '''
     VERIFY & EXPORT
     '''
-    export_inference(loaded_model, hw, hw.ROWS)
-    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH)
+    graph = export_inference(loaded_model, hw, hw.ROWS)
+    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH, graph=graph)
 
-    d_perf = predict_model_performance(hw)
+    d_perf = predict_model_performance(hw, graph)
     pp = pprint.PrettyPrinter(indent=4)
     print(f"Predicted Performance")
     pp.pprint(d_perf)
+
+
+if __name__ == '__main__':
+    '''
+    Runs POINTS in parallel, each in its own workspace under sweep/, with a batch of hw.ROWS. pytest runs them one at a time, in this directory.
+    '''
+    run_sweep(partial(verify_point, model_path=os.path.abspath("mnist.h5"), SIM=SIM, SIM_PATH=SIM_PATH, batch_size=None, cache_dir=os.path.abspath("cache")), POINTS)
@@ -86,10 +86,6 @@ Save & Reload
 save_model(model, "resnet50.h5")
 loaded_model = load_qmodel("resnet50.h5")
 
-def product_dict(**kwargs):
-    for instance in itertools.product(*(kwargs.values())):
-        yield dict(zip(kwargs.keys(), instance))
-
 @pytest.mark.parametrize("PARAMS", list(product_dict(
                                         processing_elements  = [(7,96)   ],
                                         frequency_mhz        = [ 250     ],
@@ -126,10 +122,10 @@ def test_dnn_engine(PARAMS):
     '''
     VERIFY & EXPORT
     '''
-    export_inference(loaded_model, hw, batch_size=1)
-    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH)
+    graph = export_inference(loaded_model, hw, batch_size=1)
+    verify_inference(loaded_model, hw, SIM=SIM, SIM_PATH=SIM_PATH, graph=graph)
 
-    d_perf = predict_model_performance(hw)
+    d_perf = predict_model_performance(hw, graph)
     pp = pprint.PrettyPrinter(indent=4)
     print(f"Predicted Performance")
     pp.pprint(d_perf)
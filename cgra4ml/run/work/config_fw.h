@@ -1,59 +1,59 @@
 #define N_BUNDLES 54
 Bundle_t bundles [N_BUNDLES] = {
-   {.n=7  , .l=32 , .kw=7  , .coe=13 , .h=224, .w=224, .ci=3   , .co=64  , .w_kw2=221, .t=5  , .p=1  , .cm=73 , .cm_p0=3  , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=112, .ph=56 , .cw=112, .pw=56 , .pkh=3  , .psh=2  , .pkw=3  , .psw=2  , .xp_words=551936, .b_offset=0    , .w_bpt=1008 , .w_bpt_p0=1008 , .x_bpt=827904  , .x_bpt_p0=827904  , .o_words=1404928 , .o_bytes=702464  , .ib_out=1   , .in_buffer_idx=-1 , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=1  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=1  , .psh_shift=0  , .csw=2  , .csw_shift=1  , .psw_shift=0  , .pool=POOL_MAX  , .softmax_max_f=0              , .header=    2297012575781648123u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=65   , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=1404928 , .o_bytes=702464  , .ib_out=-1  , .in_buffer_idx=0  , .out_buffer_idx=-1 , .add_out_buffer_idx=0 , .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=353  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=2207744 , .o_bytes=1103872 , .ib_out=3   , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=15 , .ca_pl_scale=3  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=449  , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=4   , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=513  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=5   , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=801  , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=2207744 , .o_bytes=1103872 , .ib_out=6   , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=897  , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=7   , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=961  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=8   , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=0 , .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1249 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=2207744 , .o_bytes=1103872 , .ib_out=9   , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=1345 , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=10  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1409 , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=11  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=512 , .w_kw2=56 , .t=6  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1697 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=5619712 , .o_bytes=2809856 , .ib_out=-1  , .in_buffer_idx=1  , .out_buffer_idx=-1 , .add_out_buffer_idx=0 , .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=2809856   },
-   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=128 , .w_kw2=56 , .t=2  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=2273 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=1103872 , .o_bytes=551936  , .ib_out=13  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=2465 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=14  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=2593 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=15  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=3169 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=16  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=3361 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=17  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=3489 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=18  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=0 , .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4065 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=19  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=4257 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=20  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4385 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=21  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4961 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=22  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=5153 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=23  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=5281 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=24  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=1024, .w_kw2=28 , .t=11 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=5857 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=2809856 , .o_bytes=1404928 , .ib_out=-1  , .in_buffer_idx=1  , .out_buffer_idx=-1 , .add_out_buffer_idx=0 , .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=256 , .w_kw2=28 , .t=3  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=6913 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=551936  , .o_bytes=275968  , .ib_out=26  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=7201 , .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=27  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=7457 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=28  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=8513 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=29  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=8801 , .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=30  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=9057 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=31  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=0 , .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=10113, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=32  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=10401, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=33  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=10657, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=34  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=11713, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=35  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=12001, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=36  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=12257, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=37  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=0 , .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=13313, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=38  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=13601, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=39  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=13857, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=40  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=14913, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=41  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=15201, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=42  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=15457, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=43  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=2048, .w_kw2=14 , .t=22 , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=16513, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=1404928 , .o_bytes=702464  , .ib_out=-1  , .in_buffer_idx=1  , .out_buffer_idx=-1 , .add_out_buffer_idx=0 , .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=512 , .w_kw2=14 , .t=6  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=18625, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=275968  , .o_bytes=137984  , .ib_out=45  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=19201, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=46  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=19713, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=702464  , .o_bytes=351232  , .ib_out=47  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=1 , .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=2048, .co=512 , .w_kw2=7  , .t=6  , .p=4  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=21825, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=275968  , .o_bytes=137984  , .ib_out=48  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=22401, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=49  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=22913, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=702464  , .o_bytes=351232  , .ib_out=50  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=0 , .add_in_buffer_idx=1 , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=702464    },
-   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=2048, .co=512 , .w_kw2=7  , .t=6  , .p=4  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=25025, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=275968  , .o_bytes=137984  , .ib_out=51  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=25601, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=52  , .in_buffer_idx=0  , .out_buffer_idx=1  , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
-   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=1  , .oh=7  , .ow=1  , .oc=2048, .ch=7  , .ph=1  , .cw=7  , .pw=1  , .pkh=7  , .psh=7  , .pkw=7  , .psw=7  , .xp_words=343   , .b_offset=26113, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=14336   , .o_bytes=7168    , .ib_out=53  , .in_buffer_idx=1  , .out_buffer_idx=0  , .add_out_buffer_idx=-1, .add_in_buffer_idx=0 , .is_bias=1  , .is_flatten=1  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=1  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_AVG  , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=14336     },
-   {.n=1  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=1  , .ci=2048, .co=1000, .w_kw2=1  , .t=11 , .p=4  , .cm=512, .cm_p0=512, .on=1  , .oh=7  , .ow=1  , .oc=1000, .ch=7  , .ph=7  , .cw=1  , .pw=1  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=7     , .b_offset=28225, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1792    , .x_bpt_p0=1792    , .o_words=7000    , .o_bytes=28000   , .ib_out=-1  , .in_buffer_idx=0  , .out_buffer_idx=-1 , .add_out_buffer_idx=-1, .add_in_buffer_idx=-1, .is_bias=0  , .is_flatten=0  , .is_softmax=1  , .x_pad=0  , .b_val_shift=0  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=3  , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=3  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0.875          , .header=    2305834350559100928u, .debug_nhwc_words=7000      }
+   {.n=7  , .l=32 , .kw=7  , .coe=13 , .h=224, .w=224, .ci=3   , .co=64  , .w_kw2=221, .t=5  , .p=1  , .cm=73 , .cm_p0=3  , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=112, .ph=56 , .cw=112, .pw=56 , .pkh=3  , .psh=2  , .pkw=3  , .psw=2  , .xp_words=551936, .b_offset=0    , .w_bpt=1008 , .w_bpt_p0=1008 , .x_bpt=827904  , .x_bpt_p0=827904  , .o_words=1404928 , .o_bytes=702464  , .ib_out=1   , .in_offset=ARENA_NONE, .out_offset=6723584   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=1  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=1  , .psh_shift=0  , .csw=2  , .csw_shift=1  , .psw_shift=0  , .pool=POOL_MAX  , .softmax_max_f=0              , .header=    2297012575781648123u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=65   , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=1404928 , .o_bytes=702464  , .ib_out=-1  , .in_offset=6723584   , .out_offset=ARENA_NONE, .add_out_offset=0         , .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=353  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=2207744 , .o_bytes=1103872 , .ib_out=3   , .in_offset=6723584   , .out_offset=5619712   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=15 , .ca_pl_scale=3  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=449  , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=4   , .in_offset=5619712   , .out_offset=14049280  , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=513  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=5   , .in_offset=14049280  , .out_offset=11239424  , .add_out_offset=5619712   , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=801  , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=2207744 , .o_bytes=1103872 , .ib_out=6   , .in_offset=11239424  , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=897  , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=7   , .in_offset=0         , .out_offset=14049280  , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=961  , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=8   , .in_offset=14049280  , .out_offset=11239424  , .add_out_offset=0         , .add_in_offset=5619712   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=64  , .w_kw2=56 , .t=1  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1249 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=2207744 , .o_bytes=1103872 , .ib_out=9   , .in_offset=11239424  , .out_offset=5619712   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=3  , .coe=32 , .h=56 , .w=56 , .ci=64  , .co=64  , .w_kw2=55 , .t=2  , .p=1  , .cm=170, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=64  , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=34496 , .b_offset=1345 , .w_bpt=9216 , .w_bpt_p0=9216 , .x_bpt=1103872 , .x_bpt_p0=1103872 , .o_words=1404928 , .o_bytes=702464  , .ib_out=10  , .in_offset=5619712   , .out_offset=8429568   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294013134131196345u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=64  , .co=256 , .w_kw2=56 , .t=3  , .p=1  , .cm=512, .cm_p0=64 , .on=7  , .oh=56 , .ow=56 , .oc=256 , .ch=56 , .ph=56 , .cw=56 , .pw=56 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1409 , .w_bpt=3072 , .w_bpt_p0=3072 , .x_bpt=702464  , .x_bpt_p0=702464  , .o_words=5619712 , .o_bytes=2809856 , .ib_out=11  , .in_offset=8429568   , .out_offset=5619712   , .add_out_offset=ARENA_NONE, .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2301894525284020664u, .debug_nhwc_words=5619712   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=512 , .w_kw2=56 , .t=6  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=1697 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=5619712 , .o_bytes=2809856 , .ib_out=-1  , .in_offset=5619712   , .out_offset=ARENA_NONE, .add_out_offset=0         , .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=2809856   },
+   {.n=7  , .l=8  , .kw=1  , .coe=96 , .h=56 , .w=56 , .ci=256 , .co=128 , .w_kw2=56 , .t=2  , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=21952 , .b_offset=2273 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=2809856 , .x_bpt_p0=2809856 , .o_words=1103872 , .o_bytes=551936  , .ib_out=13  , .in_offset=5619712   , .out_offset=2809856   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244947896u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=2465 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=14  , .in_offset=2809856   , .out_offset=7024640   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=2593 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=15  , .in_offset=7024640   , .out_offset=5619712   , .add_out_offset=2809856   , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=3169 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=16  , .in_offset=5619712   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=3361 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=17  , .in_offset=0         , .out_offset=7024640   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=3489 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=18  , .in_offset=7024640   , .out_offset=5619712   , .add_out_offset=0         , .add_in_offset=2809856   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4065 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=19  , .in_offset=5619712   , .out_offset=2809856   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=4257 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=20  , .in_offset=2809856   , .out_offset=7024640   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4385 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=21  , .in_offset=7024640   , .out_offset=5619712   , .add_out_offset=2809856   , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=128 , .w_kw2=28 , .t=2  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=4961 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=1103872 , .o_bytes=551936  , .ib_out=22  , .in_offset=5619712   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=3  , .coe=32 , .h=28 , .w=28 , .ci=128 , .co=128 , .w_kw2=27 , .t=4  , .p=1  , .cm=170, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=128 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=8624  , .b_offset=5153 , .w_bpt=18432, .w_bpt_p0=18432, .x_bpt=551936  , .x_bpt_p0=551936  , .o_words=702464  , .o_bytes=351232  , .ib_out=23  , .in_offset=0         , .out_offset=1404928   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2295701984024998105u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=128 , .co=512 , .w_kw2=28 , .t=6  , .p=1  , .cm=512, .cm_p0=128, .on=7  , .oh=28 , .ow=28 , .oc=512 , .ch=28 , .ph=28 , .cw=28 , .pw=28 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=5281 , .w_bpt=6144 , .w_bpt_p0=6144 , .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=2809856 , .o_bytes=1404928 , .ib_out=24  , .in_offset=1404928   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=2809856   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2302457475270979800u, .debug_nhwc_words=2809856   },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=1024, .w_kw2=28 , .t=11 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=5857 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=2809856 , .o_bytes=1404928 , .ib_out=-1  , .in_offset=0         , .out_offset=ARENA_NONE, .add_out_offset=1404928   , .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=4  , .kw=1  , .coe=96 , .h=28 , .w=28 , .ci=512 , .co=256 , .w_kw2=28 , .t=3  , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=5488  , .b_offset=6913 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1404928 , .x_bpt_p0=1404928 , .o_words=551936  , .o_bytes=275968  , .ib_out=26  , .in_offset=0         , .out_offset=2809856   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192834264u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=7201 , .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=27  , .in_offset=2809856   , .out_offset=3512320   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=7457 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=28  , .in_offset=3512320   , .out_offset=2809856   , .add_out_offset=0         , .add_in_offset=1404928   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=8513 , .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=29  , .in_offset=2809856   , .out_offset=1404928   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=8801 , .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=30  , .in_offset=1404928   , .out_offset=3512320   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=9057 , .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=31  , .in_offset=3512320   , .out_offset=2809856   , .add_out_offset=1404928   , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=10113, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=32  , .in_offset=2809856   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=10401, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=33  , .in_offset=0         , .out_offset=3512320   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=10657, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=34  , .in_offset=3512320   , .out_offset=2809856   , .add_out_offset=0         , .add_in_offset=1404928   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=11713, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=35  , .in_offset=2809856   , .out_offset=1404928   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=12001, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=36  , .in_offset=1404928   , .out_offset=3512320   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=12257, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=37  , .in_offset=3512320   , .out_offset=2809856   , .add_out_offset=1404928   , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=13313, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=38  , .in_offset=2809856   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=13601, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=39  , .in_offset=0         , .out_offset=3512320   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=13857, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=40  , .in_offset=3512320   , .out_offset=2809856   , .add_out_offset=0         , .add_in_offset=1404928   , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=256 , .w_kw2=14 , .t=3  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=14913, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=551936  , .o_bytes=275968  , .ib_out=41  , .in_offset=2809856   , .out_offset=1404928   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=3  , .coe=32 , .h=14 , .w=14 , .ci=256 , .co=256 , .w_kw2=13 , .t=8  , .p=2  , .cm=170, .cm_p0=86 , .on=7  , .oh=14 , .ow=14 , .oc=256 , .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=2156  , .b_offset=15201, .w_bpt=24480, .w_bpt_p0=12384, .x_bpt=183260  , .x_bpt_p0=92708   , .o_words=351232  , .o_bytes=175616  , .ib_out=42  , .in_offset=1404928   , .out_offset=2107392   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2294593676282171497u, .debug_nhwc_words=351232    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=256 , .co=1024, .w_kw2=14 , .t=11 , .p=1  , .cm=512, .cm_p0=256, .on=7  , .oh=14 , .ow=14 , .oc=1024, .ch=14 , .ph=14 , .cw=14 , .pw=14 , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=15457, .w_bpt=12288, .w_bpt_p0=12288, .x_bpt=175616  , .x_bpt_p0=175616  , .o_words=1404928 , .o_bytes=702464  , .ib_out=43  , .in_offset=2107392   , .out_offset=1404928   , .add_out_offset=ARENA_NONE, .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2303583375244922984u, .debug_nhwc_words=1404928   },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=2048, .w_kw2=14 , .t=22 , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=16513, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=1404928 , .o_bytes=702464  , .ib_out=-1  , .in_offset=1404928   , .out_offset=ARENA_NONE, .add_out_offset=0         , .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=2  , .kw=1  , .coe=96 , .h=14 , .w=14 , .ci=1024, .co=512 , .w_kw2=14 , .t=6  , .p=2  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=1372  , .b_offset=18625, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=351232  , .x_bpt_p0=351232  , .o_words=275968  , .o_bytes=137984  , .ib_out=45  , .in_offset=1404928   , .out_offset=702464    , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=2  , .csh_shift=0  , .psh_shift=0  , .csw=2  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192825960u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=19201, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=46  , .in_offset=702464    , .out_offset=1756160   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=19713, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=702464  , .o_bytes=351232  , .ib_out=47  , .in_offset=1756160   , .out_offset=1404928   , .add_out_offset=702464    , .add_in_offset=0         , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=2048, .co=512 , .w_kw2=7  , .t=6  , .p=4  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=21825, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=275968  , .o_bytes=137984  , .ib_out=48  , .in_offset=1404928   , .out_offset=0         , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=22401, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=49  , .in_offset=0         , .out_offset=1756160   , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=2048, .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=22913, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=702464  , .o_bytes=351232  , .ib_out=50  , .in_offset=1756160   , .out_offset=1404928   , .add_out_offset=0         , .add_in_offset=702464    , .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=702464    },
+   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=2048, .co=512 , .w_kw2=7  , .t=6  , .p=4  , .cm=512, .cm_p0=512, .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=343   , .b_offset=25025, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=275968  , .o_bytes=137984  , .ib_out=51  , .in_offset=1404928   , .out_offset=702464    , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=3  , .coe=32 , .h=7  , .w=7  , .ci=512 , .co=512 , .w_kw2=6  , .t=16 , .p=4  , .cm=170, .cm_p0=2  , .on=7  , .oh=7  , .ow=7  , .oc=512 , .ch=7  , .ph=7  , .cw=7  , .pw=7  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=539   , .b_offset=25601, .w_bpt=24480, .w_bpt_p0=288  , .x_bpt=45815   , .x_bpt_p0=539     , .o_words=175616  , .o_bytes=87808   , .ib_out=52  , .in_offset=702464    , .out_offset=840448    , .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=1  , .is_flatten=0  , .is_softmax=0  , .x_pad=4  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=0  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0              , .header=    2292377060796530737u, .debug_nhwc_words=175616    },
+   {.n=7  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=7  , .ci=512 , .co=2048, .w_kw2=7  , .t=22 , .p=1  , .cm=512, .cm_p0=512, .on=1  , .oh=7  , .ow=1  , .oc=2048, .ch=7  , .ph=1  , .cw=7  , .pw=1  , .pkh=7  , .psh=7  , .pkw=7  , .psw=7  , .xp_words=343   , .b_offset=26113, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=87808   , .x_bpt_p0=87808   , .o_words=14336   , .o_bytes=7168    , .ib_out=53  , .in_offset=840448    , .out_offset=702464    , .add_out_offset=ARENA_NONE, .add_in_offset=0         , .is_bias=1  , .is_flatten=1  , .is_softmax=0  , .x_pad=0  , .b_val_shift=9  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=12 , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=1  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=0  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_AVG  , .softmax_max_f=0              , .header=    2305835175192821808u, .debug_nhwc_words=14336     },
+   {.n=1  , .l=1  , .kw=1  , .coe=96 , .h=7  , .w=1  , .ci=2048, .co=1000, .w_kw2=1  , .t=11 , .p=4  , .cm=512, .cm_p0=512, .on=1  , .oh=7  , .ow=1  , .oc=1000, .ch=7  , .ph=7  , .cw=1  , .pw=1  , .pkh=1  , .psh=1  , .pkw=1  , .psw=1  , .xp_words=7     , .b_offset=28225, .w_bpt=24576, .w_bpt_p0=24576, .x_bpt=1792    , .x_bpt_p0=1792    , .o_words=7000    , .o_bytes=28000   , .ib_out=-1  , .in_offset=702464    , .out_offset=ARENA_NONE, .add_out_offset=ARENA_NONE, .add_in_offset=ARENA_NONE, .is_bias=0  , .is_flatten=0  , .is_softmax=1  , .x_pad=0  , .b_val_shift=0  , .b_bias_shift=0  , .ca_nzero=1  , .ca_shift=3  , .ca_pl_scale=0  , .aa_nzero=0  , .aa_shift=0  , .aa_pl_scale=0  , .pa_nzero=0  , .pa_shift=0  , .pa_pl_scale=0  , .softmax_frac=3  , .csh=1  , .csh_shift=0  , .psh_shift=0  , .csw=1  , .csw_shift=0  , .psw_shift=0  , .pool=POOL_NONE , .softmax_max_f=0.875          , .header=    2305834350559100928u, .debug_nhwc_words=7000      }
 };
 
 #define X_BITS_L2   2
@@ -62,8 +62,7 @@ Bundle_t bundles [N_BUNDLES] = {
 #define PE_ROWS     7
 #define PE_COLS     96
 
-#define N_OUT_BUF   2
-#define N_ADD_BUF   2
+#define ARENA_BYTES 14751744
 #define WB_BYTES    13329458
 #define W_BYTES     13273008
 #define X_BYTES     827904
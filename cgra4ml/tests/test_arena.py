@@ -0,0 +1,64 @@
+import contextlib
+import io
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from deepsocflow.py.arena import *
+
+'''
+Arena planner (arena.py): live buffers never share bytes, offsets are aligned, and the arena fits them all
+'''
+
+rng = np.random.default_rng(0)
+
+
+def check_placement(placed, arena_bytes, n_bundles, align=ARENA_ALIGN):
+    for p in placed:
+        assert p.offset % align == 0 and p.offset + p.bytes <= arena_bytes
+    for i, p in enumerate(placed):
+        for q in placed[i+1:]:
+            if p.first <= q.last and q.first <= p.last:
+                assert p.offset + p.bytes <= q.offset or q.offset + q.bytes <= p.offset, (p, q)
+    assert peak_live_bytes(placed, n_bundles, align) <= arena_bytes
+
+
+@pytest.mark.parametrize('n_bundles, n_buffers', [(5, 3), (20, 30), (54, 70), (8, 40)])
+def test_plan_arena(n_bundles, n_buffers):
+    buffers = []
+    for i in range(n_buffers):
+        first = int(rng.integers(0, n_bundles))
+        last = int(rng.integers(first, min(first + 4, n_bundles)))
+        buffers += [ArenaBuffer('out' if i % 2 else 'add', first, first, last, int(rng.integers(1, 10_000)), None)]
+    placed, arena_bytes = plan_arena(buffers)
+    assert [p._replace(offset=None) for p in placed] == buffers
+    check_placement(placed, arena_bytes, n_bundles)
+
+
+def test_plan_arena_reuse():
+    '''Buffers of disjoint lifetimes share bytes: a chain needs only two buffers'''
+    buffers = [ArenaBuffer('out', i, i, i+1, 1000, None) for i in range(10)]
+    placed, arena_bytes = plan_arena(buffers)
+    assert arena_bytes == 2*align_up(1000) == peak_live_bytes(placed, 11)
+    assert plan_arena([]) == ([], 0)
+
+
+def bundle(next_ibs, next_add_ibs=(), words=64, CP=1, shape=(1, 4, 4, 8)):
+    ON, OH, OW, OC = shape
+    return SimpleNamespace(next_ibs=list(next_ibs), next_add_ibs=list(next_add_ibs), xe_words=[words], o_int_shape=shape,
+                           r=SimpleNamespace(CP=CP, ON=ON, OH=OH, OW=OW, OC=OC, XN=ON, XH=OH, XW=OW, CO=OC))
+
+
+def test_plan_bundle_buffers():
+    '''A residual block: 0 -> (1 shortcut, add only) & 2 -> 3 (+ add of 1) -> 4'''
+    hw = SimpleNamespace(X_BITS=4)
+    bundles = [bundle([1, 2]), bundle([], [3]), bundle([3], words=100, CP=2), bundle([4], words=300), bundle([])]
+    with contextlib.redirect_stdout(io.StringIO()):
+        buffers, report = plan_bundle_buffers(hw, bundles)
+    check_placement(buffers, report['arena_bytes'], len(bundles))
+    assert [b.out_offset == -1 for b in bundles] == [False, True, False, False, True]
+    assert [b.add_out_offset == -1 for b in bundles] == [True, False, True, True, True]
+    assert get_out_bytes(hw, bundles, 1)[1] == 2*(4*100)//8 and get_out_bytes(hw, bundles, 2)[1] == (4*300)//8
+    assert get_out_bytes(hw, bundles, 4) == (128, 512)  # last: O_TYPE nhwc
+    assert report['peak_live_bytes'] <= report['arena_bytes'] <= report['legacy_bytes']
+    assert [c_offset(b.out_offset) == 'ARENA_NONE' for b in bundles] == [b.out_offset == -1 for b in bundles]
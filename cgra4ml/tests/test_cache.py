@@ -0,0 +1,74 @@
+import os
+import pickle
+import numpy as np
+import pytest
+
+from deepsocflow.py.utils import *
+from deepsocflow.py.cache import *
+
+'''
+Content-addressed cache (cache.py): keys, entries & linked vectors
+'''
+
+rng = np.random.default_rng(0)
+
+
+def test_hash_content():
+    a = rng.integers(-8, 8, (4, 5))
+    assert hash_content(a, [1, 2], {'x': 1}) == hash_content(a.copy(), [1, 2], {'x': 1})
+    assert hash_content(a) != hash_content(a.astype(np.int32))      # dtype
+    assert hash_content(a) != hash_content(a.reshape(5, 4))         # shape
+    assert hash_content([1, 2]) != hash_content((1, 2)) != hash_content([[1], 2])
+    assert hash_content({'x': 1, 'y': 2}) == hash_content({'y': 2, 'x': 1})
+
+
+def test_golden_cache_key():
+    weights = [rng.standard_normal((3, 3, 4, 8)).astype(np.float32), np.zeros(8, np.float32)]
+    args = dict(weights=weights, config='{}', batch_size=1, backend='tf', INT_BITS=32, seed=0, verify='full')
+    key = golden_cache_key(**args)
+    assert key == golden_cache_key(**{**args, 'weights': [w.copy() for w in weights]})
+    for k, v in [('seed', 1), ('batch_size', 2), ('backend', 'numpy'), ('verify', 'off'), ('INT_BITS', 64), ('config', '{"a": 1}')]:
+        assert golden_cache_key(**{**args, k: v}) != key, k
+    assert golden_cache_key(**{**args, 'weights': [weights[0], weights[1] + 1]}) != key
+
+
+def test_cache_store_load(tmp_path):
+    key = hash_content('entry')
+    assert cache_load(tmp_path, key) is None
+    arrays = {'we': [rng.integers(-8, 8, (2, 30))], 'shape': (1, 2, 3)}
+    cache_store(tmp_path, key, arrays)
+    cache_store(tmp_path, key, {'we': None})  # stored once: later stores are dropped
+    loaded = cache_load(tmp_path, key)
+    assert np.array_equal(loaded['we'][0], arrays['we'][0]) and loaded['shape'] == (1, 2, 3)
+    assert os.listdir(f'{tmp_path}/{key[:2]}') == [key]
+
+
+def test_vectors(tmp_path):
+    cache_dir, data_dir = f'{tmp_path}/cache', f'{tmp_path}/data'
+    os.makedirs(data_dir)
+    key = hash_content('bundle')
+    assert not has_vectors(cache_dir, key, 'bin')
+    tmp = begin_vectors(cache_dir, key, 'bin')
+    with open(f'{tmp}/y_exp.bin', 'wb') as f:
+        f.write(b'\x01\x02')
+    assert not has_vectors(cache_dir, key, 'bin')
+    end_vectors(cache_dir, key, 'bin', tmp)
+    assert has_vectors(cache_dir, key, 'bin')
+
+    with open(f'{data_dir}/3_y_exp.bin', 'wb') as f:
+        f.write(b'stale')
+    link_vectors(cache_dir, key, 'bin', data_dir, prefix='3_')
+    with open(f'{data_dir}/3_y_exp.bin', 'rb') as f:
+        assert f.read() == b'\x01\x02'
+    assert os.stat(f'{data_dir}/3_y_exp.bin').st_ino == os.stat(f'{vectors_path(cache_dir, key, "bin")}/y_exp.bin').st_ino
+
+
+def test_xtensor_pickle():
+    '''Golden passes are cached as pickled XTensors: the integers are kept exactly, without TF'''
+    ints = rng.integers(-2**40, 2**40, (2, 3, 4))
+    x = XTensor(ints, bits=42, frac=7, from_int=True)
+    y = pickle.loads(pickle.dumps(x))
+    assert y.exact and y.iarray.dtype == np.int64 and np.array_equal(y.iarray, ints)
+    assert (y.bits, y.frac, y.int, y.shape) == (42, 7, 34, (2, 3, 4))
+    empty = pickle.loads(pickle.dumps(XTensor(None, None, float_only=True)))
+    assert empty.float_only and empty.ftensor is None
@@ -0,0 +1,96 @@
+import contextlib
+import io
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from deepsocflow.py.hardware import Hardware
+from deepsocflow.py import dataflow
+from deepsocflow.py.dataflow import *
+
+'''
+Reorders to the engine order (dataflow.py) against loop definitions of the layouts, and the cached gather maps against the layout_* chains
+'''
+
+rng = np.random.default_rng(0)
+
+HW = Hardware(processing_elements=(8,24), bits_input=4, bits_weights=4, bits_sum=24, bits_bias=16, max_image_size=(32,32),
+              max_channels_in=256, ram_edges_depth=2048, max_kernel_size=7)
+
+SHAPES = [  # (XN, XH, XW, CI, CO, K)
+    (1, 16, 16, 40, 30, 3),
+    (2, 9, 7, 5, 11, 1),
+    (1, 13, 5, 300, 17, 3),   # several passes
+    (3, 4, 4, 3, 50, 3),      # several iterations
+    (1, 12, 8, 8, 8, 5),
+]
+
+
+def runtime(hw, XN, XH, XW, CI, CO, K):
+    core = SimpleNamespace(type='conv', strides=(1,1), padding='same', kernel_size=(K,K))
+    with contextlib.redirect_stdout(io.StringIO()):
+        return create_headers(hw, get_runtime_params(hw, (K,K,CI,CO), (XN,XH,XW,CI), (XN,XH,XW,CO), core, None, False))
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_reorder_x_q2e_conv(shape):
+    r = runtime(HW, *shape)
+    x = rng.integers(-8, 8, shape[:4])
+    words_per_byte = 8//HW.X_BITS
+
+    ic = 0
+    for ip, xp in enumerate(reorder_x_q2e_conv(x, HW, r)):
+        CM_p = r.CM_0 if ip == 0 else r.CM
+        exp = np.zeros((r.XN, r.XL, r.XW, CM_p, HW.ROWS+r.X_PAD), x.dtype)
+        for l in range(r.XL):
+            for i in range(HW.ROWS+r.X_PAD):
+                if l*HW.ROWS+i < r.XH:
+                    exp[:, l, :, :, i] = x[:, l*HW.ROWS+i, :, ic:ic+CM_p]
+        assert xp.size == -(-exp.size//words_per_byte)*words_per_byte
+        assert np.array_equal(xp[:exp.size], exp.flatten()) and not xp[exp.size:].any()
+        ic += CM_p
+    assert ic == r.CI
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_reorder_w_q2e_conv(shape):
+    r = runtime(HW, *shape)
+    w = rng.integers(-8, 8, (r.KH, r.KW, r.CI, r.CO))
+    we, exp = reorder_w_q2e_conv(w, HW, r), layout_w_q2e_conv(w, HW, r)
+    assert len(we) == len(exp) == r.CP
+    for wp, ep in zip(we, exp):
+        assert wp.dtype == w.dtype and np.array_equal(wp, ep)
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_reorder_y_q2e_e2q_conv(shape):
+    r = runtime(HW, *shape)
+    y = rng.integers(-2**20, 2**20, (r.XN, r.XH, r.XW, r.CO))
+    ye = reorder_y_q2e_conv(y, HW, r)
+    assert np.array_equal(ye, layout_y_q2e_conv(y, HW, r))
+    assert np.array_equal(reorder_y_e2q_conv(ye, HW, r), y)
+    assert np.array_equal(reorder_y_e2q_conv(ye, HW, r), layout_y_e2q_conv(ye, HW, r))
+
+
+@pytest.mark.parametrize('shape', SHAPES)
+def test_index_to_nhwc(shape):
+    r = runtime(HW, *shape)
+    y = rng.integers(1, 2**20, (r.XN, r.XH, r.XW, r.CO))  # no zeros: a zero in the output is padding
+    ye = reorder_y_q2e_conv(y, HW, r).reshape(-1)
+    maps = [y_q2e_map(y.shape, HW, r)]
+    for i in range(ye.size):
+        nhwc = index_to_nhwc(maps, y.shape, i)
+        assert (ye[i] == 0) if nhwc is None else (ye[i] == y[nhwc])
+    assert index_to_nhwc(maps, y.shape, ye.size) is None
+
+
+def test_reorder_maps_bytes(monkeypatch):
+    monkeypatch.setattr(dataflow, 'REORDER_MAPS', dataflow.OrderedDict())
+    monkeypatch.setattr(dataflow, 'REORDER_CACHE_BYTES', 200_000)
+    for shape in SHAPES:
+        r = runtime(HW, *shape)
+        reorder_y_q2e_conv(np.zeros((r.XN, r.XH, r.XW, r.CO), np.int32), HW, r)
+        reorder_w_q2e_conv(np.zeros((r.KH, r.KW, r.CI, r.CO), np.int8), HW, r)
+        assert sum(maps_bytes(m) for m in dataflow.REORDER_MAPS.values()) <= 200_000
+    assert all(index.dtype == np.int32 for m in dataflow.REORDER_MAPS.values() for index, _ in m)
+    assert len(dataflow.REORDER_MAPS) != 0
@@ -0,0 +1,66 @@
+import contextlib
+import io
+import itertools
+import numpy as np
+import pytest
+from types import SimpleNamespace
+
+from deepsocflow.py.hardware import Hardware
+from deepsocflow.py.dataflow import *
+from deepsocflow.py.dse import *
+
+'''
+Design space exploration (dse.py): the Pareto front against brute force, and the grid against the scalar predictors
+'''
+
+rng = np.random.default_rng(0)
+
+PARAMS = dict(bits_input=4, bits_weights=4, bits_sum=24, bits_bias=16, max_image_size=(32,32), max_channels_in=512,
+              ram_edges_depth=2048, max_kernel_size=7, max_batch_size=8)
+
+LAYERS = [  # (XH, XW, CI, CO, K)
+    (16, 16, 3, 32, 3),
+    (16, 16, 32, 64, 3),
+    (16, 16, 64, 300, 1),
+    (16, 16, 300, 16, 5),
+]
+
+
+def pareto_brute(F):
+    return np.array([not any(np.all(G <= f) and np.any(G < f) for G in F) for f in F])
+
+
+@pytest.mark.parametrize('N, M, high', [(200, 2, 10), (300, 3, 5), (50, 4, 1000), (1, 2, 3)])
+def test_pareto_front(N, M, high):
+    F = rng.integers(0, high, (N, M))
+    assert np.array_equal(pareto_front(F), pareto_brute(F))
+
+
+def test_explore_matches_scalar():
+    grid = dict(processing_elements=[(8,24), (16,32)], ram_weights_depth=[256, 512], frequency_mhz=[250], axi_width=[32, 128], batch_size=[1, 4])
+    layers = [LayerShape('conv', K, K, CI, CO, XH, XW) for XH, XW, CI, CO, K in LAYERS]
+    d = explore(layers, Hardware(**PARAMS), **grid)
+
+    for i, (pe, depth, freq, axi, XN) in enumerate(itertools.product(*grid.values())):
+        hw = Hardware(processing_elements=pe, ram_weights_depth=depth, frequency_mhz=freq, axi_width=axi, **PARAMS)
+        with contextlib.redirect_stdout(io.StringIO()):
+            rs = [create_headers(hw, get_runtime_params(hw, (K,K,CI,CO), (XN,XH,XW,CI), (XN,XH,XW,CO),
+                                                        SimpleNamespace(type='conv', strides=(1,1), padding='same', kernel_size=(K,K)), None, False))
+                  for XH, XW, CI, CO, K in LAYERS]
+        clocks = latency = 0
+        for ib, r in enumerate(rs):
+            clocks += predict_bundle_performance(hw, r)[0]
+            latency += predict_bundle_traffic(hw, r, next_r=rs[ib+1] if ib+1 < len(rs) else None, is_last=ib == len(rs)-1)[1].latency_clocks
+        assert d['valid'][i]
+        assert (d['clocks'][i], d['latency_clocks'][i]) == (clocks, latency), (pe, depth, axi, XN)
+        assert d['frames_per_sec'][i] == pytest.approx(XN / (latency / (freq * 1e6)))
+
+
+def test_axi_width_matters():
+    '''A narrow AXI port makes transfers the bottleneck: no longer a duplicate point of the front'''
+    layers = [LayerShape('conv', 1, 1, 256, 256, 32, 32), LayerShape('conv', 1, 1, 256, 64, 32, 32)]
+    d = explore(layers, Hardware(**PARAMS), [(8,24)], [512], [250], [16, 64, 256], [1],
+                objectives=(('frames_per_sec', 'max'), ('AXI_WIDTH', 'min')))
+    assert (d['latency_clocks'] >= d['clocks']).all() and d['memory_clocks'][0] > d['clocks'][0]
+    assert d['frames_per_sec'][0] < d['frames_per_sec'][1] <= d['frames_per_sec'][2]
+    assert d['memory_bound_layers'][0] > 0 and d['pareto'][:2].all()
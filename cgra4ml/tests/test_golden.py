@@ -0,0 +1,80 @@
+import itertools
+import numpy as np
+import pytest
+
+from deepsocflow.py.golden import *
+
+'''
+Integer golden model (golden.py) against slow references: the firmware-order pooling loops, a direct conv & int64 matmul
+'''
+
+rng = np.random.default_rng(0)
+
+
+def conv2d_naive(x, w, strides=(1,1)):
+    '''Direct int64 conv2d with padding='same' as in TF: pad//2 before, the rest after'''
+    XN, XH, XW, CI = x.shape
+    KH, KW, _, CO = w.shape
+    SH, SW = strides
+    YH, YW = -(-XH//SH), -(-XW//SW)
+    ph, pw = max((YH-1)*SH+KH-XH, 0), max((YW-1)*SW+KW-XW, 0)
+    xp = np.pad(x.astype(np.int64), ((0,0), (ph//2, ph-ph//2), (pw//2, pw-pw//2), (0,0)))
+    y = np.zeros((XN, YH, YW, CO), np.int64)
+    for kh, kw in itertools.product(range(KH), range(KW)):
+        y += xp[:, kh:kh+SH*YH:SH, kw:kw+SW*YW:SW] @ w[kh, kw].astype(np.int64)
+    return y
+
+
+@pytest.mark.parametrize('type', ['max', 'avg'])
+@pytest.mark.parametrize('padding', ['same', 'valid'])
+@pytest.mark.parametrize('pool_size, strides', [((2,2),(2,2)), ((3,3),(2,2)), ((3,3),(1,1)), ((2,3),(1,2)), ((3,1),(3,1)), ((1,1),(1,1))])
+def test_pool_int(type, padding, pool_size, strides):
+    for shape in [(1,7,9,3), (2,8,8,4), (1,5,4,2)]:
+        x = rng.integers(-128, 128, shape)
+        assert np.array_equal(pool_int(x, type, pool_size, strides, padding), pool_int_reference(x, type, pool_size, strides, padding)), \
+            f"{shape=}"
+
+
+@pytest.mark.parametrize('k, strides', [((1,1),(1,1)), ((3,3),(1,1)), ((3,3),(2,2)), ((5,3),(1,2)), ((7,7),(2,2)), ((2,2),(1,1))])
+def test_conv2d_int(k, strides):
+    x = rng.integers(-8, 8, (2, 11, 9, 5))
+    w = rng.integers(-8, 8, (*k, 5, 6))
+    assert np.array_equal(conv2d_int(x, w, strides), conv2d_naive(x, w, strides))
+
+
+def test_conv2d_int_passes():
+    '''Partial sums of CM_0, CM, CM... channel slices sum to the conv, in small im2col blocks too'''
+    x = rng.integers(-8, 8, (1, 10, 6, 11))
+    w = rng.integers(-8, 8, (3, 3, 11, 4))
+    yp = conv2d_int(x, w, ci_splits=[3, 4, 4], block_elems=100)
+    assert yp.shape == (3, 1, 10, 6, 4)
+    assert np.array_equal(yp[1], conv2d_naive(x[..., 3:7], w[:, :, 3:7]))
+    assert np.array_equal(yp.sum(axis=0), conv2d_naive(x, w))
+
+
+def test_conv2d_int_exact_beyond_float64():
+    '''Large words take the int64 GEMM: exact where float64 would round'''
+    x = rng.integers(-2**30, 2**30, (1, 4, 4, 3))
+    w = rng.integers(-2**30, 2**30, (3, 3, 3, 2))
+    assert np.array_equal(conv2d_int(x, w), conv2d_naive(x, w))
+
+
+@pytest.mark.parametrize('bits', [4, 8, 31])
+def test_matmul_int(bits):
+    x = rng.integers(-2**(bits-1), 2**(bits-1), (5, 40))
+    w = rng.integers(-2**(bits-1), 2**(bits-1), (40, 7))
+    assert np.array_equal(matmul_int(x, w), x.astype(np.int64) @ w.astype(np.int64))
+    assert np.array_equal(matmul_int(x.astype(np.int32), w.astype(np.int32)), x.astype(np.int64) @ w.astype(np.int64))
+
+
+def test_abs_max_narrow():
+    assert matmul_int(np.array([[-128]], np.int8), np.array([[-128]], np.int8))[0,0] == 2**14
+
+
+@pytest.mark.parametrize('strides', [(1,1), (2,2)])
+def test_conv2d_int_tf(strides):
+    tf = pytest.importorskip('tensorflow')
+    x = rng.integers(-8, 8, (2, 9, 7, 4))
+    w = rng.integers(-8, 8, (3, 3, 4, 5))
+    y_tf = tf.nn.conv2d(x.astype(np.float32), w.astype(np.float32), strides=strides, padding='SAME').numpy()
+    assert np.array_equal(conv2d_int(x, w, strides), y_tf.astype(np.int64))
@@ -0,0 +1,30 @@
+import ast
+import sys
+import pytest
+
+import deepsocflow
+
+'''
+Package imports (deepsocflow/__init__.py): the Keras modules are only loaded for their own names
+'''
+
+
+def test_unknown_names():
+    keras_loaded = [m for m in deepsocflow._KERAS_MODULES if m in sys.modules]
+    assert not hasattr(deepsocflow, 'nonexistent')
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        deepsocflow.foo
+    assert [m for m in deepsocflow._KERAS_MODULES if m in sys.modules] == keras_loaded
+    assert deepsocflow.Hardware is deepsocflow.py.hardware.Hardware
+
+
+def test_keras_exports():
+    '''The map holds the public names each Keras module defines, but those the NumPy modules export already'''
+    eager = {k for m, mod in list(sys.modules.items()) if m.startswith('deepsocflow.py.') and m not in deepsocflow._KERAS_MODULES
+             for k in vars(mod)}
+    for module in deepsocflow._KERAS_MODULES:
+        tree = ast.parse(open(f"{deepsocflow.__path__[0]}/py/{module.split('.')[-1]}.py").read())
+        names = [n.name for n in tree.body if isinstance(n, (ast.FunctionDef, ast.ClassDef))]
+        names += [t.id for n in tree.body if isinstance(n, ast.Assign) for t in n.targets if isinstance(t, ast.Name)]
+        names = {k for k in names if not k.startswith('_') and k not in eager}
+        assert names == {k for k, m in deepsocflow._KERAS_EXPORTS.items() if m == module}, module
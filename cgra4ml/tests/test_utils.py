@@ -0,0 +1,142 @@
+import threading
+import numpy as np
+import pytest
+
+from deepsocflow.py.utils import *
+
+'''
+Per graph state of the layers (XGraph, GraphState) & the verification samples
+'''
+
+rng = np.random.default_rng(0)
+
+
+class Tracked:
+    '''Stands for a Keras layer: tracks the attributes set on it'''
+    def __setattr__(self, name, value):
+        self.__dict__.setdefault('tracked', []).append(name)
+        object.__setattr__(self, name, value)
+
+
+class Node(GraphState, Tracked):
+    GRAPH_STATE = ('ib', 'next_ibs', 'prev_ib', 'next_add_ibs', 'out')
+
+    def __init__(self, name):
+        self.name = name
+
+    def graph_defaults(self):
+        return {'out': None, 'next_ibs': []}
+
+
+def test_state_per_graph():
+    a, b = Node('a'), Node('b')
+    g1, g2 = XGraph(), XGraph()
+    with g1:
+        g1.add(a); g1.add(b)
+        a.next_ibs += [b.ib]
+        a.out = 1
+    with g2:
+        g2.add(b); g2.add(a)
+        a.out = 2
+        assert (a.ib, b.ib, a.next_ibs, b.next_ibs) == (1, 0, [], [])
+    with g1:
+        assert (a.ib, b.ib, a.next_ibs, a.out) == (0, 1, [1], 1)
+    assert a.out == 1 and a.tracked == ['name']  # outside: the last graph used. State is not set on the layer
+    assert Node('c').out is None and Node('c').next_ibs == []
+    with pytest.raises(AttributeError):
+        Node('d').missing
+
+
+def test_graph_copy():
+    '''Exports run in copies of the golden graph: what they set stays in their copy'''
+    a, b = Node('a'), Node('b')
+    with XGraph() as golden:
+        golden.add(a); golden.add(b)
+        a.next_ibs += [b.ib]
+        a.out = 'golden'
+    copies = [golden.copy() for _ in range(2)]
+    for i, graph in enumerate(copies):
+        with graph:
+            assert (a.ib, b.ib, a.next_ibs, a.out) == (0, 1, [1], 'golden') and graph.bundles == [a, b]
+            a.out = b.out = i
+    with golden:
+        assert (a.out, b.out) == ('golden', None)
+    for i, graph in enumerate(copies):
+        with graph:
+            assert (a.out, b.out) == (i, i)
+
+
+def test_state_threads():
+    nodes = [Node(i) for i in range(4)]
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def run(t):
+        with XGraph() as graph:
+            for n in nodes[t % 2:] + nodes[:t % 2]:
+                graph.add(n)
+            barrier.wait()
+            for n in nodes:
+                n.out = (t, n.name)
+            barrier.wait()
+            if [n.out for n in nodes] != [(t, n.name) for n in nodes] or [n.ib for n in nodes[t % 2:]] != list(range(4 - t % 2)):
+                errors.append(t)
+
+    threads = [threading.Thread(target=run, args=(t,)) for t in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert errors == []
+
+
+def test_verify_samples():
+    a, b = np.arange(5000).reshape(50, 100), np.arange(5000).reshape(50, 100) + 1
+    try:
+        set_verify('sampled', samples=10)
+        sa, sb = verify_samples(a, b)
+        assert sa.shape == (10,) and np.array_equal(sa + 1, sb)
+        set_verify('off')
+        assert verify_samples(a, b) is None and verify_settings()['samples'] == 10
+        set_verify('full')
+        assert verify_samples(a, b)[0].shape == (50, 100)
+        snapshot = {'level': 'sampled', 'samples': 7, 'seed': 0}  # one check reads one snapshot, whatever set_verify does since
+        assert verify_index((50, 100), verify=snapshot).shape == (7,) and verify_index((50, 100)) is None
+    finally:
+        set_verify('full', samples=1024)
+
+
+class Untouched:
+    shape = (4, 1000)
+    def fvalues(self, index=None):
+        raise AssertionError("converted")
+
+
+def test_check_close():
+    ints = rng.integers(-2**20, 2**20, (4, 1000))
+    out = XTensor(ints, bits=24, frac=3, from_int=True)
+    ref = XTensor(ints << 2, bits=26, frac=5, from_int=True)
+    assert out.exact and np.array_equal(out.fvalues(np.array([5, 7])), ints.reshape(-1)[[5, 7]] / 8)
+    try:
+        for level in ['full', 'sampled']:
+            set_verify(level, samples=16)
+            check_close(out, ref, "same")
+            with pytest.raises(AssertionError, match="does not match"):
+                check_close(out, XTensor(ints + 1, bits=24, frac=3, from_int=True), "off by one")
+        seen = []
+        ref.fvalues = lambda index=None: seen.append(index) or XTensor.fvalues(ref, index)
+        check_close(out, ref, "sampled")
+        assert seen[0].shape == (16,)
+        set_verify('off')
+        check_close(Untouched(), Untouched(), "off")
+    finally:
+        set_verify('full', samples=1024)
+
+
+def test_xtensor_ftensor_numpy():
+    '''The numpy backend needs no TF: ftensor of exact tensors & the softmax output are NumPy float32'''
+    ints = rng.integers(-128, 128, (2, 10))
+    x = XTensor(ints, bits=8, frac=3, from_int=True)
+    assert isinstance(x.ftensor, np.ndarray) and x.ftensor.dtype == np.float32 and np.array_equal(x.ftensor, ints / 8)
+    x.ftensor = np.full((2, 10), 0.1, np.float32)
+    assert not x.exact and np.array_equal(x.fvalues(np.array([3])), np.float32([0.1]))